@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Measure how fast the ORCA generator follows edits in the input dialog.
+
+While the user edits the dialog, Avogadro asks for a new preview after
+every change. This script simulates such a session in a long-running
+process, as in ``--serve`` mode: starting from the default options, one
+option after the other is toggled and the input is generated again for a
+large molecule. The session is run twice, once with the cached sections
+of the ORCA input and once with the caches emptied before every request,
+and the time per request of both is reported. Run it from the repository
+root::
+
+    python scripts/benchmark_dialog.py [-n 100] [--atoms 20000]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tomllib
+
+from benchmark_startup import ROOT, default_options
+
+# Measure the sections, not the memo of whole inputs
+os.environ["AVOGADRO_GENERATORS_MEMO_SIZE"] = "0"
+sys.path.insert(0, str(ROOT / "src"))
+
+from avogadro_generators import run_generator  # noqa: E402
+from avogadro_generators.orca import clear_section_caches  # noqa: E402
+
+OPTIONS = ROOT / "src" / "avogadro_generators" / "orca" / "options.toml"
+
+# Elements of the molecule, repeated until it has the requested size
+ELEMENTS = [6, 6, 7, 8, 1, 1, 1, 1, 16, 26]
+
+
+def molecule(atoms: int) -> dict:
+    """A molecule with ``atoms`` atoms on a grid."""
+    numbers = [ELEMENTS[i % len(ELEMENTS)] for i in range(atoms)]
+    coords = []
+    side = round(atoms ** (1 / 3)) + 1
+    for i in range(atoms):
+        coords += [1.5 * (i % side), 1.5 * (i // side % side), 1.5 * (i // side**2)]
+    return {"atoms": {"elements": {"number": numbers}, "coords": {"3d": coords}}}
+
+
+def toggles(n: int, seed: int = 0) -> list[tuple[str, object]]:
+    """A sequence of ``n`` option changes, as made in the dialog."""
+    with open(OPTIONS, "rb") as f:
+        options = tomllib.load(f)
+    choices = {
+        name: option
+        for name, option in options.items()
+        if isinstance(option, dict)
+        and option.get("type") in ("boolean", "stringList")
+        # Blocks, the basic tab and the basis overrides, but not the AUX
+        # bases, which do not fit every main basis
+        and name.split("_")[0] in ("SCF", "Basis", "ElProp", "basic")
+        and not name.startswith("Basis_AUX")
+    }
+    rng = random.Random(seed)
+    state = default_options(OPTIONS)
+    changes = []
+    for _ in range(n):
+        name = rng.choice(sorted(choices))
+        option = choices[name]
+        if option["type"] == "boolean":
+            value = not state[name]
+        else:
+            value = rng.choice(option["values"])
+        state[name] = value
+        changes.append((name, value))
+    return changes
+
+
+def session(cjson: dict, changes: list, cold: bool) -> list[float]:
+    """Time of each request of a session, in milliseconds."""
+    options = default_options(OPTIONS)
+    times = []
+    for name, value in changes:
+        options[name] = value
+        if cold:
+            clear_section_caches()
+        start = time.perf_counter()
+        run_generator("orca", {"options": dict(options), "cjson": cjson})
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--toggles", type=int, default=100)
+    parser.add_argument("--atoms", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    cjson = molecule(args.atoms)
+    changes = toggles(args.toggles, args.seed)
+    # Warm up the imports and the tables
+    session(cjson, changes[:1], cold=True)
+
+    print(f"{args.toggles} toggles on {args.atoms} atoms, per request:")
+    for label, cold in (("cached sections", False), ("no section caches", True)):
+        times = session(cjson, changes, cold)
+        print(
+            f"{label:<18} median {statistics.median(times):7.3f} ms, "
+            f"mean {statistics.fmean(times):7.3f} ms, total {sum(times):8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Measure the start-up cost of every input generator.
+
+Avogadro starts a new process for every input it previews, so the time
+spent importing a generator is paid on every change in the dialog. For
+each generator this script reports
+
+* the import time of the generator, as reported by ``python -X importtime``
+  (summed over the top-level imports, so it includes the package itself),
+* the wall time of a complete one-shot run with the default options, from
+  starting the interpreter to its exit,
+
+both as the median of several fresh processes, and compares them with a
+budget. Run it from the repository root::
+
+    python scripts/benchmark_startup.py [-n 7] [generator ...]
+
+The exit status is 1 if any generator is over budget.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tomllib
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Budgets in milliseconds, (import time, wall time)
+DEFAULT_BUDGET = (40.0, 80.0)
+BUDGETS = {
+    "orca": (60.0, 100.0),
+}
+
+# A small molecule, so that the run is dominated by start-up
+WATER = {
+    "atoms": {
+        "elements": {"number": [8, 1, 1]},
+        "coords": {"3d": [0.0, 0.0, 0.0, 0.96, 0.0, 0.0, -0.24, 0.93, 0.0]},
+    }
+}
+
+
+def default_options(path: Path) -> dict:
+    """Default values of the user options defined in ``path``."""
+    if path.suffix == ".toml":
+        with open(path, "rb") as f:
+            options = tomllib.load(f)
+    else:
+        with open(path) as f:
+            options = json.load(f)
+        options = options.get("userOptions", options)
+
+    defaults = {}
+    for name, option in options.items():
+        if not isinstance(option, dict) or "type" not in option:
+            continue
+        default = option.get("default")
+        if option["type"] == "stringList" and isinstance(default, int):
+            default = option["values"][default]
+        elif default is None:
+            default = 0 if option["type"] in ("integer", "float") else ""
+        defaults[name] = default
+    return defaults
+
+
+def generators() -> dict[str, Path]:
+    """Generators declared in ``pyproject.toml`` with their options file."""
+    with open(ROOT / "pyproject.toml", "rb") as f:
+        pyproject = tomllib.load(f)
+    return {
+        generator["identifier"]: ROOT / generator["user-options"]
+        for generator in pyproject["tool"]["avogadro"]["input-generators"]
+    }
+
+
+def _environment() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(ROOT / "src")] + env.get("PYTHONPATH", "").split(os.pathsep)
+    ).rstrip(os.pathsep)
+    # The per-user socket would turn the run into a service request
+    env.pop("AVOGADRO_GENERATORS_SOCKET", None)
+    # Installed packages are byte-compiled, so measure with a bytecode cache
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def import_time(name: str) -> float:
+    """Import time of a generator in a fresh process, in milliseconds."""
+    code = f"from avogadro_generators import get_generator; get_generator({name!r})"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=_environment(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        # import time: <self us> | <cumulative us> | <indentation><module>
+        _, cumulative, module = line.split("|")
+        # Nested imports are included in the cumulative time of their parent
+        if cumulative.strip().isdigit() and not module.startswith("  "):
+            total += int(cumulative)
+    return total / 1000
+
+
+def _run_time(command: list[str], stdin: bytes = b"") -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        command, env=_environment(), input=stdin, capture_output=True, check=True
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def wall_time(name: str, request: bytes) -> float:
+    """Wall time of a one-shot run in a fresh process, in milliseconds."""
+    code = "from avogadro_generators import main; main()"
+    return _run_time([sys.executable, "-c", code, name], request)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("generator", nargs="*", help="Generators (default: all)")
+    parser.add_argument(
+        "-n", "--repeat", type=int, default=7, help="Processes per measurement"
+    )
+    args = parser.parse_args()
+
+    available = generators()
+    names = args.generator or list(available)
+
+    # Baseline for an interpreter that does nothing
+    baseline = statistics.median(
+        _run_time([sys.executable, "-c", "pass"]) for _ in range(args.repeat)
+    )
+    print(f"Interpreter start-up: {baseline:.1f} ms\n")
+    print(
+        f"{'generator':<12}{'import ms':>12}{'budget':>8}{'wall ms':>12}{'budget':>8}"
+    )
+
+    over_budget = False
+    for name in names:
+        options = default_options(available[name])
+        request = json.dumps({"options": options, "cjson": WATER}).encode()
+
+        imports = statistics.median(import_time(name) for _ in range(args.repeat))
+        wall = statistics.median(wall_time(name, request) for _ in range(args.repeat))
+        import_budget, wall_budget = BUDGETS.get(name, DEFAULT_BUDGET)
+
+        failed = imports > import_budget or wall > wall_budget
+        over_budget |= failed
+        print(
+            f"{name:<12}{imports:>12.1f}{import_budget:>8.0f}"
+            f"{wall:>12.1f}{wall_budget:>8.0f}{'  OVER BUDGET' if failed else ''}"
+        )
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""This script writes the ORCA generator's ``tables.py`` file, and the
+``solvent_table.py`` file that ORCA shares with the other generators.
+
+The basis sets, functionals, solvents and LibXC functionals are defined
+in ``src/avogadro_generators/orca/definitions``. Defining them directly
+as enums means running the enum machinery for well over a thousand
+members, and expanding the element ranges of every basis set, each time
+the generator starts. Instead, this script compiles the definitions into
+plain tuples, dicts and integer bitmasks, which Python loads straight
+from the bytecode cache. The enums in the ORCA package are then built
+from these tables, and only when they are first used.
+
+Run this script whenever you change one of the definitions::
+
+    python scripts/write_orca_tables.py
+
+Notes
+-----
+Element sets are stored as integer bitmasks, where bit ``n`` is set if
+the element with atomic number ``n`` is included.
+
+Members are written in the order they are defined in, including
+aliases, so that the enums built from the tables are identical to
+enums built from the definitions themselves.
+"""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+# Importing the ORCA package builds enums from the tables this script
+# writes, so its definitions are loaded without running its __init__.
+_spec = importlib.util.find_spec("avogadro_generators.orca")
+_package = types.ModuleType(_spec.name)
+_package.__path__ = _spec.submodule_search_locations
+_previous = sys.modules.get(_spec.name)
+sys.modules[_spec.name] = _package
+
+from avogadro_generators.orca.definitions import (  # noqa: E402
+    basis_sets,
+    dft,
+    implicit_solvation,
+    libxc,
+)
+from avogadro_generators.utilities import Element  # noqa: E402
+
+# The real package is imported as usual after this, e.g. when pytest
+# collects the doctests of every module
+if _previous is None:
+    del sys.modules[_spec.name]
+else:
+    sys.modules[_spec.name] = _previous
+
+BASIS_SET_CLASSES = (
+    basis_sets.PopleBasisSet,
+    basis_sets.def2BasisSet,
+    basis_sets.JensenBasisSet,
+    basis_sets.ccBasisSet,
+    basis_sets.RelativisticBasisSet,
+)
+AUX_BASIS_SET_CLASSES = (
+    basis_sets.AuxJBasisSet,
+    basis_sets.AuxJKBasisSet,
+    basis_sets.AuxCBasisSet,
+)
+SOLVENT_CLASSES = (
+    implicit_solvation.Solvent,
+    implicit_solvation.XTBSolvent,
+)
+LIBXC_CLASSES = (
+    libxc.SimpleLibXC,
+    libxc.ExchangeLibXC,
+    libxc.CorrelationLibXC,
+    libxc.ExCorrLibXC,
+)
+
+
+def members(cls: type) -> list[tuple[str, object]]:
+    """Members of a definition class, in the order they are defined."""
+    return [
+        (name, value) for name, value in vars(cls).items() if not name.startswith("_")
+    ]
+
+
+def element_mask(element_ranges: tuple[str] | None) -> int:
+    """Convert element ranges such as ``("H-Ar", "Kr")`` to a bitmask."""
+    mask = 0
+    for elem_range in element_ranges or ():
+        if "-" not in elem_range:
+            mask |= 1 << Element[elem_range].number
+        else:
+            start, end = elem_range.split("-")
+            for num in range(Element[start].number, Element[end].number + 1):
+                mask |= 1 << num
+    return mask
+
+
+def basis_set_rows(cls: type) -> list[tuple]:
+    rows = []
+    for name, (basis_name, element_ranges, *ecp) in members(cls):
+        ecp_name, ecp_ranges = ecp + [None] * (2 - len(ecp))
+        rows.append((name, basis_name, element_ranges, ecp_name, ecp_ranges))
+    return rows
+
+
+def aux_basis_set_rows(cls: type) -> list[tuple]:
+    return [
+        (name, basis_name, element_ranges, parent.__name__)
+        for name, (basis_name, element_ranges, parent) in members(cls)
+    ]
+
+
+def flag_value(flag) -> int:
+    """Value of a ``Flag`` member, also accepting a plain ``0``."""
+    return flag if isinstance(flag, int) else flag.value
+
+
+class Bitmask(int):
+    """Integer written in hexadecimal, to keep element masks readable."""
+
+    def __repr__(self) -> str:
+        return hex(self)
+
+
+def literal(value, indent: int = 0) -> str:
+    """Python literal for ``value``, with one row of a table per line.
+
+    Lists are written as tuples.
+    """
+    pad = "    " * (indent + 1)
+    if isinstance(value, dict):
+        items = "".join(
+            f"{pad}{key!r}: {literal(item, indent + 1)},\n"
+            for key, item in value.items()
+        )
+        return "{\n" + items + "    " * indent + "}"
+    if isinstance(value, (list, tuple)):
+        if value and isinstance(value[0], (list, tuple, dict)):
+            items = "".join(f"{pad}{literal(item, indent + 1)},\n" for item in value)
+            return "(\n" + items + "    " * indent + ")"
+        return repr(tuple(value))
+    return repr(value)
+
+
+def format_table(name: str, comment: str, value) -> str:
+    return f"# {comment}\n{name} = {literal(value)}\n"
+
+
+def main():
+    docs = {}
+    for cls in (
+        BASIS_SET_CLASSES
+        + AUX_BASIS_SET_CLASSES
+        + (dft.Functionals,)
+        + SOLVENT_CLASSES
+        + LIBXC_CLASSES
+    ):
+        docs[cls.__name__] = cls.__doc__
+
+    basis = {cls.__name__: basis_set_rows(cls) for cls in BASIS_SET_CLASSES}
+    aux_basis = {cls.__name__: aux_basis_set_rows(cls) for cls in AUX_BASIS_SET_CLASSES}
+
+    element_masks = {}
+    ecp_element_masks = {}
+    for rows in basis.values():
+        for _, basis_name, element_ranges, ecp_name, ecp_ranges in rows:
+            element_masks.setdefault(basis_name, Bitmask(element_mask(element_ranges)))
+            if ecp_name is not None:
+                ecp_element_masks.setdefault(
+                    basis_name, Bitmask(element_mask(ecp_ranges))
+                )
+    for rows in aux_basis.values():
+        for _, basis_name, element_ranges, _ in rows:
+            element_masks.setdefault(basis_name, Bitmask(element_mask(element_ranges)))
+
+    functionals = [
+        (name, func_name, flag_value(disp))
+        for name, (func_name, disp) in members(dft.Functionals)
+    ]
+
+    solvents = {
+        cls.__name__: [
+            (name, aliases, flag_value(models))
+            for name, (aliases, models) in members(cls)
+        ]
+        for cls in SOLVENT_CLASSES
+    }
+
+    libxc_members = {cls.__name__: members(cls) for cls in LIBXC_CLASSES}
+    # First member for each lowercase value, as LibXC is case-insensitive
+    libxc_lowercase = {}
+    for cls_name, rows in libxc_members.items():
+        lowercase = libxc_lowercase[cls_name] = {}
+        for name, value in rows:
+            lowercase.setdefault(value.lower(), name)
+
+    output = (
+        "# This file was automatically generated by scripts/write_orca_tables.py,\n"
+        "# do NOT modify manually!\n"
+        '"""Compiled tables for the ORCA enums, see ``orca/definitions``."""\n'
+        "\n"
+        "# fmt: off\n"
+    )
+    output += "\n".join(
+        (
+            format_table("DOCS", "Docstrings of the enums", docs),
+            format_table(
+                "BASIS_SETS",
+                "Member name, basis name, element ranges, ECP, ECP element ranges",
+                basis,
+            ),
+            format_table(
+                "AUX_BASIS_SETS",
+                "Member name, basis name, element ranges, primary basis family",
+                aux_basis,
+            ),
+            format_table(
+                "ELEMENT_MASKS",
+                "Basis name to the bitmask of the elements it is defined for",
+                element_masks,
+            ),
+            format_table(
+                "ECP_ELEMENT_MASKS",
+                "Basis name to the bitmask of the elements its ECP is used for",
+                ecp_element_masks,
+            ),
+            format_table(
+                "FUNCTIONALS",
+                "Member name, keyword, bitmask of the available Disp corrections",
+                functionals,
+            ),
+            format_table("LIBXC", "Member name, value", libxc_members),
+            format_table(
+                "LIBXC_LOWERCASE",
+                "Lowercase value to member name",
+                libxc_lowercase,
+            ),
+        )
+    )
+    output += "# fmt: on\n"
+
+    package = Path(__file__).parent.parent / "src/avogadro_generators"
+    with open(package / "orca/tables.py", "w", encoding="utf-8") as f:
+        f.write(output)
+
+    # The solvents are also read by MOPAC, which should not import ORCA
+    output = (
+        "# This file was automatically generated by scripts/write_orca_tables.py,\n"
+        "# do NOT modify manually!\n"
+        '"""Solvents of ``orca/definitions``, shared by the generators."""\n'
+        "\n"
+        "# fmt: off\n"
+    )
+    output += format_table(
+        "SOLVENTS",
+        "Member name, aliases, bitmask of the available SolvationModels",
+        solvents,
+    )
+    output += "# fmt: on\n"
+
+    with open(package / "solvent_table.py", "w", encoding="utf-8") as f:
+        f.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,49 +8,158 @@
 """Entry point for all the input generators."""
 
 import argparse
+import importlib
 import json
+import os
 import sys
 
+# Names re-exported from the submodules, which are only imported once one
+# of them is used, so that one-shot runs load no more than they need
+EXPORTS = {
+    "GeneratedJob": ".api",
+    "generate": ".api",
+    "get_generator": ".api",
+    "run_generator": ".api",
+    "available_generators": ".registry",
+}
 
-def main():
+# Subcommands and the modules implementing them
+SUBCOMMANDS = {
+    "batch": ".batch",
+    "list": ".registry",
+    "service": ".service",
+    "stream": ".stream",
+}
+
+
+def __getattr__(name: str):
+    if name in EXPORTS:
+        module = importlib.import_module(EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main(argv: list[str] | None = None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Subcommands take over the whole command line
+    if argv and argv[0] in SUBCOMMANDS:
+        module = importlib.import_module(SUBCOMMANDS[argv[0]], __name__)
+        return module.main(argv[1:])
+
+    from .profiling import add_arguments as add_profile_arguments
+    from .profiling import expand_flag
+
+    argv = expand_flag(argv)
     parser = argparse.ArgumentParser()
     parser.add_argument('--debug', action='store_true')
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report the time spent in each stage of the generator",
+    )
     parser.add_argument("--lang", nargs="?", default="en")
-    parser.add_argument("generator", action="store")
-    args = parser.parse_args()
-
-    match args.generator:
-        # Do imports lazily so only the relevant file is imported when called
-        case "dalton":
-            from .dalton.dalton import generateInput
-        case "gamessuk":
-            from .gamessuk.gamessuk import generateInput
-        case "gaussian":
-            from .gaussian.gaussian import generateInput
-        case "molpro":
-            from .molpro.molpro import generateInput
-        case "mopac":
-            from .mopac.mopac import generateInput
-        case "nwchem":
-            from .nwchem.nwchem import generateInput
-        case "orca":
-            from .orca import generateInput
-        case "pyscf":
-            from .pyscf.pyscf import generateInput
-        case "psi4":
-            from .psi4.psi4 import generateInput
-        case "qchem":
-            from .qchem.qchem import generateInput
-        case "terachem":
-            from .terachem.terachem import generateInput
-    
-    # Load the JSON passed by Avogadro
-    input = json.load(sys.stdin)
-    output = generateInput(input, args.debug)
-
-    if args.debug:
-        output["files"].append(
-            {"filename": "debug_info", "contents": input}
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep running and answer one JSON request per line on stdin",
+    )
+    parser.add_argument(
+        "--protocol",
+        choices=("json", "binary"),
+        default="json",
+        help="Format of requests and responses on stdin and stdout",
+    )
+    parser.add_argument(
+        "--socket",
+        default=os.environ.get("AVOGADRO_GENERATORS_SOCKET"),
+        help="Generate through the service on this socket, if it is running",
+    )
+    add_profile_arguments(parser)
+    parser.add_argument("generator", action="store", nargs="?")
+    args = parser.parse_args(argv)
+
+    profiler = None
+    if args.profile:
+        from .profiling import Profiler, default_output
+
+        profiler = Profiler(args.profile)
+        profile_path = args.profile_output or default_output(
+            args.profile, os.getcwd(), args.generator or "avogadro-generators"
+        )
+
+    binary = args.protocol == "binary"
+    if args.serve:
+        if binary:
+            from .serve import serve_binary
+
+            serve_binary(
+                sys.stdin.buffer,
+                sys.stdout.buffer,
+                args.generator,
+                args.debug,
+                profiler,
+                args.timings,
+            )
+        else:
+            from .serve import serve
+
+            serve(
+                sys.stdin,
+                sys.stdout,
+                args.generator,
+                args.debug,
+                profiler,
+                args.timings,
+            )
+        if profiler is not None:
+            profiler.write(profile_path)
+        return
+
+    if profiler is not None:
+        with profiler.job():
+            _run_once(parser, args)
+        profiler.write(profile_path)
+    else:
+        _run_once(parser, args)
+
+
+def _run_once(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    """Answer the single request on stdin."""
+    binary = args.protocol == "binary"
+
+    if binary:
+        from .protocol import read_request, write_response
+
+        input = read_request(sys.stdin.buffer)
+        if input is None:
+            parser.error("no request on stdin")
+        args.generator = input.get("generator", args.generator)
+
+    if args.generator is None:
+        parser.error("the following arguments are required: generator")
+
+    if not binary:
+        # Load the JSON passed by Avogadro
+        input = json.load(sys.stdin)
+
+    # A profile of the local run is wanted, not of the service client
+    if args.socket and not args.profile:
+        from .service import generate
+
+        output = generate(
+            args.socket, args.generator, input, args.debug, args.timings
         )
+    else:
+        from .api import run_generator
+
+        output = run_generator(args.generator, input, args.debug, args.timings)
+
+    if binary:
+        write_response(sys.stdout.buffer, output)
+    else:
+        from .output import write_json
 
-    print(json.dumps(output))
+        write_json(output, sys.stdout.buffer)
+        sys.stdout.buffer.write(b"\n")
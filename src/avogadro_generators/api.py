@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Python interface to the input generators.
+
+Calling a generator from Python does not need the JSON round trip of the
+command line::
+
+    from avogadro_generators import generate
+
+    job = generate("orca", options, cjson)
+    print(job.files[job.main_file])
+"""
+
+import functools
+import importlib
+import time
+
+from . import timing
+from .output import join_chunks
+from .registry import find_generator
+
+
+class GeneratedJob:
+    """Files and messages produced by a generator for one job.
+
+    Attributes
+    ----------
+    files : dict of str to str
+        Contents of the generated files, keyed by file name, in the order
+        the generator returned them.
+    main_file : str or None
+        Name of the main input file.
+    warnings : list of str
+        Warnings raised while generating the input.
+    highlight_styles : dict of str to list of str
+        Syntax highlighting groups, for the files that declare any.
+    """
+
+    __slots__ = ("files", "main_file", "warnings", "highlight_styles")
+
+    def __init__(
+        self,
+        files: dict[str, str],
+        main_file: str | None = None,
+        warnings: list[str] | None = None,
+        highlight_styles: dict[str, list[str]] | None = None,
+    ):
+        self.files = files
+        self.main_file = main_file
+        self.warnings = warnings or []
+        self.highlight_styles = highlight_styles or {}
+
+    @classmethod
+    def from_output(cls, output: dict) -> "GeneratedJob":
+        """Build a job from the dict returned by ``generateInput``."""
+        files = {}
+        highlight_styles = {}
+        for entry in join_chunks(output)["files"]:
+            if "contents" in entry:
+                files[entry["filename"]] = entry["contents"]
+            if "highlightStyles" in entry:
+                highlight_styles[entry["filename"]] = entry["highlightStyles"]
+
+        return cls(
+            files,
+            output.get("mainFile"),
+            output.get("warnings", []),
+            highlight_styles,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(files={list(self.files)}, "
+            f"main_file={self.main_file!r}, warnings={self.warnings!r})"
+        )
+
+
+@functools.cache
+def get_generator(name: str):
+    """Get the ``generateInput`` function of a generator by name.
+
+    The result is cached, so each generator module is only imported once
+    per process.
+    """
+    # Only the module of the requested generator is imported
+    module, _, attr = find_generator(name).partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+def run_generator(
+    name: str, input_json: dict, debug: bool = False, timings: bool = False
+) -> dict:
+    """Generate the input for a single job, as Avogadro expects it.
+
+    With ``debug``, the request is written to a sidecar file and a summary
+    referring to it is added as the ``debug_info`` file, see :mod:`.debug`.
+    With ``timings``, the time spent in each stage of the generator is
+    added under the ``timings`` key, see :mod:`.timing`.
+    """
+    generateInput = get_generator(name)
+    start = time.perf_counter()
+    if timings:
+        recorder, token = timing.record()
+        try:
+            output = generateInput(input_json, debug)
+        finally:
+            timing.stop(token)
+        output["timings"] = recorder.timings()
+    else:
+        output = generateInput(input_json, debug)
+
+    if debug:
+        from .debug import debug_info
+
+        info = debug_info(input_json, time.perf_counter() - start)
+        output["files"].append({"filename": "debug_info", "contents": info})
+
+    return output
+
+
+def generate(name: str, options: dict, molecule: dict | None = None) -> GeneratedJob:
+    """Generate the input for one job.
+
+    Parameters
+    ----------
+    name : str
+        Generator name, e.g. ``"orca"``.
+    options : dict
+        Values of all of the generator's user options.
+    molecule : dict, optional
+        The molecule in Chemical JSON format.
+    """
+    generateInput = get_generator(name)
+    output = generateInput({"options": options, "cjson": molecule or {}}, False)
+    return GeneratedJob.from_output(output)
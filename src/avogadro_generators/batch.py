@@ -0,0 +1,256 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Generate inputs for a whole directory of cjson files in parallel.
+
+Usage::
+
+    avogadro-generators batch orca --options opts.json --in mols/ --out inputs/ -j 8
+
+Every ``*.cjson`` file in the input directory is combined with the same
+options and handed to the generator. The files returned for ``mols/x.cjson``
+are written to ``inputs/x/``. Progress can be monitored through the
+Prometheus metrics written with ``--metrics``, see :mod:`.metrics`.
+
+With ``--cache``, the generated files are kept in an on-disk cache and
+unchanged jobs of later runs are copied from it, see :mod:`.cache`.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from . import metrics, profiling, timing
+from .api import run_generator
+from .cache import MAX_BYTES, ResultCache
+from .output import is_chunked
+
+# Per-process job settings, set once by the pool initializer
+_generator: str = ""
+_options: dict = {}
+_out_dir: Path = Path()
+_debug: bool = False
+_timings: bool = False
+_cache: ResultCache | None = None
+
+
+def _init_worker(
+    generator: str,
+    options: dict,
+    out_dir: Path,
+    debug: bool,
+    timings: bool = False,
+    profile: str | None = None,
+    profile_prefix: str = "",
+    cache: ResultCache | None = None,
+):
+    global _generator, _options, _out_dir, _debug, _timings, _cache
+    _generator = generator
+    _options = options
+    _out_dir = out_dir
+    _debug = debug
+    _timings = timings
+    _cache = cache
+    if profile:
+        profiling.start_worker(profile, profile_prefix)
+
+
+def write_files(files: list[dict], directory: Path) -> int:
+    """Write the file entries of a generator result into ``directory``.
+
+    Returns the number of bytes written.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for entry in files:
+        if "contents" not in entry:
+            continue
+        contents = entry["contents"]
+        if is_chunked(contents):
+            chunks = contents
+        elif isinstance(contents, str):
+            chunks = (contents,)
+        else:
+            chunks = (json.dumps(contents),)
+        with open(directory / entry["filename"], "w") as f:
+            for chunk in chunks:
+                written += f.write(chunk)
+    return written
+
+
+def run_job(
+    path: Path,
+) -> tuple[str, list[str], str | None, dict | None, int, float, bool]:
+    """Generate and write the input for one cjson file.
+
+    Returns the file name, the warnings, the error message, if the job
+    failed, the stage timings, if they were requested, the number of bytes
+    written, the time taken in seconds and whether the files were copied
+    from the cache.
+    """
+    start = time.perf_counter()
+    try:
+        with profiling.worker_job():
+            with open(path) as f:
+                cjson = json.load(f)
+            input_json = {"options": _options, "cjson": cjson}
+            directory = _out_dir / path.stem
+
+            output = None
+            if _cache is not None:
+                key = _cache.key(_generator, input_json)
+                output = _cache.load(key, directory)
+            cached = output is not None
+            if cached:
+                written = output["written"]
+            else:
+                output = run_generator(_generator, input_json, _debug, _timings)
+                written = write_files(output["files"], directory)
+                if _cache is not None:
+                    _cache.save(key, output, directory)
+    except Exception as err:
+        error = f"{type(err).__name__}: {err}"
+        return path.name, [], error, None, 0, time.perf_counter() - start, False
+
+    return (
+        path.name,
+        output.get("warnings", []),
+        None,
+        output.get("timings"),
+        written,
+        time.perf_counter() - start,
+        cached,
+    )
+
+
+def load_options(path: str) -> dict:
+    """Read generator options from a JSON file.
+
+    Both a bare options dict and the ``{"options": {...}}`` form Avogadro
+    sends are accepted.
+    """
+    with open(path) as f:
+        options = json.load(f)
+    return options.get("options", options)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog="avogadro-generators batch",
+        description="Generate inputs for every cjson file in a directory.",
+    )
+    parser.add_argument("generator")
+    parser.add_argument("--options", required=True, help="JSON file of options")
+    parser.add_argument("--in", dest="in_dir", required=True, type=Path)
+    parser.add_argument("--out", dest="out_dir", required=True, type=Path)
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--debug", action="store_true")
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report the mean time spent in each stage of the generator",
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="DIR",
+        help="Reuse the files of unchanged jobs from an on-disk cache "
+        "(default directory: ~/.cache/avogadro-generators/results)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=MAX_BYTES >> 20,
+        metavar="MIB",
+        help="Byte budget of the cache in MiB (default: %(default)s)",
+    )
+    profiling.add_arguments(parser)
+    metrics.add_arguments(parser)
+    args = parser.parse_args(profiling.expand_flag(argv))
+
+    options = load_options(args.options)
+    paths = sorted(args.in_dir.glob("*.cjson"))
+
+    profile_path = profile_prefix = None
+    if args.profile:
+        args.out_dir.mkdir(parents=True, exist_ok=True)
+        profile_path = args.profile_output or profiling.default_output(
+            args.profile, args.out_dir, "profile"
+        )
+        profile_prefix = profiling.worker_prefix(profile_path)
+
+    cache = None
+    if args.cache is not None:
+        if args.debug or args.timings:
+            print("The cache is not used with --debug or --timings", file=sys.stderr)
+        else:
+            cache = ResultCache(args.cache or None, args.cache_size << 20)
+
+    job_metrics = metrics.Metrics()
+    metrics_writer = contextlib.nullcontext()
+    if args.metrics:
+        metrics_writer = metrics.MetricsWriter(
+            job_metrics, args.metrics, args.metrics_interval
+        )
+
+    n_failed = 0
+    n_warnings = 0
+    n_cached = 0
+    stage_totals = {}
+    start = time.perf_counter()
+    with metrics_writer, ProcessPoolExecutor(
+        max_workers=args.jobs,
+        initializer=_init_worker,
+        initargs=(
+            args.generator,
+            options,
+            args.out_dir,
+            args.debug,
+            args.timings,
+            args.profile,
+            profile_prefix,
+            cache,
+        ),
+    ) as pool:
+        chunksize = max(1, len(paths) // (16 * args.jobs))
+        results = pool.map(run_job, paths, chunksize=chunksize)
+        for name, warnings, error, timings, written, seconds, cached in results:
+            n_warnings += len(warnings)
+            n_cached += cached
+            if error is not None:
+                n_failed += 1
+                print(f"{name}: {error}")
+            if timings is not None:
+                timing.aggregate(stage_totals, timings)
+            job_metrics.record_job(args.generator, seconds, warnings, error is not None)
+            job_metrics.record_bytes(args.generator, written)
+    elapsed = time.perf_counter() - start
+
+    rate = len(paths) / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{len(paths)} jobs in {elapsed:.2f} s ({rate:.1f} jobs/s), "
+        f"{n_failed} failed, {n_warnings} warnings"
+    )
+    if cache is not None:
+        freed = cache.evict()
+        print(
+            f"{n_cached} jobs copied from the cache in {cache.directory}, "
+            f"{freed / (1 << 20):.1f} MiB evicted"
+        )
+    if stage_totals:
+        print(f"Mean stage timings: {timing.format_totals(stage_totals)}")
+    if args.profile:
+        profiling.merge_workers(args.profile, profile_prefix, profile_path)
+
+    return 1 if n_failed else 0
@@ -0,0 +1,215 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""On-disk cache of generated input files.
+
+Batch runs with ``--cache`` keep the files generated for each job in a
+directory named after the SHA-256 of the generator, the version of this
+package, the options and the molecule::
+
+    ~/.cache/avogadro-generators/results/3f/3f2a.../
+        meta.json
+        files/job.inp
+
+A job whose entry exists is not generated again, its files are copied
+from the cache instead. Entries are written to a temporary directory
+first and then renamed into place, so any number of processes may fill
+the same cache and readers only ever see complete entries.
+
+Once the cache grows beyond its byte budget, the least recently used
+entries are removed by :meth:`ResultCache.evict`, which batch mode calls
+when it is done. Results of ``--debug`` and ``--timings`` runs are never
+cached.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from .hashing import request_key
+from .registry import cache_dir
+
+# Default byte budget of the cache
+MAX_BYTES = 1 << 30
+
+# Age in seconds after which a temporary directory is left over from an
+# interrupted writer
+STALE_TMP_AGE = 3600
+
+_META = "meta.json"
+_FILES = "files"
+
+
+def default_directory() -> str:
+    """Directory of the cache when none is given."""
+    return os.path.join(cache_dir(), "results")
+
+
+def package_version() -> str:
+    """Version of this package, part of every key."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("avogadro-generators")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _size(path: str) -> int:
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                size += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return size
+
+
+def _remove(path: str, tmp_dir: str):
+    """Remove an entry, moving it out of sight first."""
+    try:
+        graveyard = tempfile.mkdtemp(dir=tmp_dir)
+        os.rename(path, os.path.join(graveyard, "entry"))
+    except OSError:
+        return
+    shutil.rmtree(graveyard, ignore_errors=True)
+
+
+class ResultCache:
+    """Content-addressed store of the files of generator results."""
+
+    def __init__(self, directory: str | None = None, max_bytes: int = MAX_BYTES):
+        self.directory = directory or default_directory()
+        self.max_bytes = max_bytes
+        self.version = package_version()
+        self._tmp_dir = os.path.join(self.directory, "tmp")
+
+    def key(self, generator: str, input_json: dict) -> str:
+        """Key of the result of a request."""
+        key = hashlib.sha256(self.version.encode() + b"\0")
+        key.update(request_key(generator, input_json).encode())
+        return key.hexdigest()
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def load(self, key: str, directory: Path) -> dict | None:
+        """Copy the cached files of ``key`` into ``directory``.
+
+        Returns the cached result without the file contents, with the
+        number of bytes copied under ``written``, or ``None`` if the
+        entry is missing.
+        """
+        entry = self._entry(key)
+        try:
+            with open(os.path.join(entry, _META)) as f:
+                meta = json.load(f)
+            directory.mkdir(parents=True, exist_ok=True)
+            written = 0
+            for file in meta["files"]:
+                if file.get("cached"):
+                    source = os.path.join(entry, _FILES, file["filename"])
+                    shutil.copyfile(source, directory / file["filename"])
+                    written += os.path.getsize(source)
+            # Mark the entry as recently used
+            os.utime(os.path.join(entry, _META))
+        except (OSError, ValueError, KeyError):
+            # Missing, or removed while it was being read
+            return None
+        meta["written"] = written
+        return meta
+
+    def save(self, key: str, output: dict, directory: Path) -> bool:
+        """Store the result of ``key``, whose files were written to
+        ``directory``.
+
+        Returns whether the entry was stored.
+        """
+        try:
+            os.makedirs(self._tmp_dir, exist_ok=True)
+            tmp_entry = tempfile.mkdtemp(dir=self._tmp_dir)
+        except OSError:
+            return False
+        try:
+            os.mkdir(os.path.join(tmp_entry, _FILES))
+            files = []
+            for file in output["files"]:
+                cached = "contents" in file
+                file = {k: v for k, v in file.items() if k != "contents"}
+                file["cached"] = cached
+                if cached:
+                    shutil.copyfile(
+                        directory / file["filename"],
+                        os.path.join(tmp_entry, _FILES, file["filename"]),
+                    )
+                files.append(file)
+            meta = {k: v for k, v in output.items() if k != "files"}
+            meta["files"] = files
+            with open(os.path.join(tmp_entry, _META), "w") as f:
+                json.dump(meta, f)
+
+            entry = self._entry(key)
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            # Fails if another process stored the same entry first
+            os.rename(tmp_entry, entry)
+        except OSError:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+            return False
+        return True
+
+    def entries(self) -> list[tuple[float, int, str]]:
+        """Last use, size and path of every entry."""
+        entries = []
+        try:
+            shards = os.scandir(self.directory)
+        except OSError:
+            return entries
+        with shards:
+            for shard in shards:
+                if len(shard.name) != 2 or not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    try:
+                        used = os.stat(os.path.join(entry.path, _META)).st_mtime
+                    except OSError:
+                        continue
+                    entries.append((used, _size(entry.path), entry.path))
+        return entries
+
+    def _remove_stale_tmp(self):
+        try:
+            leftovers = os.scandir(self._tmp_dir)
+        except OSError:
+            return
+        cutoff = time.time() - STALE_TMP_AGE
+        with leftovers:
+            for leftover in leftovers:
+                try:
+                    if leftover.stat().st_mtime < cutoff:
+                        shutil.rmtree(leftover.path, ignore_errors=True)
+                except OSError:
+                    pass
+
+    def evict(self) -> int:
+        """Remove the least recently used entries until the cache fits
+        into its byte budget. Returns the number of bytes freed.
+        """
+        self._remove_stale_tmp()
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        freed = 0
+        for _, size, path in entries:
+            if total - freed <= self.max_bytes:
+                break
+            _remove(path, self._tmp_dir)
+            freed += size
+        return freed
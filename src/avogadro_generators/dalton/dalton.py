@@ -7,6 +7,10 @@
 # ******************************************************************************
 """Input generation for the Dalton suite (https://daltonprogram.org/)."""
 
+import itertools
+from collections.abc import Iterator
+
+from avogadro_generators import memo, timing
 
 # element lookups
 symbols = [
@@ -22,7 +26,48 @@ symbols = [
     "Hs", "Mt", "Ds", "Rg", "Cn", "Nh", "Fl", "Mc", "Lv", "Ts", "Og"]
 
 
-def generateInputFile(input_json: dict) -> tuple[str, str, list[str]]:
+def _atom_lines(atoms: list[list[int]], coords3d) -> Iterator[str]:
+    for z in range(len(atoms)):
+        if len(atoms[z]) > 0:
+            yield 'Charge=%d.0 Atoms=%d\n' % (z, len(atoms[z]))
+            for start in atoms[z]:
+                x, y, z_ = coords3d[start:start + 3]
+                yield f'{symbols[z]}{x:15.5f}{y:15.5f}{z_:15.5f}\n'
+
+
+def molecule_file(basis: str, title: str, theory: str, cjson: dict) -> Iterator[str]:
+    """Lines of the .mol file.
+
+    The file holds all of the coordinates, so the atom lines are only
+    formatted while the file is written instead of being built in memory.
+    """
+    # roll up the atoms for each element type
+    atoms = [[] for i in range(118)]
+    coords3d = cjson['atoms']['coords']['3d']
+    numbers = cjson['atoms']['elements']['number']
+    # Checked here, as the lines are only formatted while being written
+    if len(coords3d) != 3 * len(numbers):
+        raise ValueError('Expected three coordinates per atom')
+    for i, z in enumerate(numbers):
+        atoms[z].append(3 * i)  # index into the coordinate array
+    atom_types = sum(1 for indices in atoms if indices)
+
+    header = [
+        # Basis
+        'BASIS\n',
+        '%s\n' % basis,
+        # Title
+        ' %s\n' % title,
+        ' %s Generated with Avogadro 2\n' % theory,
+        # Coordinates
+        'Atomtypes=%d Angstrom\n' % atom_types,
+    ]
+    return itertools.chain(header, _atom_lines(atoms, coords3d), ['\n\n'])
+
+
+@memo.full_molecule
+def generateInputFile(input_json: dict) -> tuple[Iterator[str], str, list[str]]:
+    stages = timing.stages()
     # Collect warning strings as we go
     warnings = []
 
@@ -33,39 +78,9 @@ def generateInputFile(input_json: dict) -> tuple[str, str, list[str]]:
     theory = opts['Theory']
     basis = opts['Basis']
     functional = opts['Functional']
+    stages.mark("options")
 
     generated_input = ''
-    coordfile = ''
-
-    # Basis
-    coordfile += 'BASIS\n'
-    coordfile += '%s\n' % basis
-    # Title
-    coordfile += ' %s\n' % title
-    coordfile += ' %s Generated with Avogadro 2\n' % theory
-    # Coordinates
-    cjson  = input_json['cjson']
-    # roll up the atoms for each element type
-    atoms = [[] for i in range(118)]
-    start = 0  # index into the coordinate array
-    atom_types = 0
-    coords3d = cjson['atoms']['coords']['3d']
-    for z in cjson['atoms']['elements']['number']:
-        coords = coords3d[start:start + 3]
-        if len(atoms[z]) == 0:
-            atom_types += 1  # a new atom type
-        atoms[z].append(coords)
-        start += 3
-    coordfile += 'Atomtypes=%d Angstrom\n' % atom_types
-
-    for z in range(len(atoms)):
-        if len(atoms[z]) > 0:
-            coordfile += 'Charge=%d.0 Atoms=%d\n' % (z, len(atoms[z]))
-            for atom in atoms[z]:
-                coordfile += f'{symbols[z]}{atom[0]:15.5f}{atom[1]:15.5f}{atom[2]:15.5f}\n'
-    coordfile += ''
-    coordfile += '\n\n'
-
     generated_input += '**DALTON INPUT\n'
 
     if calculate == 'Single Point':
@@ -87,6 +102,11 @@ def generateInputFile(input_json: dict) -> tuple[str, str, list[str]]:
         generated_input += '.RUN PROPERTIES\n**WAVE FUNCTIONS\n.HF\n**PROPERTIES\n.VIBANA\n**END OF DALTON INPUT\n'
 
     generated_input += '\n'
+    stages.mark("blocks")
+
+    # The atom lines are only formatted while the file is written, after
+    # the last stage
+    coordfile = molecule_file(basis, title, theory, input_json['cjson'])
 
     return coordfile, generated_input, warnings
 
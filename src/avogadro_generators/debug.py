@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Debug information added to generator results with ``--debug``.
+
+Instead of echoing the whole request in the response, the request is
+written to a sidecar file named after the SHA-256 of its canonical JSON,
+and the ``debug_info`` entry of the response only refers to it::
+
+    {
+        "input": "/home/me/.cache/avogadro-generators/debug/3f2a....json",
+        "inputSha256": "3f2a...",
+        "atomCount": 12,
+        "optionsSha256": "9b41...",
+        "elapsedMs": 1.8
+    }
+
+Identical requests share their sidecar, so repeating a job does not write
+it again. The directory can be changed with the
+``AVOGADRO_GENERATORS_DEBUG_DIR`` environment variable.
+"""
+
+import hashlib
+import os
+import tempfile
+
+from .hashing import canonical_encoder, options_hash
+from .registry import cache_dir
+
+DEBUG_DIR_ENV = "AVOGADRO_GENERATORS_DEBUG_DIR"
+
+
+def debug_dir() -> str:
+    """Directory holding the sidecar files."""
+    return os.environ.get(DEBUG_DIR_ENV) or os.path.join(cache_dir(), "debug")
+
+
+def write_sidecar(input_json: dict) -> tuple[str, str]:
+    """Write a request to its sidecar file.
+
+    The canonical JSON is hashed while it is written, so it is never held
+    in memory as a whole. Returns the path and the hash.
+    """
+    directory = debug_dir()
+    os.makedirs(directory, exist_ok=True)
+    digest = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in canonical_encoder.iterencode(input_json):
+                chunk = chunk.encode()
+                digest.update(chunk)
+                f.write(chunk)
+        path = os.path.join(directory, f"{digest.hexdigest()}.json")
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path, digest.hexdigest()
+
+
+def _atom_count(cjson: dict) -> int:
+    try:
+        return len(cjson["atoms"]["elements"]["number"])
+    except (KeyError, TypeError):
+        return 0
+
+
+def debug_info(input_json: dict, elapsed: float) -> dict:
+    """Summary of a request, with ``elapsed`` the generation time in seconds."""
+    try:
+        path, digest = write_sidecar(input_json)
+    except OSError as err:
+        # Debugging must not break the job itself
+        path, digest = None, None
+        error = f"Could not write the debug sidecar: {err}"
+    else:
+        error = None
+
+    info = {
+        "input": path,
+        "inputSha256": digest,
+        "atomCount": _atom_count(input_json.get("cjson", {})),
+        "optionsSha256": options_hash(input_json.get("options", {})),
+        "elapsedMs": round(1000 * elapsed, 3),
+    }
+    if error is not None:
+        info["error"] = error
+    return info
@@ -7,8 +7,11 @@
 # ******************************************************************************
 """Input generation for the UK variant of GAMESS."""
 
+from avogadro_generators import timing
+
 
 def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
+    stages = timing.stages()
     # Collect warning strings as we go
     warnings = []
 
@@ -21,6 +24,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     charge = opts['Charge']
     multiplicity = opts['Multiplicity']
     directScf = opts['Direct SCF Mode']
+    stages.mark("options")
 
     # Convert to code-specific strings
     calcStr = ''
@@ -57,6 +61,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
         basisStr = basis
     else:
         warnings.append('Unhandled basis type: %s' % basis)
+    stages.mark("method")
 
     generated_input = ''
 
@@ -86,6 +91,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     generated_input += '%s\n\n' % theoryStr
 
     generated_input += 'enter\n'
+    stages.mark("blocks")
 
     return generated_input, warnings
 
@@ -7,8 +7,11 @@
 # ******************************************************************************
 """Input generation for Gaussian."""
 
+from avogadro_generators import timing
+
 
 def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
+    stages = timing.stages()
     # Collect warning strings as we go
     warnings = []
 
@@ -25,6 +28,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     outputFormat = opts['Output Format']
     checkpoint = opts['Write Checkpoint File']
     nCores = opts['Processor Cores']
+    stages.mark("options")
 
     generated_input = ''
 
@@ -78,6 +82,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     # this extra, otherwise unnecessary newline is not present at the end of the
     # file.
     generated_input += '\n'
+    stages.mark("blocks")
 
     return generated_input, warnings
 
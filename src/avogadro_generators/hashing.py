@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Stable hashes of generator requests, used to recognize identical jobs."""
+
+import hashlib
+import json
+from array import array
+
+
+def _default(value):
+    # Coordinates of binary and shared memory requests
+    if isinstance(value, (array, memoryview)):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+# Encoder for canonical JSON, its iterencode() streams large objects
+canonical_encoder = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), default=_default
+)
+
+
+def canonical_json(obj) -> bytes:
+    """Serialize ``obj`` so that equal objects give equal bytes."""
+    return canonical_encoder.encode(obj).encode()
+
+
+def options_hash(options: dict) -> str:
+    """Hash of a generator's options, independent of key order."""
+    return hashlib.sha256(canonical_json(options)).hexdigest()
+
+
+def geometry_hash(cjson: dict) -> str:
+    """Hash of everything Avogadro sent about the molecule."""
+    return hashlib.sha256(canonical_json(cjson)).hexdigest()
+
+
+def request_key(
+    generator: str, input_json: dict, debug: bool = False, timings: bool = False
+) -> str:
+    """Key identifying the output of a generator request."""
+    key = hashlib.sha256()
+    key.update(generator.encode())
+    key.update(b"\0debug" if debug else b"\0")
+    if timings:
+        key.update(b"\0timings")
+    key.update(options_hash(input_json.get("options", {})).encode())
+    key.update(geometry_hash(input_json.get("cjson", {})).encode())
+    return key.hexdigest()
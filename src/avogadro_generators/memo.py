@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Memoization of generated input text.
+
+Avogadro fills the coordinates into the generated text through
+``$$coords:...$$`` placeholders, so most generators produce the same text
+for every geometry of a molecule. Their ``generateInputFile`` is wrapped
+with :func:`memoize`, which keeps the results of recent calls in a
+bounded LRU keyed by the options and by the parts of the molecule the
+generator reads::
+
+    @memo.memoize(memo.element_set)
+    def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
+        ...
+
+Generators that write the geometry or anything derived from all of its
+atoms into the input are marked with :func:`full_molecule` instead, and
+always run. Generators that only format a few options take less time
+than looking up their key and are left alone.
+
+The memo holds the results of 256 calls in each process. The
+``AVOGADRO_GENERATORS_MEMO_SIZE`` environment variable changes that, and
+0 disables the memo.
+"""
+
+import collections
+import functools
+import os
+import threading
+
+from . import timing
+from .hashing import options_hash
+
+MEMO_SIZE_ENV = "AVOGADRO_GENERATORS_MEMO_SIZE"
+MEMO_SIZE = 256
+
+
+def _maxsize() -> int:
+    try:
+        return max(int(os.environ.get(MEMO_SIZE_ENV, MEMO_SIZE)), 0)
+    except ValueError:
+        return MEMO_SIZE
+
+
+class LRU:
+    """Mapping of at most ``maxsize`` items, dropping the least recently
+    used ones first. Counts its hits and misses.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._items[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+_memo = LRU(_maxsize())
+_MISSING = object()
+
+
+def element_set(cjson: dict) -> tuple[int, ...]:
+    """Molecule key of generators that only read which elements occur."""
+    try:
+        return tuple(sorted(set(cjson["atoms"]["elements"]["number"])))
+    except (KeyError, TypeError):
+        return ()
+
+
+def options_key(options: dict):
+    """Key of a generator's options, independent of key order.
+
+    Options are usually flat, and hashing their items is much cheaper
+    than :func:`~.hashing.options_hash`. The types of the values are part
+    of the key, as ``True`` and ``1`` may be written differently.
+    """
+    try:
+        return frozenset([(k, v.__class__, v) for k, v in options.items()])
+    except TypeError:
+        return options_hash(options)
+
+
+def _copy(result: tuple) -> tuple:
+    # The lists of warnings and highlight styles may be changed by callers
+    return tuple(list(item) if isinstance(item, list) else item for item in result)
+
+
+def memoize(molecule_key):
+    """Memoize a ``generateInputFile`` whose text depends on the options
+    and on ``molecule_key(cjson)`` only.
+    """
+
+    def decorator(generateInputFile):
+        @functools.wraps(generateInputFile)
+        def wrapper(input_json: dict) -> tuple:
+            if not _memo.maxsize:
+                return generateInputFile(input_json)
+            key = (
+                generateInputFile.__module__,
+                options_key(input_json.get("options", {})),
+                molecule_key(input_json.get("cjson", {})),
+            )
+            result = _memo.get(key, _MISSING)
+            if result is not _MISSING:
+                timing.stages().mark("memo")
+                return _copy(result)
+            result = generateInputFile(input_json)
+            _memo.put(key, _copy(result))
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def full_molecule(generateInputFile):
+    """Mark a ``generateInputFile`` that needs the whole molecule.
+
+    It is not memoized.
+    """
+    return generateInputFile
+
+
+def stats() -> dict:
+    """Hits and misses of the memo of this process, and its size."""
+    return {
+        "hits": _memo.hits,
+        "misses": _memo.misses,
+        "size": len(_memo),
+        "maxsize": _memo.maxsize,
+    }
@@ -0,0 +1,231 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Metrics of batch and service runs in the Prometheus text format.
+
+With ``--metrics FILE``, the ``batch`` and ``service`` subcommands rewrite
+``FILE`` every few seconds and once more when they finish. Pointing it
+into the directory of the node exporter's textfile collector, e.g.::
+
+    avogadro-generators batch orca ... --metrics /var/lib/node_exporter/avogadro.prom
+
+exports
+
+* ``avogadro_generators_jobs_total``, jobs by generator and status,
+* ``avogadro_generators_warnings_total``, warnings by generator and type,
+* ``avogadro_generators_generation_seconds``, a histogram of the time to
+  answer a job,
+* ``avogadro_generators_output_bytes_total``, bytes of generated files
+  written by batch mode, or of responses sent by the service.
+
+The file is replaced atomically, so the collector never reads a partial
+file. The type of a warning is its message without the names and values
+in it, e.g. ``element_is_not_defined_for_the``. Words typed by the user
+may remain, so only the first 50 types of each generator are told apart.
+"""
+
+import bisect
+import os
+import re
+import sys
+import tempfile
+import threading
+
+PREFIX = "avogadro_generators"
+
+# Upper bounds of the latency histogram buckets, in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Distinct warning types counted per generator, further ones are counted
+# as "other"
+MAX_WARNING_TYPES = 50
+
+# Words of a warning message used for its type
+_WORD = re.compile(r"[a-z]+")
+_SENTENCE_END = re.compile(r"[:!?]")
+_TYPE_WORDS = 6
+
+
+def warning_type(warning: str) -> str:
+    """Type of a warning, for the ``type`` label.
+
+    Only lowercase words of the first sentence and before any colon are
+    kept, which drops element symbols, basis set names, keywords, numbers
+    and suggestions from the message.
+    """
+    message = _SENTENCE_END.split(warning, 1)[0].split()
+    if message:
+        message[0] = message[0].lower()
+    words = [word for word in message if _WORD.fullmatch(word.rstrip("!.,"))]
+    words = [word.rstrip("!.,") for word in words[:_TYPE_WORDS]]
+    return "_".join(words) or "other"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+class Metrics:
+    """Counters and histograms of the jobs of one process.
+
+    All methods may be called from several threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.jobs: dict[tuple[str, str], int] = {}
+        self.warnings: dict[tuple[str, str], int] = {}
+        self._warning_types: dict[str, int] = {}
+        self.output_bytes: dict[str, int] = {}
+        # generator -> [bucket counts, sum, count]
+        self.latency: dict[str, list] = {}
+
+    def record_job(
+        self,
+        generator: str,
+        seconds: float,
+        warnings: list[str] = (),
+        error: bool = False,
+    ):
+        """Count a finished job and its warnings."""
+        with self._lock:
+            key = (generator, "error" if error else "ok")
+            self.jobs[key] = self.jobs.get(key, 0) + 1
+            for warning in warnings:
+                key = (generator, warning_type(warning))
+                if key not in self.warnings:
+                    types = self._warning_types.get(generator, 0)
+                    if types >= MAX_WARNING_TYPES:
+                        key = (generator, "other")
+                    else:
+                        self._warning_types[generator] = types + 1
+                self.warnings[key] = self.warnings.get(key, 0) + 1
+
+            latency = self.latency.setdefault(generator, [[0] * len(BUCKETS), 0.0, 0])
+            index = bisect.bisect_left(BUCKETS, seconds)
+            if index < len(BUCKETS):
+                latency[0][index] += 1
+            latency[1] += seconds
+            latency[2] += 1
+
+    def record_bytes(self, generator: str, size: int):
+        """Count bytes of output written for ``generator``."""
+        with self._lock:
+            self.output_bytes[generator] = self.output_bytes.get(generator, 0) + size
+
+    def render(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        with self._lock:
+            lines = [
+                f"# HELP {PREFIX}_jobs_total Jobs answered, by generator and status.",
+                f"# TYPE {PREFIX}_jobs_total counter",
+            ]
+            for (generator, status), n in sorted(self.jobs.items()):
+                labels = _labels(generator=generator, status=status)
+                lines.append(f"{PREFIX}_jobs_total{{{labels}}} {n}")
+
+            lines += [
+                f"# HELP {PREFIX}_warnings_total Warnings, by generator and type.",
+                f"# TYPE {PREFIX}_warnings_total counter",
+            ]
+            for (generator, kind), n in sorted(self.warnings.items()):
+                labels = _labels(generator=generator, type=kind)
+                lines.append(f"{PREFIX}_warnings_total{{{labels}}} {n}")
+
+            lines += [
+                f"# HELP {PREFIX}_generation_seconds Time to answer a job.",
+                f"# TYPE {PREFIX}_generation_seconds histogram",
+            ]
+            for generator, (buckets, total, count) in sorted(self.latency.items()):
+                cumulative = 0
+                for bound, n in zip(BUCKETS, buckets):
+                    cumulative += n
+                    labels = _labels(generator=generator, le=repr(bound))
+                    lines.append(
+                        f"{PREFIX}_generation_seconds_bucket{{{labels}}} {cumulative}"
+                    )
+                labels = _labels(generator=generator, le="+Inf")
+                lines.append(f"{PREFIX}_generation_seconds_bucket{{{labels}}} {count}")
+                labels = _labels(generator=generator)
+                lines.append(f"{PREFIX}_generation_seconds_sum{{{labels}}} {total!r}")
+                lines.append(f"{PREFIX}_generation_seconds_count{{{labels}}} {count}")
+
+            lines += [
+                f"# HELP {PREFIX}_output_bytes_total Bytes of output written.",
+                f"# TYPE {PREFIX}_output_bytes_total counter",
+            ]
+            for generator, n in sorted(self.output_bytes.items()):
+                labels = _labels(generator=generator)
+                lines.append(f"{PREFIX}_output_bytes_total{{{labels}}} {n}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Replace the file at ``path`` atomically with the metrics."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.render())
+            # mkstemp creates the file readable only by its owner
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class MetricsWriter:
+    """Thread rewriting a metrics file every ``interval`` seconds.
+
+    Use it as a context manager, which writes the file a last time on
+    exit.
+    """
+
+    def __init__(self, metrics: Metrics, path: str, interval: float = 15.0):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.metrics.write(self.path)
+            except OSError as err:
+                print(f"Could not write metrics: {err}", file=sys.stderr)
+
+    def __enter__(self) -> "MetricsWriter":
+        self.metrics.write(self.path)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.metrics.write(self.path)
+
+
+def add_arguments(parser):
+    """Add ``--metrics`` and ``--metrics-interval`` to an argument parser."""
+    parser.add_argument(
+        "--metrics",
+        default=None,
+        metavar="FILE",
+        help="Write Prometheus metrics to this .prom file",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=15.0,
+        help="Seconds between rewrites of the metrics file (default: 15)",
+    )
@@ -7,8 +7,12 @@
 # ******************************************************************************
 """Input generation for Molpro (https://www.molpro.net/)."""
 
+from avogadro_generators import memo, timing
 
+
+@memo.full_molecule
 def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
+    stages = timing.stages()
     # Collect warning strings as we go
     warnings = []
 
@@ -21,6 +25,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     charge = opts['Charge']
     multiplicity = opts['Multiplicity']
     oldVersion = opts['Use Pre-2009.1 Format']
+    stages.mark("options")
 
     # Convert to code-specific strings
     basisStr = ''
@@ -72,6 +77,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
         calcStr = '{optg}\n{frequencies}\n\n'
     else:
         warnings.append('Unhandled calculation type: %s' % calculate)
+    stages.mark("method")
 
     # Create input file
     generated_input = ''
@@ -101,6 +107,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     generated_input += '%s' % calcStr
 
     generated_input += "---\n"
+    stages.mark("blocks")
 
     return generated_input, warnings
 
@@ -7,8 +7,12 @@
 # ******************************************************************************
 """Input generation for MOPAC (https://openmopac.net/)."""
 
+from avogadro_generators import timing
+from avogadro_generators.solvents import get_solvent
+
 
 def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
+    stages = timing.stages()
     # Collect warning strings as we go
     warnings = []
 
@@ -24,19 +28,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     optionaldielectric = opts['Other Solvent Dielectric']
     hftype = opts['HF Type']
     cosmo = opts['COSMO']
-    solventlist = {"Acetic acid": 6.15, "Acetone": 20.7, "Acetonitrile": 37.5,
-    "Anisole": 4.33, "Benzene": 2.27, "Bromobenzene": 5.17, "Carbon disulfide": 2.6,
-    "Carbon tetrachloride": 2.24, "Chlorobenzene": 5.62, "Chloroform": 4.81,
-    "Cyclohexane": 2.02, "Dibutyl ether": 3.1, "o-Dichlorobenzene": 9.93,
-    "1,2-Dichloroethane": 10.36, "Dichloromethane": 8.93, "Diethylamine": 3.6,
-    "Diethylether": 4.33, "1,2-Dimethoxyethane": 7.2, "N,N-Dimethylacetamide": 37.8,
-    "N,N-Dimethylformamide": 36.7, "Dimethylsulfoxide": 46.7, "1,4-Dioxane": 2.25,
-    "Ethanol": 24.5, "Ethyl acetate": 6.02, "Ethyl benzoate": 6.02, "Formamide": 111,
-    "Hexamethylphosphoramide": 30, "Isopropyl lcohol": 17.9, "Methanol": 32.7,
-    "2-Methyl-2-propanol": 10.9, "Nitrobenzene": 34.82, "Nitromethane": 35.87,
-    "Pyridine": 12.4, "Tetrahydrofuran": 7.58, "Toluene": 2.38, "Trichloroethylene": 3.4,
-    "Triethylamine": 2.42, "Trifluoroacetic acid": 8.55, "2,2,2-Trifluoroethanol": 8.55,
-    "Water": 80.1, "o-Xylene": 2.57}
+    stages.mark("options")
 
     generated_input = ''
 
@@ -71,13 +63,14 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
         raise Exception('Unhandled calculation type: %s' % calculate)
 
     eps = ""
-    dielectric = ""
-    if solvent == "OTHER":
-        dielectric = optionaldielectric
-    else:
-        dielectric = str(solventlist[solvent])
-
     if cosmo is True:
+        if solvent == "OTHER":
+            dielectric = optionaldielectric
+        else:
+            entry = get_solvent(solvent)
+            if entry is None or entry.dielectric is None:
+                raise Exception('Unhandled solvent: %s' % solvent)
+            dielectric = str(entry.dielectric)
         eps = "EPS=" + dielectric
 
     if multiplicity > 1:
@@ -95,6 +88,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
         generated_input += '$$coords:Sx0y0z0$$\n'
     else:
         generated_input += '$$coords:Sx1y1z1$$\n'
+    stages.mark("blocks")
 
     return generated_input, warnings
 
@@ -7,6 +7,8 @@
 # ******************************************************************************
 """Input generation for NWChem (https://nwchemgit.github.io/)."""
 
+from avogadro_generators import timing
+
 
 def basisGuiToInput(gui):
     if gui == '3-21 G':
@@ -26,6 +28,7 @@ def basisGuiToInput(gui):
 
 
 def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
+    stages = timing.stages()
     # Collect warning strings as we go
     warnings = []
 
@@ -37,6 +40,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     basis = opts['Basis']
     multiplicity = opts['Multiplicity']
     charge = opts['Charge']
+    stages.mark("options")
 
     # Preamble
     nwfile = ""
@@ -98,6 +102,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     else:
         warnings.append("Invalid calculation type: %s" % calculate)
     nwfile += "\n"
+    stages.mark("blocks")
 
     return nwfile, warnings
 
@@ -7,27 +7,33 @@
 # ******************************************************************************
 """Input generation for ORCA (https://www.faccts.de/orca/)."""
 
+import functools
+from typing import TYPE_CHECKING
+
 from .input_blocks import SCF, Basis, ElProp, format_block_keyword
 from .simple_keywords import (
     RunType,
     Output,
     match_simple_keyword,
+    suggest_keywords,
 )
-from .dft import Composite, Functionals, Disp
 from .wft import MP2, CoupledCluster
 from .basis_sets import (
-    PopleBasisSet,
-    def2BasisSet,
-    JensenBasisSet,
-    ccBasisSet,
-    RelativisticBasisSet,
+    element_mask,
+    get_basis_enum,
     get_basis_set,
     get_aux_basis,
     get_basis_family,
 )
-from .implicit_solvation import Solvent, SolvationModel
+from .. import memo, timing
+from ..hashing import canonical_json
+from ..solvents import get_solvent
 from ..utilities import Element
 
+if TYPE_CHECKING:
+    from .dft import Composite, Functionals
+    from .libxc import _LibXC
+
 
 def write_block(block_name: str, keys_vals: dict):
     """Write an input block."""
@@ -45,8 +51,12 @@ def write_block(block_name: str, keys_vals: dict):
 
 def get_method(
     value: str,
-) -> str | Functionals | Composite | MP2 | CoupledCluster:
-    """Get a method from a string."""
+) -> "str | Functionals | Composite | MP2 | CoupledCluster | tuple[_LibXC, ...]":
+    """Get a method from a string.
+
+    Functionals unknown to ORCA are looked up in LibXC, see
+    :func:`.libxc.parse_libxc`.
+    """
 
     if value == "HF":
         return value
@@ -54,81 +64,115 @@ def get_method(
         return MP2(value)
     elif "CCSD" in value:
         return CoupledCluster(value)
-    elif "-3c" in value:
+
+    # The functional tables are only built for jobs using DFT
+    from .dft import Composite, Functionals
+
+    if "-3c" in value:
         return Composite(value)
-    else:
+    try:
         return Functionals(value)
+    except ValueError:
+        from .libxc import parse_libxc
+
+        functionals = parse_libxc(value)
+        if functionals is None:
+            raise
+        return functionals
+
+
+def _molecule_key(cjson: dict) -> tuple:
+    # Warnings depend on the elements, and constraints are written out.
+    # A top-level "frozen" key alone opens the %geom block, and frozen
+    # atoms are read per atom or per coordinate depending on the count.
+    constraints = cjson.get("constraints")
+    atoms = cjson.get("atoms", {})
+    frozen = atoms.get("frozen")
+    if constraints is None and frozen is None and "frozen" not in cjson:
+        return memo.element_set(cjson)
+    try:
+        atom_count = len(atoms["elements"]["number"])
+    except (KeyError, TypeError):
+        atom_count = None
+    return memo.element_set(cjson), canonical_json(
+        [constraints, frozen, "frozen" in cjson, atom_count]
+    )
 
 
-def generateInputFile(input_json: dict) -> tuple[str, list[str], list[str]]:
-    # Collect warning strings as we go
-    warnings = []
-    syntax_groups = ["default"]
-    # fmt: off
-    opts  = input_json["options"]
-    cjson = input_json["cjson"]
+# The input is assembled from sections that are cached separately, keyed
+# by the options each of them reads. When one option changes between two
+# requests to a long-running process, e.g. in --serve mode while the user
+# edits the dialog, only the sections reading it are built again.
+SECTION_CACHE_SIZE = 64
 
-    # Extract undefined options:
-    title: str          = opts["Title"]
-    charge: int         = opts["Charge"]
-    multiplicity: int   = opts["Multiplicity"]
-    nprocs: int         = opts["Processor Cores"]
-    max_mem: int        = opts["Memory"]
-    extra_keywords: str = opts["basic_simple_keywords"]
-
-    # Extract defined options
-    run_type        = RunType(opts["Calculation Type"])
-    method          = get_method(opts["Theory"])
-    basis_set       = get_basis_set(opts["Basis"])
-    solvent         = opts["Solvent"]
-    disp            = opts["basic_disp_corr"]
-    print_mos: bool = opts["basic_print_mos"]
-    print_level     = Output(opts["basic_print_level"])
-    constrain: bool = opts["basic_constrain"]
-
-    # Extract some items from other tabs
-    auxj_basis  = get_aux_basis(opts["Basis_AUXJ"])
-    auxjk_basis = get_aux_basis(opts["Basis_AUXJK"])
-    auxc_basis  = get_aux_basis(opts["Basis_AUXC"])
-    # fmt: on
-    override_bases = {
-        "Basis_pople": PopleBasisSet,
-        "Basis_def2": def2BasisSet,
-        "Basis_cc": ccBasisSet,
-        "Basis_jensen": JensenBasisSet,
-        "Basis_relativistic": RelativisticBasisSet,
-    }
+# Options overriding the main basis set, and the families they select from
+OVERRIDE_BASES = {
+    "Basis_pople": "PopleBasisSet",
+    "Basis_def2": "def2BasisSet",
+    "Basis_cc": "ccBasisSet",
+    "Basis_jensen": "JensenBasisSet",
+    "Basis_relativistic": "RelativisticBasisSet",
+}
 
-    for basis, basis_type in override_bases.items():
-        basis = opts[basis]
+
+@functools.lru_cache(maxsize=SECTION_CACHE_SIZE, typed=True)
+def _basis_set(basis: str, *overrides: str):
+    """Main basis set, from ``Basis`` and the ``OVERRIDE_BASES`` options."""
+    basis_set = get_basis_set(basis)
+    for basis, basis_type in zip(overrides, OVERRIDE_BASES.values()):
         if basis == "":
             pass
         else:
-            basis_set = basis_type(basis)
+            basis_set = get_basis_enum(basis_type)(basis)
+    return basis_set
 
-    simple_keywords = []
 
-    if "atoms" in cjson:
-        for element in set(cjson["atoms"]["elements"]["number"]):
-            element = Element(element)
-            if element not in basis_set.elements:
-                warnings.append(
-                    f"Element {element.symbol} is not defined for the {basis_set.value} basis set!"
-                )
-
-    if isinstance(method, Functionals):
-        if disp == "":
-            simple_keywords.extend([method.value, basis_set])
-        elif Disp[disp] not in method.disp:
+@functools.lru_cache(maxsize=SECTION_CACHE_SIZE, typed=True)
+def _element_warnings(basis_set, elements: tuple[int, ...]) -> tuple[str, ...]:
+    """Warnings for the elements the basis set does not cover."""
+    missing = element_mask(elements) & ~basis_set.element_mask
+    warnings = []
+    for element in elements:
+        if missing >> element & 1:
             warnings.append(
-                f"The dispersion correction {Disp[disp]} is not available for {method.value}!"
+                f"Element {Element(element).symbol} is not defined for the {basis_set.value} basis set!"
             )
-            simple_keywords.extend([method.value, basis_set])
-        else:
-            simple_keywords.extend([method.value, disp, basis_set])
-    elif isinstance(method, Composite):
-        basis_set = ""
-        simple_keywords.append(method.value)
+    return tuple(warnings)
+
+
+@functools.lru_cache(maxsize=SECTION_CACHE_SIZE, typed=True)
+def _simple_keywords(
+    calc_type: str,
+    theory: str,
+    basis_set,
+    auxj: str,
+    auxjk: str,
+    auxc: str,
+    disp: str,
+    solvent: str,
+    solvation_model: str | None,
+    print_mos: bool,
+    print_level: str,
+    extra_keywords: str,
+) -> tuple[str, str, tuple[str, ...]]:
+    """The line of simple keywords and the %method block of LibXC
+    functionals, with their warnings.
+    """
+    warnings = []
+    method_block = ""
+    # fmt: off
+    run_type    = RunType(calc_type)
+    method      = get_method(theory)
+    print_level = Output(print_level)
+    auxj_basis  = get_aux_basis(auxj)
+    auxjk_basis = get_aux_basis(auxjk)
+    auxc_basis  = get_aux_basis(auxc)
+    # fmt: on
+
+    simple_keywords = []
+
+    if method == "HF":
+        simple_keywords.extend([method, basis_set])
     elif isinstance(method, (MP2, CoupledCluster)):
         if auxc_basis is None:
             warnings.append(
@@ -144,8 +188,45 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str], list[str]]:
             simple_keywords.extend([method.value, basis_set, auxc_basis])
         else:
             simple_keywords.extend([method.value, basis_set, auxc_basis])
-    elif method == "HF":
-        simple_keywords.extend([method, basis_set])
+    elif isinstance(method, tuple):
+        # LibXC functionals, so get_method imported .libxc already
+        from .libxc import SimpleLibXC, check_libxc, format_libxc
+
+        if len(method) == 1 and isinstance(method[0], SimpleLibXC):
+            name = method[0].format_input()
+            simple_keywords.extend([name, basis_set])
+        elif check_libxc(*method):
+            name = " ".join(method)
+            method_block = format_libxc(*method)
+            simple_keywords.append(basis_set)
+        else:
+            name = " ".join(method)
+            warnings.append(
+                f"The LibXC functional {name} needs an exchange and a correlation part!"
+            )
+            simple_keywords.append(basis_set)
+        if disp != "":
+            from .dft import Disp
+
+            warnings.append(
+                f"The dispersion correction {Disp[disp]} is not available for {name}!"
+            )
+    else:
+        # Anything else is a DFT method, so get_method imported .dft already
+        from .dft import Composite, Disp
+
+        if isinstance(method, Composite):
+            basis_set = ""
+            simple_keywords.append(method.value)
+        elif disp == "":
+            simple_keywords.extend([method.value, basis_set])
+        elif Disp[disp] not in method.disp:
+            warnings.append(
+                f"The dispersion correction {Disp[disp]} is not available for {method.value}!"
+            )
+            simple_keywords.extend([method.value, basis_set])
+        else:
+            simple_keywords.extend([method.value, disp, basis_set])
 
     if auxj_basis is not None:
         simple_keywords.append(auxj_basis)
@@ -154,15 +235,22 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str], list[str]]:
         simple_keywords.append(auxjk_basis)
 
     if solvent != "":
-        solvent = Solvent(solvent)
-        solvent_model = SolvationModel[opts["Solvation Model"].upper()]
-        if solvent_model not in solvent.models:
+        # The solvent tables are only built for jobs with a solvent
+        from .implicit_solvation import ORCA_SOLVATION_MODELS, SolvationModel
+
+        entry = get_solvent(solvent)
+        if entry is None:
+            raise ValueError(f"{solvent!r} is not a valid Solvent")
+        solvent_model = SolvationModel[solvation_model.upper()]
+        # The models of xTB are only available with xTB methods, which are
+        # not among the theories
+        models = SolvationModel(entry.models) & ORCA_SOLVATION_MODELS
+        if solvent_model not in models:
             warnings.append(
-                f"Solvation model {solvent_model} not available for solvent {solvent.aliases[0]}!"
+                f"Solvation model {solvent_model} not available for solvent {entry.name}!"
             )
         else:
-            simple_keywords.append(f"{solvent_model}({solvent})")
-        syntax_groups.append("solvent")
+            simple_keywords.append(f"{solvent_model}({entry.name})")
 
     if print_mos:
         simple_keywords.extend([Output.PRINTMOS, Output.PRINTBASIS])
@@ -171,11 +259,100 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str], list[str]]:
         simple_keywords.append(print_level)
 
     for keyword in extra_keywords.replace(",", " ").split():
-        kwd = match_simple_keyword(keyword)
+        kwd = match_simple_keyword(keyword, case_sensitive=False)
         if kwd is not None:
             simple_keywords.append(kwd)
-        else:
-            warnings.append(f"Keyword {keyword} is not recognized!")
+            continue
+        warning = f"Keyword {keyword} is not recognized!"
+        suggestions = suggest_keywords(keyword)
+        if suggestions:
+            warning += f" Did you mean {' or '.join(suggestions)}?"
+        warnings.append(warning)
+
+    line = f"!{run_type.value}"
+    for kwd in simple_keywords:
+        line += f" {kwd}"
+    # Trailing whitespace to avoid syntax highlighting bugs
+    line += " \n"
+    return line, method_block, tuple(warnings)
+
+
+@functools.cache
+def _block_options(block) -> tuple[str, ...]:
+    """Options holding the values of the keywords of an input block."""
+    return tuple(kwd.get_json_key() for kwd in block)
+
+
+@functools.lru_cache(maxsize=SECTION_CACHE_SIZE, typed=True)
+def _block_section(name: str, block, values: tuple) -> str:
+    """An input block with the keywords that differ from their defaults."""
+    items = []
+    for kwd, val in zip(block, values):
+        try:
+            val = kwd._dtype(val)
+        except ValueError:
+            pass
+        if not kwd.is_default(val):
+            items.append(format_block_keyword(kwd, val))
+
+    if len(items) == 0:
+        return ""
+    return f"%{name}\n" + "".join(items) + "end\n"
+
+
+def clear_section_caches():
+    """Empty the caches of the input sections."""
+    for section in (_basis_set, _element_warnings, _simple_keywords, _block_section):
+        section.cache_clear()
+
+
+@memo.memoize(_molecule_key)
+def generateInputFile(input_json: dict) -> tuple[str, list[str], list[str]]:
+    stages = timing.stages()
+    # Collect warning strings as we go
+    warnings = []
+    syntax_groups = ["default"]
+    # fmt: off
+    opts  = input_json["options"]
+    cjson = input_json["cjson"]
+
+    # Extract undefined options:
+    title: str          = opts["Title"]
+    charge: int         = opts["Charge"]
+    multiplicity: int   = opts["Multiplicity"]
+    nprocs: int         = opts["Processor Cores"]
+    max_mem: int        = opts["Memory"]
+    constrain: bool     = opts["basic_constrain"]
+    solvent: str        = opts["Solvent"]
+    # fmt: on
+    stages.mark("options")
+
+    basis_set = _basis_set(opts["Basis"], *(opts[key] for key in OVERRIDE_BASES))
+    keywords, method_block, keyword_warnings = _simple_keywords(
+        opts["Calculation Type"],
+        opts["Theory"],
+        basis_set,
+        opts["Basis_AUXJ"],
+        opts["Basis_AUXJK"],
+        opts["Basis_AUXC"],
+        opts["basic_disp_corr"],
+        solvent,
+        opts["Solvation Model"] if solvent != "" else None,
+        opts["basic_print_mos"],
+        opts["basic_print_level"],
+        opts["basic_simple_keywords"],
+    )
+    stages.mark("method")
+
+    if "atoms" in cjson:
+        elements = tuple(set(cjson["atoms"]["elements"]["number"]))
+        warnings.extend(_element_warnings(basis_set, elements))
+    stages.mark("elements")
+
+    warnings.extend(keyword_warnings)
+    if solvent != "":
+        syntax_groups.append("solvent")
+
     # fmt: off
     generated_input = (
         "# File Generated with Avogadro\n"
@@ -183,11 +360,8 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str], list[str]]:
        f"#\n"
     )
     # fmt: on
-    generated_input += f"!{run_type.value}"
-    for kwd in simple_keywords:
-        generated_input += f" {kwd}"
-    # Trailing whitespace to avoid syntax highlighting bugs
-    generated_input += " \n"
+    generated_input += keywords
+    generated_input += method_block
 
     if max_mem != 4:
         generated_input += f"%MaxCore {int(max_mem * 1024 / nprocs)}\n"
@@ -195,6 +369,16 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str], list[str]]:
     if nprocs != 1:
         generated_input += f"%pal\n    nprocs = {nprocs}\nend\n"
 
+    # The blocks of the options follow the constraints in the input
+    option_blocks = ""
+    for block, name in ((SCF, "scf"), (Basis, "basis"), (ElProp, "elprop")):
+        values = tuple(opts[key] for key in _block_options(block))
+        section = _block_section(name, block, values)
+        if section:
+            syntax_groups.append(name)
+            option_blocks += section
+    stages.mark("blocks")
+
     if (
         constrain is True
         and "atoms" in cjson
@@ -251,63 +435,11 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str], list[str]]:
         generated_input += "    end\n"
         generated_input += "end\n"
 
-    scf_block = []
-    for kwd in SCF:
-        val = opts[kwd.get_json_key()]
-        try:
-            val = kwd._dtype(val)
-        except ValueError:
-            pass
-        if not kwd.is_default(val):
-            scf_block.append(format_block_keyword(kwd, val))
-
-    basis_block = []
-    for kwd in Basis:
-        val = opts[kwd.get_json_key()]
-        try:
-            val = kwd._dtype(val)
-        except ValueError:
-            pass
-        if not kwd.is_default(val):
-            basis_block.append(format_block_keyword(kwd, val))
-
-    elprop_block = []
-    for kwd in ElProp:
-        val = opts[kwd.get_json_key()]
-        try:
-            val = kwd._dtype(val)
-        except ValueError:
-            pass
-        if not kwd.is_default(val):
-            elprop_block.append(format_block_keyword(kwd, val))
-
-    if len(scf_block) != 0:
-        syntax_groups.append("scf")
-
-        generated_input += "%scf\n"
-        for item in scf_block:
-            generated_input += item
-        generated_input += "end\n"
-
-    if len(basis_block) != 0:
-        syntax_groups.append("basis")
-
-        generated_input += "%basis\n"
-        for item in basis_block:
-            generated_input += item
-        generated_input += "end\n"
-
-    if len(elprop_block) != 0:
-        syntax_groups.append("elprop")
-
-        generated_input += "%elprop\n"
-        for item in elprop_block:
-            generated_input += item
-        generated_input += "end\n"
-
+    generated_input += option_blocks
     generated_input += f"* xyz {charge} {multiplicity}\n"
     generated_input += "$$coords:____Sxyz$$\n"
     generated_input += "*\n\n\n"
+    stages.mark("coordinates")
 
     return generated_input, warnings, syntax_groups
 
@@ -0,0 +1,292 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Compatibility of the options of the ORCA generator.
+
+Some options of the generator only make sense together, and it warns
+about those that do not:
+
+* a dispersion correction must be available for the functional,
+* the solvation model must be available for the solvent,
+* MP2 and coupled-cluster methods need an AuxC basis set of the family of
+  the main basis set.
+
+:func:`compatibility_index` returns a :class:`CompatibilityIndex` built
+from the tables once, which knows every value of these options and
+answers without generating any input whether a combination is accepted
+without a warning, and which values of an option fit the others::
+
+    >>> index = compatibility_index()
+    >>> index.is_valid({"Theory": "PBE0", "basic_disp_corr": "D4"})
+    True
+    >>> index.completions("basic_disp_corr", {"Theory": "B97M-V"})
+    ('', 'SCNL')
+
+Options are given by their names in ``options.toml``, and options left
+out of a combination may take any value. Each option has a bitmask of
+the values allowed by every option it depends on, precomputed for each
+value, or kind of value, of those options. A query is then a few dict
+lookups and ANDs, whatever the number of values.
+
+The index works on the main basis set given in ``Basis``. Bases chosen
+with the family options of the Basis tab override it in the generator.
+"""
+
+import functools
+from collections.abc import Callable
+
+THEORY = "Theory"
+DISP = "basic_disp_corr"
+BASIS = "Basis"
+AUXC = "Basis_AUXC"
+SOLVENT = "Solvent"
+MODEL = "Solvation Model"
+
+
+def _same(value):
+    return value
+
+
+def _bits(mask: int) -> list[int]:
+    """Indices of the set bits of ``mask``."""
+    bits = []
+    while mask:
+        low = mask & -mask
+        bits.append(low.bit_length() - 1)
+        mask ^= low
+    return bits
+
+
+class CompatibilityIndex:
+    """Values of the options and the rules between them.
+
+    Build it with :func:`compatibility_index`.
+    """
+
+    def __init__(self):
+        from ..solvents import get_solvent, solvents
+        from . import get_method, tables
+        from .basis_sets import _basis_index
+        from .dft import Composite, Disp, Functionals
+        from .implicit_solvation import ORCA_SOLVATION_MODELS, SolvationModel
+        from .wft import MP2, CoupledCluster
+
+        # Methods the generator accepts, by the way it treats them
+        theories = ["HF", *MP2, *CoupledCluster, *Composite]
+        theories += [row[1] for row in tables.FUNCTIONALS]
+        methods = {}
+        for theory in dict.fromkeys(str(theory) for theory in theories):
+            try:
+                methods[theory] = get_method(theory)
+            except ValueError:
+                pass
+        correlated = {
+            theory: isinstance(method, (MP2, CoupledCluster))
+            for theory, method in methods.items()
+        }
+        disps = ["", *(name for name in Disp.__members__ if name != "NODISP")]
+
+        families = {}
+        for family, rows in tables.BASIS_SETS.items():
+            for row in rows:
+                families.setdefault(row[1], family)
+        parents = {"": None}
+        for row in tables.AUX_BASIS_SETS["AuxCBasisSet"]:
+            parents.setdefault(row[1], row[3])
+
+        # The models of xTB are never available, see _simple_keywords
+        models = list(SolvationModel.__members__)
+        available = {"": (1 << len(models)) - 1}
+        for solvent in solvents():
+            usable = SolvationModel(solvent.models) & ORCA_SOLVATION_MODELS
+            if usable:
+                available[solvent.name] = sum(
+                    1 << i
+                    for i, name in enumerate(models)
+                    if SolvationModel[name] in usable
+                )
+
+        self.domains: dict[str, tuple[str, ...]] = {
+            THEORY: tuple(methods),
+            DISP: tuple(disps),
+            BASIS: tuple(families),
+            AUXC: tuple(parents),
+            SOLVENT: tuple(available),
+            MODEL: tuple(models),
+        }
+        self._positions = {
+            option: {value: i for i, value in enumerate(values)}
+            for option, values in self.domains.items()
+        }
+        self._rules: dict[str, list[tuple[tuple[str, ...], Callable, dict]]] = {
+            option: [] for option in self.domains
+        }
+        self._basis_index = _basis_index
+        self._get_solvent = get_solvent
+
+        everything = {
+            option: (1 << len(values)) - 1 for option, values in self.domains.items()
+        }
+        self._everything = everything
+
+        def mask(option: str, accept: Callable[[str], bool]) -> int:
+            """Bitmask of the values of ``option`` that ``accept`` accepts."""
+            return sum(
+                1 << i for i, value in enumerate(self.domains[option]) if accept(value)
+            )
+
+        def rule(option: str, sources: tuple[str, ...], key: Callable, masks: dict):
+            """Allow the values of ``masks[key(*sources)]`` for ``option``."""
+            self._rules[option].append((sources, key, masks))
+
+        # Dispersion corrections, which the generator ignores for anything
+        # but the functionals
+        def disp_fits(theory: str, disp: str) -> bool:
+            method = methods[theory]
+            if disp == "" or not isinstance(method, Functionals):
+                return True
+            return Disp[disp] in method.disp
+
+        disps_of = {
+            theory: mask(DISP, lambda disp: disp_fits(theory, disp))
+            for theory in methods
+        }
+        theories_of = {
+            disp: mask(THEORY, lambda theory: disp_fits(theory, disp)) for disp in disps
+        }
+        rule(DISP, (THEORY,), _same, disps_of)
+        rule(THEORY, (DISP,), _same, theories_of)
+
+        # Solvation models, which do not matter without a solvent
+        solvents_of = {
+            model: mask(SOLVENT, lambda solvent: available[solvent] >> i & 1)
+            for i, model in enumerate(models)
+        }
+        rule(MODEL, (SOLVENT,), _same, available)
+        rule(SOLVENT, (MODEL,), _same, solvents_of)
+
+        # AuxC basis sets, which only MP2 and coupled-cluster methods need,
+        # from the family of the main basis set
+        main_families = set(families.values())
+        aux_families = set(parents.values()) - {None}
+        uncorrelated = mask(THEORY, lambda theory: not correlated[theory])
+        aux_of = {
+            main: mask(AUXC, lambda auxc: parents[auxc] == main)
+            for main in main_families
+        }
+        bases_of = {
+            aux: mask(BASIS, lambda basis: families[basis] == aux)
+            for aux in aux_families
+        }
+
+        def needed_family(theory: str, basis: str) -> str | None:
+            return families[basis] if correlated[theory] else None
+
+        def given_family(theory: str, auxc: str) -> str | None:
+            return (parents[auxc] or "") if correlated[theory] else None
+
+        def families_match(basis: str, auxc: str) -> bool:
+            return families[basis] == parents[auxc]
+
+        any_aux = {
+            True: mask(AUXC, lambda auxc: auxc != ""),
+            False: everything[AUXC],
+        }
+        any_basis = {
+            True: mask(BASIS, lambda basis: families[basis] in aux_families),
+            False: everything[BASIS],
+        }
+        theories_by_basis = {
+            main: everything[THEORY] if main in aux_families else uncorrelated
+            for main in main_families
+        }
+        theories_by_aux = {
+            aux: everything[THEORY] if aux is not None else uncorrelated
+            for aux in parents.values()
+        }
+        theories_by_match = {True: everything[THEORY], False: uncorrelated}
+        rule(AUXC, (THEORY,), correlated.get, any_aux)
+        rule(AUXC, (THEORY, BASIS), needed_family, {None: everything[AUXC], **aux_of})
+        rule(BASIS, (THEORY,), correlated.get, any_basis)
+        rule(BASIS, (THEORY, AUXC), given_family, {None: everything[BASIS], **bases_of})
+        rule(THEORY, (BASIS,), families.get, theories_by_basis)
+        rule(THEORY, (AUXC,), parents.get, theories_by_aux)
+        rule(THEORY, (BASIS, AUXC), families_match, theories_by_match)
+
+    def canonical(self, option: str, value) -> str | None:
+        """The value of an option as it is listed in :attr:`domains`, or
+        ``None`` if the index does not know it.
+
+        Basis sets and solvents are looked up in any case and solvents by
+        any alias, as in the generator.
+        """
+        if option == BASIS:
+            entry = self._basis_index()[0].get(str(value).lower())
+            value = entry[1] if entry is not None else None
+        elif option == AUXC and value != "":
+            entry = self._basis_index()[1].get(str(value).lower())
+            value = entry[1] if entry is not None else None
+        elif option == SOLVENT and value != "":
+            entry = self._get_solvent(str(value))
+            value = entry.name if entry is not None else None
+        elif option == MODEL:
+            value = str(value).upper()
+        return value if value in self._positions[option] else None
+
+    def _mask(self, option: str, values: dict[str, str]) -> int:
+        mask = self._everything[option]
+        for sources, key, masks in self._rules[option]:
+            if all(source in values for source in sources):
+                mask &= masks.get(key(*(values[source] for source in sources)), 0)
+        return mask
+
+    def _canonical_values(self, combination: dict) -> dict[str, str] | None:
+        values = {}
+        for option, value in combination.items():
+            if option in self.domains:
+                value = self.canonical(option, value)
+                if value is None:
+                    return None
+                values[option] = value
+        return values
+
+    def is_valid(self, combination: dict) -> bool:
+        """Whether the generator accepts a combination of options without
+        a warning about their compatibility.
+
+        Other options in ``combination`` are ignored, so the options of a
+        job may be passed as they are. Values the index does not know,
+        e.g. LibXC functionals, are never valid.
+        """
+        values = self._canonical_values(combination)
+        if values is None:
+            return False
+        for option, value in values.items():
+            others = {k: v for k, v in values.items() if k != option}
+            if not self._mask(option, others) >> self._positions[option][value] & 1:
+                return False
+        return True
+
+    def completions(self, option: str, combination: dict) -> tuple[str, ...]:
+        """Values of ``option`` that are compatible with the other options
+        of ``combination``, in the order of :attr:`domains`.
+
+        The value of ``option`` itself in ``combination`` is ignored.
+        """
+        values = self._canonical_values(
+            {k: v for k, v in combination.items() if k != option}
+        )
+        if values is None:
+            return ()
+        domain = self.domains[option]
+        return tuple(domain[i] for i in _bits(self._mask(option, values)))
+
+
+@functools.cache
+def compatibility_index() -> CompatibilityIndex:
+    """The compatibility index of the ORCA generator, built on first use."""
+    return CompatibilityIndex()
@@ -0,0 +1,15 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Definitions of the tables used by the ORCA generator.
+
+The modules in this package are the place to add or change basis sets,
+functionals and solvents. They are not imported at run time, instead
+``scripts/write_orca_tables.py`` compiles them into plain tuples, dicts
+and bitmasks in ``orca/tables.py``, from which the enums in the parent
+package are built. Rerun the script after every change here.
+"""
@@ -7,8 +7,13 @@
 # ******************************************************************************
 """Enums of simple input keywords for ORCA calculations."""
 
+import collections
+import functools
+from collections.abc import Iterator
 from enum import StrEnum
 
+from ..solvents import solvents
+
 
 # fmt: off
 class RunType(StrEnum):
@@ -147,26 +152,131 @@ class PNO(StrEnum):
 # fmt: on
 
 
-def match_simple_keyword(kwd: str):
-    """Brute force matching of simple keywords."""
-
-    keyword_types = [
-        RunType,
-        SemiEmpirical,
-        SCFConv,
-        DeterminantType,
-        Opt,
-        Output,
-        Grid,
-        RIApproximation,
-        PartialCharges,
-        Relativistic,
-        PNO,
-    ]
-
-    for kwd_type in keyword_types:
+# Enums of simple keywords, in the order in which they are matched
+KEYWORD_TYPES = (
+    RunType,
+    SemiEmpirical,
+    SCFConv,
+    DeterminantType,
+    Opt,
+    Output,
+    Grid,
+    RIApproximation,
+    PartialCharges,
+    Relativistic,
+    PNO,
+)
+
+# Length of the n-grams compared to suggest keywords, and the least
+# similarity of a suggestion
+NGRAM = 3
+SUGGESTION_CUTOFF = 0.5
+
+
+def _keywords() -> Iterator[tuple[str, "str | StrEnum"]]:
+    """Text and keyword of everything that may be typed as a simple keyword.
+
+    Besides the members of ``KEYWORD_TYPES``, these are basis sets,
+    auxiliary basis sets, functionals, dispersion corrections and
+    solvation keywords such as ``CPCM(water)``, for every alias of the
+    solvent. Keywords are separated by whitespace, so names containing
+    any are left out.
+    """
+    from . import tables
+    from .dft import Disp
+    from .implicit_solvation import SolvationModel
+
+    def single(name: str) -> bool:
+        return name.split() == [name]
+
+    for kwd_type in KEYWORD_TYPES:
         for key in kwd_type:
-            if str(key) == kwd:
-                return key
-
-    return None
+            yield str(key), key
+    for family in (*tables.BASIS_SETS.values(), *tables.AUX_BASIS_SETS.values()):
+        for _, name, *_ in family:
+            yield name, name
+    for _, name, _ in tables.FUNCTIONALS:
+        if single(name):
+            yield name, name
+    for name, disp in Disp.__members__.items():
+        if disp:
+            yield name, name
+    for solvent in solvents():
+        aliases = [alias for alias in solvent.aliases if single(alias)]
+        if not aliases:
+            continue
+        for model in SolvationModel(solvent.models):
+            keyword = f"{model}({aliases[0]})"
+            for alias in aliases:
+                yield f"{model}({alias})", keyword
+
+
+@functools.cache
+def _keyword_index() -> tuple[dict, dict]:
+    """Exact and lowercase index of the keywords.
+
+    The first keyword with a given text wins, as in the order of
+    :func:`_keywords`.
+    """
+    exact = {}
+    lowercase = {}
+    for text, keyword in _keywords():
+        exact.setdefault(text, keyword)
+        lowercase.setdefault(text.lower(), keyword)
+    return exact, lowercase
+
+
+def match_simple_keyword(kwd: str, case_sensitive: bool = True):
+    """Look a simple keyword up by its text.
+
+    Returns the keyword enum member, or the name of the basis set,
+    functional or solvation keyword, or ``None`` if there is no such
+    keyword. ORCA itself reads keywords regardless of case, which is
+    matched with ``case_sensitive=False``.
+    """
+    exact, lowercase = _keyword_index()
+    keyword = exact.get(kwd)
+    if keyword is None and not case_sensitive:
+        keyword = lowercase.get(kwd.lower())
+    return keyword
+
+
+def _ngrams(text: str) -> set[str]:
+    padded = f"{' ' * (NGRAM - 1)}{text.lower()} "
+    return {padded[i : i + NGRAM] for i in range(len(padded) - NGRAM + 1)}
+
+
+@functools.cache
+def _ngram_index() -> tuple[list[str], list[int], dict[str, list[int]]]:
+    """Distinct keywords, their number of n-grams, and the keywords
+    containing each n-gram.
+    """
+    names = list(dict.fromkeys(str(keyword) for keyword in _keyword_index()[0].values()))
+    sizes = []
+    index = {}
+    for i, name in enumerate(names):
+        ngrams = _ngrams(name)
+        sizes.append(len(ngrams))
+        for ngram in ngrams:
+            index.setdefault(ngram, []).append(i)
+    return names, sizes, index
+
+
+def suggest_keywords(kwd: str, limit: int = 3) -> list[str]:
+    """Keywords similar to an unknown one, the most similar first.
+
+    Similarity is the Dice coefficient of the sets of n-grams, compared
+    regardless of case.
+    """
+    names, sizes, index = _ngram_index()
+    ngrams = _ngrams(kwd)
+    shared = collections.Counter()
+    for ngram in ngrams:
+        shared.update(index.get(ngram, ()))
+
+    scored = []
+    for i, n in shared.items():
+        score = 2 * n / (len(ngrams) + sizes[i])
+        if score >= SUGGESTION_CUTOFF:
+            scored.append((-score, names[i]))
+    return [name for _, name in sorted(scored)[:limit]]
@@ -0,0 +1,2276 @@
+# This file was automatically generated by scripts/write_orca_tables.py,
+# do NOT modify manually!
+"""Compiled tables for the ORCA enums, see ``orca/definitions``."""
+
+# fmt: off
+# Docstrings of the enums
+DOCS = {
+    'PopleBasisSet': 'All Pople-style (X-YZG) basis sets in ORCA.\n\n    Naming convention for members includes a ``b`` at the start, a\n    lowercase ``p`` to denote a " + ".\n\n    Basis sets that use the asterisk shorthand (e.g. 6-31G* or 6-31G**)\n    are not explicitly written here as the asterisk shorthand maps to\n    existing basis sets. One asterisk is equivalent to (d), and two\n    asterisks is equivalent to (d,p).\n\n    For example, 6-31G* translates to 6-31G(d), and 6-31G** translates\n    to 6-31G(d,p).\n    ',
+    'def2BasisSet': 'Karlsruhe def2 family of basis sets.',
+    'JensenBasisSet': 'Jensen polarization-consistent basis sets and their variants.',
+    'ccBasisSet': 'Correlation Consistent basis sets, cc-pVnZ.',
+    'RelativisticBasisSet': 'Relativistic basis sets for the DKH, ZORA, or X2C approaches.',
+    'AuxJBasisSet': 'Coulomb-fitting auxiliary basis sets.',
+    'AuxJKBasisSet': 'Coulomb- and exchange-fitting auxiliary basis sets.',
+    'AuxCBasisSet': 'Auxiliary basis sets for correlated wavefunction methods.',
+    'Functionals': 'Enumeration of all density functionals available via simple\n    input keyword.\n\n    Notes\n    -----\n    Functionals that already have a dispersion correction in their name\n    are marked as having no dispersion corrections available. This is\n    because trying to add a dispersion correction keyword to these\n    functionals is either redundant or incorrect.\n\n    Three functionals have a dispersion correction in their name,\n    B97M-V, ωB97M-V, and ωB97X-V, but are marked with ``Disp.SCNL``.\n    This is because these functionals, by default, use the\n    non-self-consistent version of the NL correction, but it is still\n    possible to switch on the self-consistent version with the SCNL\n    keyword.\n    ',
+    'Solvent': 'Solvents available through the CPCM, SMD, or COSMO-RS methods.',
+    'XTBSolvent': 'Solvents available through the ALPB, ddCOSMO, or CPCMX methods.\n\n    Notes\n    -----\n    Only the ALPB method is available through the native ORCA GFN1- and\n    GFN2-xTB implementations.\n    ',
+    'SimpleLibXC': 'LibXC functionals available as simple input keywords.',
+    'ExchangeLibXC': 'LibXC exchange functionals.',
+    'CorrelationLibXC': 'LibXC correlation functionals.',
+    'ExCorrLibXC': 'LibXC exchange-correlation functionals.',
+}
+
+# Member name, basis name, element ranges, ECP, ECP element ranges
+BASIS_SETS = {
+    'PopleBasisSet': (
+        ('bSTO_3G', 'STO-3G', ('H-I',), None, None),
+        ('b3_21G', '3-21G', ('H-Cs',), None, None),
+        ('b3_21GSP', '3-21GSP', ('H-Ar',), None, None),
+        ('b4_22GSP', '4-22GSP', ('H-Ar',), None, None),
+        ('b6_31G', '6-31G', ('H-Zn',), None, None),
+        ('b6_31G_D', '6-31G(d)', ('H-Zn',), None, None),
+        ('b6_31G_D_P', '6-31G(d,p)', ('H-Zn',), None, None),
+        ('b6_31G_2D', '6-31G(2d)', ('H-Zn',), None, None),
+        ('b6_31G_2D_P', '6-31G(2d,p)', ('H-Zn',), None, None),
+        ('b6_31G_2D_2P', '6-31G(2d,2p)', ('H-Zn',), None, None),
+        ('b6_31G_2DF', '6-31G(2df)', ('H-Zn',), None, None),
+        ('b6_31G_2DF_2P', '6-31G(2df,2p)', ('H-Zn',), None, None),
+        ('b6_31G_2DF_2PD', '6-31G(2df,2pd)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_G_D', '6-31+G(d)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_G_D_P', '6-31+G(d,p)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_G_2D', '6-31+G(2d)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_G_2D_P', '6-31+G(2d,p)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_G_2D_2P', '6-31+G(2d,2p)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_G_2DF', '6-31+G(2df)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_G_2DF_2P', '6-31+G(2df,2p)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_G_2DF_2PD', '6-31+G(2df,2pd)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_PLUS_G_D_P', '6-31++G(d,p)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_PLUS_G_2D_P', '6-31++G(2d,p)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_PLUS_G_2D_2P', '6-31++G(2d,2p)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_PLUS_G_2DF_2P', '6-31++G(2df,2p)', ('H-Zn',), None, None),
+        ('b6_31_PLUS_PLUS_G_2DF_2PD', '6-31++G(2df,2pd)', ('H-Zn',), None, None),
+        ('b6_311G', '6-311G', ('H-Br',), None, None),
+        ('b6_311G_D', '6-311G(d)', ('H-Br',), None, None),
+        ('b6_311G_D_P', '6-311G(d,p)', ('H-Br',), None, None),
+        ('b6_311G_2D', '6-311G(2d)', ('H-Br',), None, None),
+        ('b6_311G_2D_P', '6-311G(2d,p)', ('H-Br',), None, None),
+        ('b6_311G_2D_2P', '6-311G(2d,2p)', ('H-Br',), None, None),
+        ('b6_311G_2DF', '6-311G(2df)', ('H-Br',), None, None),
+        ('b6_311G_2DF_2P', '6-311G(2df,2p)', ('H-Br',), None, None),
+        ('b6_311G_2DF_2PD', '6-311G(2df,2pd)', ('H-Br',), None, None),
+        ('b6_311G_3DF', '6-311G(3df)', ('H-Br',), None, None),
+        ('b6_311G_3DF_3PD', '6-311G(3df,3pd)', ('H-Br',), None, None),
+        ('b6_311_PLUS_G_D', '6-311+G(d)', ('H-Br',), None, None),
+        ('b6_311_PLUS_G_D_P', '6-311+G(d,p)', ('H-Br',), None, None),
+        ('b6_311_PLUS_G_2D', '6-311+G(2d)', ('H-Br',), None, None),
+        ('b6_311_PLUS_G_2D_P', '6-311+G(2d,p)', ('H-Br',), None, None),
+        ('b6_311_PLUS_G_2D_2P', '6-311+G(2d,2p)', ('H-Br',), None, None),
+        ('b6_311_PLUS_G_2DF', '6-311+G(2df)', ('H-Br',), None, None),
+        ('b6_311_PLUS_G_2DF_2P', '6-311+G(2df,2p)', ('H-Br',), None, None),
+        ('b6_311_PLUS_G_2DF_2PD', '6-311+G(2df,2pd)', ('H-Br',), None, None),
+        ('b6_311_PLUS_G_3DF', '6-311+G(3df)', ('H-Br',), None, None),
+        ('b6_311_PLUS_G_3DF_2P', '6-311+G(3df,2p)', ('H-Br',), None, None),
+        ('b6_311_PLUS_G_3DF_3PD', '6-311+G(3df,3pd)', ('H-Br',), None, None),
+        ('b6_311_PLUS_PLUS_G_D_P', '6-311++G(d,p)', ('H-Br',), None, None),
+        ('b6_311_PLUS_PLUS_G_2D_P', '6-311++G(2d,p)', ('H-Br',), None, None),
+        ('b6_311_PLUS_PLUS_G_2D_2P', '6-311++G(2d,2p)', ('H-Br',), None, None),
+        ('b6_311_PLUS_PLUS_G_2DF_2P', '6-311++G(2df,2p)', ('H-Br',), None, None),
+        ('b6_311_PLUS_PLUS_G_2DF_2PD', '6-311++G(2df,2pd)', ('H-Br',), None, None),
+        ('b6_311_PLUS_PLUS_G_3DF_3PD', '6-311++G(3df,3pd)', ('H-Br',), None, None),
+        ('bm6_31G', 'm6-31G', ('Sc-Cu',), None, None),
+        ('bm6_31G_STAR', 'm6-31G*', ('Sc-Cu',), None, None),
+    ),
+    'def2BasisSet': (
+        ('DEF2_SVP', 'def2-SVP', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('DEF2_SV_P_', 'def2-SV(P)', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('DEF2_TZVP', 'def2-TZVP', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('DEF2_TZVP_F_', 'def2-TZVP(-f)', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('DEF2_TZVPP', 'def2-TZVPP', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('DEF2_QZVP', 'def2-QZVP', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('DEF2_QZVPP', 'def2-QZVPP', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('DEF2_SVPD', 'def2-SVPD', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('DEF2_TZVPD', 'def2-TZVPD', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('DEF2_TZVPPD', 'def2-TZVPPD', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('DEF2_QZVPD', 'def2-QZVPD', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('DEF2_QZVPPD', 'def2-QZVPPD', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('MA_DEF2_SVP', 'ma-def2-SVP', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('MA_DEF2_SV_P_', 'ma-def2-SV(P)', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('MA_DEF2_MSVP', 'ma-def2-mSVP', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('MA_DEF2_TZVP', 'ma-def2-TZVP', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('MA_DEF2_TZVP_F_', 'ma-def2-TZVP(-f)', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('MA_DEF2_TZVPP', 'ma-def2-TZVPP', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+        ('MA_DEF2_QZVPP', 'ma-def2-QZVPP', ('H-Rn',), 'def2-ECP', ('Rb-Rn',)),
+    ),
+    'JensenBasisSet': (
+        ('PC_0', 'pc-0', ('H-Ca', 'Ga-Kr'), None, None),
+        ('PC_1', 'pc-1', ('H-Kr',), None, None),
+        ('PC_2', 'pc-2', ('H-Kr',), None, None),
+        ('PC_3', 'pc-3', ('H-Kr',), None, None),
+        ('PC_4', 'pc-4', ('H-Kr',), None, None),
+        ('AUG_PC_0', 'aug-pc-0', ('H-Ca', 'Ga-Kr'), None, None),
+        ('AUG_PC_1', 'aug-pc-1', ('H-Kr',), None, None),
+        ('AUG_PC_2', 'aug-pc-2', ('H-Kr',), None, None),
+        ('AUG_PC_3', 'aug-pc-3', ('H-Kr',), None, None),
+        ('AUG_PC_4', 'aug-pc-4', ('H-Kr',), None, None),
+        ('PCSEG_0', 'pcseg-0', ('H-Kr',), None, None),
+        ('PCSEG_1', 'pcseg-1', ('H-Kr',), None, None),
+        ('PCSEG_2', 'pcseg-2', ('H-Kr',), None, None),
+        ('PCSEG_3', 'pcseg-3', ('H-Kr',), None, None),
+        ('PCSEG_4', 'pcseg-4', ('H-Kr',), None, None),
+        ('AUG_PCSEG_0', 'aug-pcseg-0', ('H-Kr',), None, None),
+        ('AUG_PCSEG_1', 'aug-pcseg-1', ('H-Kr',), None, None),
+        ('AUG_PCSEG_2', 'aug-pcseg-2', ('H-Kr',), None, None),
+        ('AUG_PCSEG_3', 'aug-pcseg-3', ('H-Kr',), None, None),
+        ('AUG_PCSEG_4', 'aug-pcseg-4', ('H-Kr',), None, None),
+        ('PCSSEG_0', 'pcSseg-0', ('H-Kr',), None, None),
+        ('PCSSEG_1', 'pcSseg-1', ('H-Kr',), None, None),
+        ('PCSSEG_2', 'pcSseg-2', ('H-Kr',), None, None),
+        ('PCSSEG_3', 'pcSseg-3', ('H-Kr',), None, None),
+        ('PCSSEG_4', 'pcSseg-4', ('H-Kr',), None, None),
+        ('AUG_PCSSEG_0', 'aug-pcSseg-0', ('H-Kr',), None, None),
+        ('AUG_PCSSEG_1', 'aug-pcSseg-1', ('H-Kr',), None, None),
+        ('AUG_PCSSEG_2', 'aug-pcSseg-2', ('H-Kr',), None, None),
+        ('AUG_PCSSEG_3', 'aug-pcSseg-3', ('H-Kr',), None, None),
+        ('AUG_PCSSEG_4', 'aug-pcSseg-4', ('H-Kr',), None, None),
+        ('PCJ_0', 'pcJ-0', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('PCJ_1', 'pcJ-1', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('PCJ_2', 'pcJ-2', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('PCJ_3', 'pcJ-3', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('PCJ_4', 'pcJ-4', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('AUG_PCJ_0', 'aug-pcJ-0', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('AUG_PCJ_1', 'aug-pcJ-1', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('AUG_PCJ_2', 'aug-pcJ-2', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('AUG_PCJ_3', 'aug-pcJ-3', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('AUG_PCJ_4', 'aug-pcJ-4', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('PCH_1', 'pcH-1', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('PCH_2', 'pcH-2', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('PCH_3', 'pcH-3', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('PCH_4', 'pcH-4', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('AUG_PCH_1', 'aug-pcH-1', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('AUG_PCH_2', 'aug-pcH-2', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('AUG_PCH_3', 'aug-pcH-3', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('AUG_PCH_4', 'aug-pcH-4', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('PCX_1', 'pcX-1', ('Li-Ar',), None, None),
+        ('PCX_2', 'pcX-2', ('Li-Ar',), None, None),
+        ('PCX_3', 'pcX-3', ('Li-Ar',), None, None),
+        ('PCX_4', 'pcX-4', ('Li-Ar',), None, None),
+        ('AUG_PCX_1', 'aug-pcX-1', ('Li-Ar',), None, None),
+        ('AUG_PCX_2', 'aug-pcX-2', ('Li-Ar',), None, None),
+        ('AUG_PCX_3', 'aug-pcX-3', ('Li-Ar',), None, None),
+        ('AUG_PCX_4', 'aug-pcX-4', ('Li-Ar',), None, None),
+    ),
+    'ccBasisSet': (
+        ('CC_PVDZ', 'cc-pVDZ', ('H-Ar', 'Ca-Kr'), None, None),
+        ('CC_PVTZ', 'cc-pVTZ', ('H-Ar', 'Ca-Kr', 'Y', 'Ag', 'Au'), None, None),
+        ('CC_PVQZ', 'cc-pVQZ', ('H-Ar', 'Ca-Kr'), None, None),
+        ('CC_PV5Z', 'cc-pV5Z', ('H-Ar', 'Ca-Kr'), None, None),
+        ('CC_PV6Z', 'cc-pV6Z', ('H-He', 'Be-Ne', 'Al-Ar'), None, None),
+        ('AUG_CC_PVDZ', 'aug-cc-pVDZ', ('H-Ar', 'Sc-Kr'), None, None),
+        ('AUG_CC_PVTZ', 'aug-cc-pVTZ', ('H-Ar', 'Sc-Kr', 'Ag', 'Au'), None, None),
+        ('AUG_CC_PVQZ', 'aug-cc-pVQZ', ('H-Ar', 'Sc-Kr'), None, None),
+        ('AUG_CC_PV5Z', 'aug-cc-pV5Z', ('H-Ar', 'Sc-Kr'), None, None),
+        ('AUG_CC_PV6Z', 'aug-cc-pV6Z', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('CC_PVD_PLUS_D_Z', 'cc-pVD(+d)Z', ('Na-Ar',), None, None),
+        ('CC_PVT_PLUS_D_Z', 'cc-pVT(+d)Z', ('Na-Ar',), None, None),
+        ('CC_PVQ_PLUS_D_Z', 'cc-pVQ(+d)Z', ('Na-Ar',), None, None),
+        ('CC_PV5_PLUS_D_Z', 'cc-pV5(+d)Z', ('Na-Ar',), None, None),
+        ('AUG_CC_PVD_PLUS_D_Z', 'aug-cc-pVD(+d)Z', ('Al-Ar',), None, None),
+        ('AUG_CC_PVT_PLUS_D_Z', 'aug-cc-pVT(+d)Z', ('Al-Ar',), None, None),
+        ('AUG_CC_PVQ_PLUS_D_Z', 'aug-cc-pVQ(+d)Z', ('Al-Ar',), None, None),
+        ('AUG_CC_PV5_PLUS_D_Z', 'aug-cc-pV5(+d)Z', ('Al-Ar',), None, None),
+        ('AUG_CC_PV6_PLUS_D_Z', 'aug-cc-pV6(+d)Z', ('Al-Ar',), None, None),
+        ('APR_CC_PV_Q_PLUS_D_Z', 'apr-cc-pV(Q+d)Z', ('H-Ar',), None, None),
+        ('MAY_CC_PV_T_PLUS_D_Z', 'may-cc-pV(T+d)Z', ('H-Ar',), None, None),
+        ('MAY_CC_PV_Q_PLUS_D_Z', 'may-cc-pV(Q+d)Z', ('H-Ar',), None, None),
+        ('JUN_CC_PV_D_PLUS_D_Z', 'jun-cc-pV(D+d)Z', ('H-Ar',), None, None),
+        ('JUN_CC_PV_T_PLUS_D_Z', 'jun-cc-pV(T+d)Z', ('H-Ar',), None, None),
+        ('JUN_CC_PV_Q_PLUS_D_Z', 'jun-cc-pV(Q+d)Z', ('H-Ar',), None, None),
+        ('JUL_CC_PV_D_PLUS_D_Z', 'jul-cc-pV(D+d)Z', ('H-Ar',), None, None),
+        ('JUL_CC_PV_T_PLUS_D_Z', 'jul-cc-pV(T+d)Z', ('H-Ar',), None, None),
+        ('JUL_CC_PV_Q_PLUS_D_Z', 'jul-cc-pV(Q+d)Z', ('H-Ar',), None, None),
+        ('MAUG_CC_PV_D_PLUS_D_Z', 'maug-cc-pV(D+d)Z', ('H-Ar',), None, None),
+        ('MAUG_CC_PV_T_PLUS_D_Z', 'maug-cc-pV(T+d)Z', ('H-Ar',), None, None),
+        ('MAUG_CC_PV_Q_PLUS_D_Z', 'maug-cc-pV(Q+d)Z', ('H-Ar',), None, None),
+        ('CC_PCVDZ', 'cc-pCVDZ', ('H-Ar', 'Ca', 'Ga-Kr'), None, None),
+        ('CC_PCVTZ', 'cc-pCVTZ', ('H-Ar', 'Ca', 'Ga-Kr'), None, None),
+        ('CC_PCVQZ', 'cc-pCVQZ', ('H-Ar', 'Ca', 'Ga-Kr'), None, None),
+        ('CC_PCV5Z', 'cc-pCV5Z', ('H-Ar', 'Ca', 'Ga-Kr'), None, None),
+        ('CC_PCV6Z', 'cc-pCV6Z', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('AUG_CC_PCVDZ', 'aug-cc-pCVDZ', ('H-Ar', 'Ga-Kr'), None, None),
+        ('AUG_CC_PCVTZ', 'aug-cc-pCVTZ', ('H-Ar', 'Ga-Kr'), None, None),
+        ('AUG_CC_PCVQZ', 'aug-cc-pCVQZ', ('H-Ar', 'Ga-Kr'), None, None),
+        ('AUG_CC_PCV5Z', 'aug-cc-pCV5Z', ('H-Ar', 'Ga-Kr'), None, None),
+        ('AUG_CC_PCV6Z', 'aug-cc-pCV6Z', ('H-He', 'B-Ne', 'Al-Ar'), None, None),
+        ('CC_PWCVDZ', 'cc-pwCVDZ', ('H-Ar', 'Ca', 'Ga-Kr'), None, None),
+        ('CC_PWCVTZ', 'cc-pwCVTZ', ('H-Ar', 'Ca-Kr', 'Ag', 'Au'), None, None),
+        ('CC_PWCVQZ', 'cc-pwCVQZ', ('H-Ar', 'Ca-Kr'), None, None),
+        ('CC_PWCV5Z', 'cc-pwCV5Z', ('H-Ar', 'Ca-Kr'), None, None),
+        ('AUG_CC_PWCVDZ', 'aug-cc-pwCVDZ', ('H-Ar', 'Ga-Kr'), None, None),
+        ('AUG_CC_PWCVTZ', 'aug-cc-pwCVTZ', ('H-Ar', 'Sc-Kr', 'Ag', 'Au'), None, None),
+        ('AUG_CC_PWCVQZ', 'aug-cc-pwCVQZ', ('H-Ar', 'Sc-Kr'), None, None),
+        ('AUG_CC_PWCV5Z', 'aug-cc-pwCV5Z', ('H-Ar', 'Sc-Kr'), None, None),
+    ),
+    'RelativisticBasisSet': (
+        ('DKH_SV_P_', 'DKH-SV(P)', ('H-Kr',), None, None),
+        ('DKH_SVP', 'DKH-SVP', ('H-Kr',), None, None),
+        ('DKH_TZV_P_', 'DKH-TZV(P)', ('H-Kr',), None, None),
+        ('DKH_TZVP', 'DKH-TZVP', ('H-Kr',), None, None),
+        ('DKH_TZVPP', 'DKH-TZVPP', ('H-Kr',), None, None),
+        ('DKH_QZVP', 'DKH-QZVP', ('H-Kr',), None, None),
+        ('DKH_QZVPP', 'DKH-QZVPP', ('H-Kr',), None, None),
+        ('ZORA_SV_P_', 'ZORA-SV(P)', ('H-Kr',), None, None),
+        ('ZORA_SVP', 'ZORA-SVP', ('H-Kr',), None, None),
+        ('ZORA_TZV_P_', 'ZORA-TZV(P)', ('H-Kr',), None, None),
+        ('ZORA_TZVP', 'ZORA-TZVP', ('H-Kr',), None, None),
+        ('ZORA_TZVPP', 'ZORA-TZVPP', ('H-Kr',), None, None),
+        ('ZORA_QZVP', 'ZORA-QZVP', ('H-Kr',), None, None),
+        ('ZORA_QZVPP', 'ZORA-QZVPP', ('H-Kr',), None, None),
+        ('DKH_DEF2_SVP', 'DKH-def2-SVP', ('H-Kr',), None, None),
+        ('DKH_DEF2_SV_P_', 'DKH-def2-SV(P)', ('H-Kr',), None, None),
+        ('DKH_DEF2_TZVP', 'DKH-def2-TZVP', ('H-Kr',), None, None),
+        ('DKH_DEF2_TZVP_F_', 'DKH-def2-TZVP(-f)', ('H-Kr',), None, None),
+        ('DKH_DEF2_TZVPP', 'DKH-def2-TZVPP', ('H-Kr',), None, None),
+        ('DKH_DEF2_QZVPP', 'DKH-def2-QZVPP', ('H-Kr',), None, None),
+        ('ZORA_DEF2_SVP', 'ZORA-def2-SVP', ('H-Kr',), None, None),
+        ('ZORA_DEF2_SV_P_', 'ZORA-def2-SV(P)', ('H-Kr',), None, None),
+        ('ZORA_DEF2_TZVP', 'ZORA-def2-TZVP', ('H-Kr',), None, None),
+        ('ZORA_DEF2_TZVP_F_', 'ZORA-def2-TZVP(-f)', ('H-Kr',), None, None),
+        ('ZORA_DEF2_TZVPP', 'ZORA-def2-TZVPP', ('H-Kr',), None, None),
+        ('ZORA_DEF2_QZVPP', 'ZORA-def2-QZVPP', ('H-Kr',), None, None),
+        ('MA_DKH_DEF2_SVP', 'ma-DKH-def2-SVP', ('H-Kr',), None, None),
+        ('MA_DKH_DEF2_SV_P_', 'ma-DKH-def2-SV(P)', ('H-Kr',), None, None),
+        ('MA_DKH_DEF2_TZVP', 'ma-DKH-def2-TZVP', ('H-Kr',), None, None),
+        ('MA_DKH_DEF2_TZVP_F_', 'ma-DKH-def2-TZVP(-f)', ('H-Kr',), None, None),
+        ('MA_DKH_DEF2_TZVPP', 'ma-DKH-def2-TZVPP', ('H-Kr',), None, None),
+        ('MA_DKH_DEF2_QZVPP', 'ma-DKH-def2-QZVPP', ('H-Kr',), None, None),
+        ('MA_ZORA_DEF2_SVP', 'ma-ZORA-def2-SVP', ('H-Kr',), None, None),
+        ('MA_ZORA_DEF2_SV_P_', 'ma-ZORA-def2-SV(P)', ('H-Kr',), None, None),
+        ('MA_ZORA_DEF2_TZVP', 'ma-ZORA-def2-TZVP', ('H-Kr',), None, None),
+        ('MA_ZORA_DEF2_TZVP_F_', 'ma-ZORA-def2-TZVP(-f)', ('H-Kr',), None, None),
+        ('MA_ZORA_DEF2_TZVPP', 'ma-ZORA-def2-TZVPP', ('H-Kr',), None, None),
+        ('MA_ZORA_DEF2_QZVPP', 'ma-ZORA-def2-QZVPP', ('H-Kr',), None, None),
+        ('SARC_DKH_SVP', 'SARC-DKH-SVP', ('Hf-Hg',), None, None),
+        ('SARC_DKH_TZVP', 'SARC-DKH-TZVP', ('Rb-Rn', 'Ac-Lr'), None, None),
+        ('SARC_DKH_TZVPP', 'SARC-DKH-TZVPP', ('Rb-Rn', 'Ac-Lr'), None, None),
+        ('SARC_ZORA_SVP', 'SARC-ZORA-SVP', ('Hf-Hg',), None, None),
+        ('SARC_ZORA_TZVP', 'SARC-ZORA-TZVP', ('Rb-Rn', 'Ac-Lr'), None, None),
+        ('SARC_ZORA_TZVPP', 'SARC-ZORA-TZVPP', ('Rb-Rn', 'Ac-Lr'), None, None),
+        ('SARC2_DKH_QZV', 'SARC2-DKH-QZV', ('La-Lu',), None, None),
+        ('SARC2_DKH_QZVP', 'SARC2-DKH-QZVP', ('La-Lu',), None, None),
+        ('SARC2_ZORA_QZV', 'SARC2-ZORA-QZV', ('La-Lu',), None, None),
+        ('SARC2_ZORA_QZVP', 'SARC2-ZORA-QZVP', ('La-Lu',), None, None),
+        ('X2C_SV_P_ALL', 'x2c-SV(P)all', ('H-Rn',), None, None),
+        ('X2C_SVPALL', 'x2c-SVPall', ('H-Rn',), None, None),
+        ('X2C_TZVPALL', 'x2c-TZVPall', ('H-Rn',), None, None),
+        ('X2C_TZVPPALL', 'x2c-TZVPPall', ('H-Rn',), None, None),
+        ('X2C_QZVPALL', 'x2c-QZVPall', ('H-Rn',), None, None),
+        ('X2C_QZVPPALL', 'x2c-QZVPPall', ('H-Rn',), None, None),
+        ('X2C_SV_P_ALL_S', 'x2c-SV(P)all-s', ('H-Rn',), None, None),
+        ('X2C_SVPALL_S', 'x2c-SVPall-s', ('H-Rn',), None, None),
+        ('X2C_TZVPALL_S', 'x2c-TZVPall-s', ('H-Rn',), None, None),
+        ('X2C_TZVPPALL_S', 'x2c-TZVPPall-s', ('H-Rn',), None, None),
+        ('X2C_QZVPALL_S', 'x2c-QZVPall-s', ('H-Rn',), None, None),
+        ('X2C_QZVPPALL_S', 'x2c-QZVPPall-s', ('H-Rn',), None, None),
+        ('CC_PVDZ_DK', 'cc-pVDZ-DK', ('H-Ar', 'Sc-Kr'), None, None),
+        ('CC_PVTZ_DK', 'cc-pVTZ-DK', ('H-Ar', 'Sc-Kr', 'Y-Xe', 'Hf-Rn'), None, None),
+        ('CC_PVQZ_DK', 'cc-pVQZ-DK', ('H-Ar', 'Sc-Kr', 'In-Xe', 'Tl-Rn'), None, None),
+        ('CC_PV5Z_DK', 'cc-pV5Z-DK', ('H-Ar', 'Sc-Kr'), None, None),
+        ('CC_PVDZ_DK3', 'cc-pVDZ-DK3', ('U',), None, None),
+        ('CC_PVTZ_DK3', 'cc-pVTZ-DK3', ('U',), None, None),
+        ('CC_PVQZ_DK3', 'cc-pVQZ-DK3', ('U',), None, None),
+        ('AUG_CC_PVDZ_DK', 'aug-cc-pVDZ-DK', ('H-Ar', 'Sc-Kr'), None, None),
+        ('AUG_CC_PVTZ_DK', 'aug-cc-pVTZ-DK', ('H-Ar', 'Sc-Kr', 'Y-Xe', 'Hf-Rn'), None, None),
+        ('AUG_CC_PVQZ_DK', 'aug-cc-pVQZ-DK', ('H-Ar', 'Sc-Kr', 'In-Xe', 'Tl-Rn'), None, None),
+        ('AUG_CC_PV5Z_DK', 'aug-cc-pV5Z-DK', ('H-Ar', 'Sc-Kr'), None, None),
+        ('CC_PWCVDZ_DK', 'cc-pwCVDZ-DK', ('H-Be', 'Na-Mg', 'Ca-Zn'), None, None),
+        ('CC_PWCVTZ_DK', 'cc-pwCVTZ-DK', ('H-Be', 'Na-Mg', 'Ca-Zn', 'Y-Xe', 'Hf-Rn'), None, None),
+        ('CC_PWCVQZ_DK', 'cc-pwCVQZ-DK', ('H-Be', 'Na-Mg', 'Ca-Zn', 'In-Xe', 'Tl-Rn'), None, None),
+        ('CC_PWCV5Z_DK', 'cc-pwCV5Z-DK', ('H-Be', 'Na-Mg', 'Ca-Zn'), None, None),
+        ('CC_PWCVDZ_DK3', 'cc-pwCVDZ-DK3', ('U',), None, None),
+        ('CC_PWCVTZ_DK3', 'cc-pwCVTZ-DK3', ('U',), None, None),
+        ('CC_PWCVQZ_DK3', 'cc-pwCVQZ-DK3', ('U',), None, None),
+        ('AUG_CC_PWCVDZ_DK', 'aug-cc-pwCVDZ-DK', ('H-Be', 'Na-Mg', 'Sc-Zn'), None, None),
+        ('AUG_CC_PWCVTZ_DK', 'aug-cc-pwCVTZ-DK', ('H-Be', 'Na-Mg', 'Sc-Zn', 'Y-Xe', 'Hf-Rn'), None, None),
+        ('AUG_CC_PWCVQZ_DK', 'aug-cc-pwCVQZ-DK', ('H-Be', 'Na-Mg', 'Sc-Zn', 'In-Xe', 'Tl-Rn'), None, None),
+        ('AUG_CC_PWCV5Z_DK', 'aug-cc-pwCV5Z-DK', ('H-Be', 'Na-Mg', 'Sc-Zn'), None, None),
+        ('ANO_RCC_Full', 'ANO-RCC-Full', ('H-Cm',), None, None),
+        ('ANO_RCC_DZP', 'ANO-RCC-DZP', ('H-Cm',), None, None),
+        ('ANO_RCC_TZP', 'ANO-RCC-TZP', ('H-Cm',), None, None),
+        ('ANO_RCC_QZP', 'ANO-RCC-QZP', ('H-Cm',), None, None),
+    ),
+}
+
+# Member name, basis name, element ranges, primary basis family
+AUX_BASIS_SETS = {
+    'AuxJBasisSet': (
+        ('DEF2_J', 'def2/J', ('H-Lr',), 'def2BasisSet'),
+        ('DEF2_MTZVP_J', 'def2-mTZVP/J', ('H-Lr',), 'def2BasisSet'),
+        ('DEF2_MTZVPP_J', 'def2-mTZVPP/J', ('H-Lr',), 'def2BasisSet'),
+        ('X2C_J', 'x2c/J', ('H-Rn',), 'RelativisticBasisSet'),
+        ('SARC_J', 'SARC/J', ('H-Rn', 'Ac-Lr'), 'RelativisticBasisSet'),
+    ),
+    'AuxJKBasisSet': (
+        ('DEF2_JK', 'def2/JK', ('H-Rn',), 'def2BasisSet'),
+        ('DEF2_JK_SMALL', 'def2/JKsmall', ('H-Ra', 'Th-Lr'), 'def2BasisSet'),
+        ('CC_PVTZ_JK', 'cc-pVTZ/JK', ('H', 'B-F', 'Al-Cl', 'Ga-Br'), 'ccBasisSet'),
+        ('CC_PVQZ_JK', 'cc-pVQZ/JK', ('H', 'B-F', 'Al-Cl', 'Ga-Br'), 'ccBasisSet'),
+        ('CC_PV5Z_JK', 'cc-pV5Z/JK', ('H', 'B-F', 'Al-Cl', 'Ga-Br'), 'ccBasisSet'),
+        ('AUG_CC_PVTZ_JK', 'aug-cc-pVTZ/JK', ('H', 'B-F', 'Al-Cl', 'Ga-Br'), 'ccBasisSet'),
+        ('AUG_CC_PVQZ_JK', 'aug-cc-pVQZ/JK', ('H', 'B-F', 'Al-Cl', 'Ga-Br'), 'ccBasisSet'),
+        ('AUG_CC_PV5Z_JK', 'aug-cc-pV5Z/JK', ('H', 'B-F', 'Al-Cl', 'Ga-Br'), 'ccBasisSet'),
+        ('SARC2_DKH_QZV_JK', 'SARC2-DKH-QZV/JK', ('La-Lu',), 'RelativisticBasisSet'),
+        ('SARC2_DKH_QZVP_JK', 'SARC2-DKH-QZVP/JK', ('La-Lu',), 'RelativisticBasisSet'),
+        ('SARC2_ZORA_QZV_JK', 'SARC2-ZORA-QZV/JK', ('La-Lu',), 'RelativisticBasisSet'),
+        ('SARC2_ZORA_QZVP_JK', 'SARC2-ZORA-QZVP/JK', ('La-Lu',), 'RelativisticBasisSet'),
+    ),
+    'AuxCBasisSet': (
+        ('DEF2_SVP_C', 'def2-SVP/C', ('H-Rn',), 'def2BasisSet'),
+        ('DEF2_TZVP_C', 'def2-TZVP/C', ('H-Rn',), 'def2BasisSet'),
+        ('DEF2_TZVPP_C', 'def2-TZVPP/C', ('H-Rn',), 'def2BasisSet'),
+        ('DEF2_QZVPP_C', 'def2-QZVPP/C', ('H-Rn',), 'def2BasisSet'),
+        ('DEF2_SVPD_C', 'def2-SVPD/C', ('H-La', 'Hf-Rn'), 'def2BasisSet'),
+        ('DEF2_TZVPD_C', 'def2-TZVPD/C', ('H-La', 'Hf-Rn'), 'def2BasisSet'),
+        ('DEF2_TZVPPD_C', 'def2-TZVPPD/C', ('H-La', 'Hf-Rn'), 'def2BasisSet'),
+        ('DEF2_QZVPPD_C', 'def2-QZVPPD/C', ('H-La', 'Hf-Rn'), 'def2BasisSet'),
+        ('CC_PVDZ_C', 'cc-pVDZ/C', ('H-Ar', 'Ga-Kr'), 'ccBasisSet'),
+        ('CC_PVTZ_C', 'cc-pVTZ/C', ('H-Ar', 'Sc-Kr'), 'ccBasisSet'),
+        ('CC_PVQZ_C', 'cc-pVQZ/C', ('H-Ar', 'Sc-Kr'), 'ccBasisSet'),
+        ('CC_PV5Z_C', 'cc-pV5Z/C', ('H-Ar', 'Ga-Kr'), 'ccBasisSet'),
+        ('CC_PV6Z_C', 'cc-pV6Z/C', ('H-He', 'B-Ne', 'Al-Ar'), 'ccBasisSet'),
+        ('AUG_CC_PVDZ_C', 'aug-cc-pVDZ/C', ('H-He', 'Be-Ne', 'Mg-Ar', 'Ga-Kr'), 'ccBasisSet'),
+        ('AUG_CC_PVTZ_C', 'aug-cc-pVTZ/C', ('H-He', 'Be-Ne', 'Mg-Ar', 'Sc-Kr'), 'ccBasisSet'),
+        ('AUG_CC_PVQZ_C', 'aug-cc-pVQZ/C', ('H-He', 'Be-Ne', 'Mg-Ar', 'Sc-Kr'), 'ccBasisSet'),
+        ('AUG_CC_PV5Z_C', 'aug-cc-pV5Z/C', ('H-Ne', 'Al-Ar', 'Ga-Kr'), 'ccBasisSet'),
+        ('AUG_CC_PV6Z_C', 'aug-cc-pV6Z/C', ('H-He', 'B-Ne', 'Al-Ar'), 'ccBasisSet'),
+        ('CC_PWCVDZ_C', 'cc-pwCVDZ/C', ('H-He', 'B-Ne', 'Al-Ar', 'Ga-Kr'), 'ccBasisSet'),
+        ('CC_PWCVTZ_C', 'cc-pwCVTZ/C', ('H-He', 'B-Ne', 'Al-Ar', 'Sc-Kr'), 'ccBasisSet'),
+        ('CC_PWCVQZ_C', 'cc-pwCVQZ/C', ('H-He', 'B-Ne', 'Al-Ar', 'Ga-Kr'), 'ccBasisSet'),
+        ('CC_PWCV5Z_C', 'cc-pwCV5Z/C', ('H-Ne', 'Al-Ar'), 'ccBasisSet'),
+        ('AUG_CC_PWCVDZ_C', 'aug-cc-pwCVDZ/C', ('H-He', 'B-Ne', 'Al-Ar', 'Ga-Kr'), 'ccBasisSet'),
+        ('AUG_CC_PWCVTZ_C', 'aug-cc-pwCVTZ/C', ('H-He', 'B-Ne', 'Al-Ar', 'Sc-Kr'), 'ccBasisSet'),
+        ('AUG_CC_PWCVQZ_C', 'aug-cc-pwCVQZ/C', ('H-He', 'B-Ne', 'Al-Ar', 'Ga-Kr'), 'ccBasisSet'),
+        ('AUG_CC_PWCV5Z_C', 'aug-cc-pwCV5Z/C', ('H-Ne', 'Al-Ar'), 'ccBasisSet'),
+    ),
+}
+
+# Basis name to the bitmask of the elements it is defined for
+ELEMENT_MASKS = {
+    'STO-3G': 0x3ffffffffffffe,
+    '3-21G': 0xfffffffffffffe,
+    '3-21GSP': 0x7fffe,
+    '4-22GSP': 0x7fffe,
+    '6-31G': 0x7ffffffe,
+    '6-31G(d)': 0x7ffffffe,
+    '6-31G(d,p)': 0x7ffffffe,
+    '6-31G(2d)': 0x7ffffffe,
+    '6-31G(2d,p)': 0x7ffffffe,
+    '6-31G(2d,2p)': 0x7ffffffe,
+    '6-31G(2df)': 0x7ffffffe,
+    '6-31G(2df,2p)': 0x7ffffffe,
+    '6-31G(2df,2pd)': 0x7ffffffe,
+    '6-31+G(d)': 0x7ffffffe,
+    '6-31+G(d,p)': 0x7ffffffe,
+    '6-31+G(2d)': 0x7ffffffe,
+    '6-31+G(2d,p)': 0x7ffffffe,
+    '6-31+G(2d,2p)': 0x7ffffffe,
+    '6-31+G(2df)': 0x7ffffffe,
+    '6-31+G(2df,2p)': 0x7ffffffe,
+    '6-31+G(2df,2pd)': 0x7ffffffe,
+    '6-31++G(d,p)': 0x7ffffffe,
+    '6-31++G(2d,p)': 0x7ffffffe,
+    '6-31++G(2d,2p)': 0x7ffffffe,
+    '6-31++G(2df,2p)': 0x7ffffffe,
+    '6-31++G(2df,2pd)': 0x7ffffffe,
+    '6-311G': 0xffffffffe,
+    '6-311G(d)': 0xffffffffe,
+    '6-311G(d,p)': 0xffffffffe,
+    '6-311G(2d)': 0xffffffffe,
+    '6-311G(2d,p)': 0xffffffffe,
+    '6-311G(2d,2p)': 0xffffffffe,
+    '6-311G(2df)': 0xffffffffe,
+    '6-311G(2df,2p)': 0xffffffffe,
+    '6-311G(2df,2pd)': 0xffffffffe,
+    '6-311G(3df)': 0xffffffffe,
+    '6-311G(3df,3pd)': 0xffffffffe,
+    '6-311+G(d)': 0xffffffffe,
+    '6-311+G(d,p)': 0xffffffffe,
+    '6-311+G(2d)': 0xffffffffe,
+    '6-311+G(2d,p)': 0xffffffffe,
+    '6-311+G(2d,2p)': 0xffffffffe,
+    '6-311+G(2df)': 0xffffffffe,
+    '6-311+G(2df,2p)': 0xffffffffe,
+    '6-311+G(2df,2pd)': 0xffffffffe,
+    '6-311+G(3df)': 0xffffffffe,
+    '6-311+G(3df,2p)': 0xffffffffe,
+    '6-311+G(3df,3pd)': 0xffffffffe,
+    '6-311++G(d,p)': 0xffffffffe,
+    '6-311++G(2d,p)': 0xffffffffe,
+    '6-311++G(2d,2p)': 0xffffffffe,
+    '6-311++G(2df,2p)': 0xffffffffe,
+    '6-311++G(2df,2pd)': 0xffffffffe,
+    '6-311++G(3df,3pd)': 0xffffffffe,
+    'm6-31G': 0x3fe00000,
+    'm6-31G*': 0x3fe00000,
+    'def2-SVP': 0x7ffffffffffffffffffffe,
+    'def2-SV(P)': 0x7ffffffffffffffffffffe,
+    'def2-TZVP': 0x7ffffffffffffffffffffe,
+    'def2-TZVP(-f)': 0x7ffffffffffffffffffffe,
+    'def2-TZVPP': 0x7ffffffffffffffffffffe,
+    'def2-QZVP': 0x7ffffffffffffffffffffe,
+    'def2-QZVPP': 0x7ffffffffffffffffffffe,
+    'def2-SVPD': 0x7ffffffffffffffffffffe,
+    'def2-TZVPD': 0x7ffffffffffffffffffffe,
+    'def2-TZVPPD': 0x7ffffffffffffffffffffe,
+    'def2-QZVPD': 0x7ffffffffffffffffffffe,
+    'def2-QZVPPD': 0x7ffffffffffffffffffffe,
+    'ma-def2-SVP': 0x7ffffffffffffffffffffe,
+    'ma-def2-SV(P)': 0x7ffffffffffffffffffffe,
+    'ma-def2-mSVP': 0x7ffffffffffffffffffffe,
+    'ma-def2-TZVP': 0x7ffffffffffffffffffffe,
+    'ma-def2-TZVP(-f)': 0x7ffffffffffffffffffffe,
+    'ma-def2-TZVPP': 0x7ffffffffffffffffffffe,
+    'ma-def2-QZVPP': 0x7ffffffffffffffffffffe,
+    'pc-0': 0x1f801ffffe,
+    'pc-1': 0x1ffffffffe,
+    'pc-2': 0x1ffffffffe,
+    'pc-3': 0x1ffffffffe,
+    'pc-4': 0x1ffffffffe,
+    'aug-pc-0': 0x1f801ffffe,
+    'aug-pc-1': 0x1ffffffffe,
+    'aug-pc-2': 0x1ffffffffe,
+    'aug-pc-3': 0x1ffffffffe,
+    'aug-pc-4': 0x1ffffffffe,
+    'pcseg-0': 0x1ffffffffe,
+    'pcseg-1': 0x1ffffffffe,
+    'pcseg-2': 0x1ffffffffe,
+    'pcseg-3': 0x1ffffffffe,
+    'pcseg-4': 0x1ffffffffe,
+    'aug-pcseg-0': 0x1ffffffffe,
+    'aug-pcseg-1': 0x1ffffffffe,
+    'aug-pcseg-2': 0x1ffffffffe,
+    'aug-pcseg-3': 0x1ffffffffe,
+    'aug-pcseg-4': 0x1ffffffffe,
+    'pcSseg-0': 0x1ffffffffe,
+    'pcSseg-1': 0x1ffffffffe,
+    'pcSseg-2': 0x1ffffffffe,
+    'pcSseg-3': 0x1ffffffffe,
+    'pcSseg-4': 0x1ffffffffe,
+    'aug-pcSseg-0': 0x1ffffffffe,
+    'aug-pcSseg-1': 0x1ffffffffe,
+    'aug-pcSseg-2': 0x1ffffffffe,
+    'aug-pcSseg-3': 0x1ffffffffe,
+    'aug-pcSseg-4': 0x1ffffffffe,
+    'pcJ-0': 0x7e7e6,
+    'pcJ-1': 0x7e7e6,
+    'pcJ-2': 0x7e7e6,
+    'pcJ-3': 0x7e7e6,
+    'pcJ-4': 0x7e7e6,
+    'aug-pcJ-0': 0x7e7e6,
+    'aug-pcJ-1': 0x7e7e6,
+    'aug-pcJ-2': 0x7e7e6,
+    'aug-pcJ-3': 0x7e7e6,
+    'aug-pcJ-4': 0x7e7e6,
+    'pcH-1': 0x7e7e6,
+    'pcH-2': 0x7e7e6,
+    'pcH-3': 0x7e7e6,
+    'pcH-4': 0x7e7e6,
+    'aug-pcH-1': 0x7e7e6,
+    'aug-pcH-2': 0x7e7e6,
+    'aug-pcH-3': 0x7e7e6,
+    'aug-pcH-4': 0x7e7e6,
+    'pcX-1': 0x7fff8,
+    'pcX-2': 0x7fff8,
+    'pcX-3': 0x7fff8,
+    'pcX-4': 0x7fff8,
+    'aug-pcX-1': 0x7fff8,
+    'aug-pcX-2': 0x7fff8,
+    'aug-pcX-3': 0x7fff8,
+    'aug-pcX-4': 0x7fff8,
+    'cc-pVDZ': 0x1ffff7fffe,
+    'cc-pVTZ': 0x80000000809ffff7fffe,
+    'cc-pVQZ': 0x1ffff7fffe,
+    'cc-pV5Z': 0x1ffff7fffe,
+    'cc-pV6Z': 0x7e7f6,
+    'aug-cc-pVDZ': 0x1fffe7fffe,
+    'aug-cc-pVTZ': 0x80000000801fffe7fffe,
+    'aug-cc-pVQZ': 0x1fffe7fffe,
+    'aug-cc-pV5Z': 0x1fffe7fffe,
+    'aug-cc-pV6Z': 0x7e7e6,
+    'cc-pVD(+d)Z': 0x7f800,
+    'cc-pVT(+d)Z': 0x7f800,
+    'cc-pVQ(+d)Z': 0x7f800,
+    'cc-pV5(+d)Z': 0x7f800,
+    'aug-cc-pVD(+d)Z': 0x7e000,
+    'aug-cc-pVT(+d)Z': 0x7e000,
+    'aug-cc-pVQ(+d)Z': 0x7e000,
+    'aug-cc-pV5(+d)Z': 0x7e000,
+    'aug-cc-pV6(+d)Z': 0x7e000,
+    'apr-cc-pV(Q+d)Z': 0x7fffe,
+    'may-cc-pV(T+d)Z': 0x7fffe,
+    'may-cc-pV(Q+d)Z': 0x7fffe,
+    'jun-cc-pV(D+d)Z': 0x7fffe,
+    'jun-cc-pV(T+d)Z': 0x7fffe,
+    'jun-cc-pV(Q+d)Z': 0x7fffe,
+    'jul-cc-pV(D+d)Z': 0x7fffe,
+    'jul-cc-pV(T+d)Z': 0x7fffe,
+    'jul-cc-pV(Q+d)Z': 0x7fffe,
+    'maug-cc-pV(D+d)Z': 0x7fffe,
+    'maug-cc-pV(T+d)Z': 0x7fffe,
+    'maug-cc-pV(Q+d)Z': 0x7fffe,
+    'cc-pCVDZ': 0x1f8017fffe,
+    'cc-pCVTZ': 0x1f8017fffe,
+    'cc-pCVQZ': 0x1f8017fffe,
+    'cc-pCV5Z': 0x1f8017fffe,
+    'cc-pCV6Z': 0x7e7e6,
+    'aug-cc-pCVDZ': 0x1f8007fffe,
+    'aug-cc-pCVTZ': 0x1f8007fffe,
+    'aug-cc-pCVQZ': 0x1f8007fffe,
+    'aug-cc-pCV5Z': 0x1f8007fffe,
+    'aug-cc-pCV6Z': 0x7e7e6,
+    'cc-pwCVDZ': 0x1f8017fffe,
+    'cc-pwCVTZ': 0x80000000801ffff7fffe,
+    'cc-pwCVQZ': 0x1ffff7fffe,
+    'cc-pwCV5Z': 0x1ffff7fffe,
+    'aug-cc-pwCVDZ': 0x1f8007fffe,
+    'aug-cc-pwCVTZ': 0x80000000801fffe7fffe,
+    'aug-cc-pwCVQZ': 0x1fffe7fffe,
+    'aug-cc-pwCV5Z': 0x1fffe7fffe,
+    'DKH-SV(P)': 0x1ffffffffe,
+    'DKH-SVP': 0x1ffffffffe,
+    'DKH-TZV(P)': 0x1ffffffffe,
+    'DKH-TZVP': 0x1ffffffffe,
+    'DKH-TZVPP': 0x1ffffffffe,
+    'DKH-QZVP': 0x1ffffffffe,
+    'DKH-QZVPP': 0x1ffffffffe,
+    'ZORA-SV(P)': 0x1ffffffffe,
+    'ZORA-SVP': 0x1ffffffffe,
+    'ZORA-TZV(P)': 0x1ffffffffe,
+    'ZORA-TZVP': 0x1ffffffffe,
+    'ZORA-TZVPP': 0x1ffffffffe,
+    'ZORA-QZVP': 0x1ffffffffe,
+    'ZORA-QZVPP': 0x1ffffffffe,
+    'DKH-def2-SVP': 0x1ffffffffe,
+    'DKH-def2-SV(P)': 0x1ffffffffe,
+    'DKH-def2-TZVP': 0x1ffffffffe,
+    'DKH-def2-TZVP(-f)': 0x1ffffffffe,
+    'DKH-def2-TZVPP': 0x1ffffffffe,
+    'DKH-def2-QZVPP': 0x1ffffffffe,
+    'ZORA-def2-SVP': 0x1ffffffffe,
+    'ZORA-def2-SV(P)': 0x1ffffffffe,
+    'ZORA-def2-TZVP': 0x1ffffffffe,
+    'ZORA-def2-TZVP(-f)': 0x1ffffffffe,
+    'ZORA-def2-TZVPP': 0x1ffffffffe,
+    'ZORA-def2-QZVPP': 0x1ffffffffe,
+    'ma-DKH-def2-SVP': 0x1ffffffffe,
+    'ma-DKH-def2-SV(P)': 0x1ffffffffe,
+    'ma-DKH-def2-TZVP': 0x1ffffffffe,
+    'ma-DKH-def2-TZVP(-f)': 0x1ffffffffe,
+    'ma-DKH-def2-TZVPP': 0x1ffffffffe,
+    'ma-DKH-def2-QZVPP': 0x1ffffffffe,
+    'ma-ZORA-def2-SVP': 0x1ffffffffe,
+    'ma-ZORA-def2-SV(P)': 0x1ffffffffe,
+    'ma-ZORA-def2-TZVP': 0x1ffffffffe,
+    'ma-ZORA-def2-TZVP(-f)': 0x1ffffffffe,
+    'ma-ZORA-def2-TZVPP': 0x1ffffffffe,
+    'ma-ZORA-def2-QZVPP': 0x1ffffffffe,
+    'SARC-DKH-SVP': 0x1ff000000000000000000,
+    'SARC-DKH-TZVP': 0xfffe7fffffffffffe000000000,
+    'SARC-DKH-TZVPP': 0xfffe7fffffffffffe000000000,
+    'SARC-ZORA-SVP': 0x1ff000000000000000000,
+    'SARC-ZORA-TZVP': 0xfffe7fffffffffffe000000000,
+    'SARC-ZORA-TZVPP': 0xfffe7fffffffffffe000000000,
+    'SARC2-DKH-QZV': 0xfffe00000000000000,
+    'SARC2-DKH-QZVP': 0xfffe00000000000000,
+    'SARC2-ZORA-QZV': 0xfffe00000000000000,
+    'SARC2-ZORA-QZVP': 0xfffe00000000000000,
+    'x2c-SV(P)all': 0x7ffffffffffffffffffffe,
+    'x2c-SVPall': 0x7ffffffffffffffffffffe,
+    'x2c-TZVPall': 0x7ffffffffffffffffffffe,
+    'x2c-TZVPPall': 0x7ffffffffffffffffffffe,
+    'x2c-QZVPall': 0x7ffffffffffffffffffffe,
+    'x2c-QZVPPall': 0x7ffffffffffffffffffffe,
+    'x2c-SV(P)all-s': 0x7ffffffffffffffffffffe,
+    'x2c-SVPall-s': 0x7ffffffffffffffffffffe,
+    'x2c-TZVPall-s': 0x7ffffffffffffffffffffe,
+    'x2c-TZVPPall-s': 0x7ffffffffffffffffffffe,
+    'x2c-QZVPall-s': 0x7ffffffffffffffffffffe,
+    'x2c-QZVPPall-s': 0x7ffffffffffffffffffffe,
+    'cc-pVDZ-DK': 0x1fffe7fffe,
+    'cc-pVTZ-DK': 0x7fff00007fff9fffe7fffe,
+    'cc-pVQZ-DK': 0x7e0000007e001fffe7fffe,
+    'cc-pV5Z-DK': 0x1fffe7fffe,
+    'cc-pVDZ-DK3': 0x100000000000000000000000,
+    'cc-pVTZ-DK3': 0x100000000000000000000000,
+    'cc-pVQZ-DK3': 0x100000000000000000000000,
+    'aug-cc-pVDZ-DK': 0x1fffe7fffe,
+    'aug-cc-pVTZ-DK': 0x7fff00007fff9fffe7fffe,
+    'aug-cc-pVQZ-DK': 0x7e0000007e001fffe7fffe,
+    'aug-cc-pV5Z-DK': 0x1fffe7fffe,
+    'cc-pwCVDZ-DK': 0x7ff0181e,
+    'cc-pwCVTZ-DK': 0x7fff00007fff807ff0181e,
+    'cc-pwCVQZ-DK': 0x7e0000007e00007ff0181e,
+    'cc-pwCV5Z-DK': 0x7ff0181e,
+    'cc-pwCVDZ-DK3': 0x100000000000000000000000,
+    'cc-pwCVTZ-DK3': 0x100000000000000000000000,
+    'cc-pwCVQZ-DK3': 0x100000000000000000000000,
+    'aug-cc-pwCVDZ-DK': 0x7fe0181e,
+    'aug-cc-pwCVTZ-DK': 0x7fff00007fff807fe0181e,
+    'aug-cc-pwCVQZ-DK': 0x7e0000007e00007fe0181e,
+    'aug-cc-pwCV5Z-DK': 0x7fe0181e,
+    'ANO-RCC-Full': 0x1fffffffffffffffffffffffe,
+    'ANO-RCC-DZP': 0x1fffffffffffffffffffffffe,
+    'ANO-RCC-TZP': 0x1fffffffffffffffffffffffe,
+    'ANO-RCC-QZP': 0x1fffffffffffffffffffffffe,
+    'def2/J': 0xfffffffffffffffffffffffffe,
+    'def2-mTZVP/J': 0xfffffffffffffffffffffffffe,
+    'def2-mTZVPP/J': 0xfffffffffffffffffffffffffe,
+    'x2c/J': 0x7ffffffffffffffffffffe,
+    'SARC/J': 0xfffe7ffffffffffffffffffffe,
+    'def2/JK': 0x7ffffffffffffffffffffe,
+    'def2/JKsmall': 0xfffdfffffffffffffffffffffe,
+    'cc-pVTZ/JK': 0xf8003e3e2,
+    'cc-pVQZ/JK': 0xf8003e3e2,
+    'cc-pV5Z/JK': 0xf8003e3e2,
+    'aug-cc-pVTZ/JK': 0xf8003e3e2,
+    'aug-cc-pVQZ/JK': 0xf8003e3e2,
+    'aug-cc-pV5Z/JK': 0xf8003e3e2,
+    'SARC2-DKH-QZV/JK': 0xfffe00000000000000,
+    'SARC2-DKH-QZVP/JK': 0xfffe00000000000000,
+    'SARC2-ZORA-QZV/JK': 0xfffe00000000000000,
+    'SARC2-ZORA-QZVP/JK': 0xfffe00000000000000,
+    'def2-SVP/C': 0x7ffffffffffffffffffffe,
+    'def2-TZVP/C': 0x7ffffffffffffffffffffe,
+    'def2-TZVPP/C': 0x7ffffffffffffffffffffe,
+    'def2-QZVPP/C': 0x7ffffffffffffffffffffe,
+    'def2-SVPD/C': 0x7fff0003fffffffffffffe,
+    'def2-TZVPD/C': 0x7fff0003fffffffffffffe,
+    'def2-TZVPPD/C': 0x7fff0003fffffffffffffe,
+    'def2-QZVPPD/C': 0x7fff0003fffffffffffffe,
+    'cc-pVDZ/C': 0x1f8007fffe,
+    'cc-pVTZ/C': 0x1fffe7fffe,
+    'cc-pVQZ/C': 0x1fffe7fffe,
+    'cc-pV5Z/C': 0x1f8007fffe,
+    'cc-pV6Z/C': 0x7e7e6,
+    'aug-cc-pVDZ/C': 0x1f8007f7f6,
+    'aug-cc-pVTZ/C': 0x1fffe7f7f6,
+    'aug-cc-pVQZ/C': 0x1fffe7f7f6,
+    'aug-cc-pV5Z/C': 0x1f8007e7fe,
+    'aug-cc-pV6Z/C': 0x7e7e6,
+    'cc-pwCVDZ/C': 0x1f8007e7e6,
+    'cc-pwCVTZ/C': 0x1fffe7e7e6,
+    'cc-pwCVQZ/C': 0x1f8007e7e6,
+    'cc-pwCV5Z/C': 0x7e7fe,
+    'aug-cc-pwCVDZ/C': 0x1f8007e7e6,
+    'aug-cc-pwCVTZ/C': 0x1fffe7e7e6,
+    'aug-cc-pwCVQZ/C': 0x1f8007e7e6,
+    'aug-cc-pwCV5Z/C': 0x7e7fe,
+}
+
+# Basis name to the bitmask of the elements its ECP is used for
+ECP_ELEMENT_MASKS = {
+    'def2-SVP': 0x7fffffffffffe000000000,
+    'def2-SV(P)': 0x7fffffffffffe000000000,
+    'def2-TZVP': 0x7fffffffffffe000000000,
+    'def2-TZVP(-f)': 0x7fffffffffffe000000000,
+    'def2-TZVPP': 0x7fffffffffffe000000000,
+    'def2-QZVP': 0x7fffffffffffe000000000,
+    'def2-QZVPP': 0x7fffffffffffe000000000,
+    'def2-SVPD': 0x7fffffffffffe000000000,
+    'def2-TZVPD': 0x7fffffffffffe000000000,
+    'def2-TZVPPD': 0x7fffffffffffe000000000,
+    'def2-QZVPD': 0x7fffffffffffe000000000,
+    'def2-QZVPPD': 0x7fffffffffffe000000000,
+    'ma-def2-SVP': 0x7fffffffffffe000000000,
+    'ma-def2-SV(P)': 0x7fffffffffffe000000000,
+    'ma-def2-mSVP': 0x7fffffffffffe000000000,
+    'ma-def2-TZVP': 0x7fffffffffffe000000000,
+    'ma-def2-TZVP(-f)': 0x7fffffffffffe000000000,
+    'ma-def2-TZVPP': 0x7fffffffffffe000000000,
+    'ma-def2-QZVPP': 0x7fffffffffffe000000000,
+}
+
+# Member name, keyword, bitmask of the available Disp corrections
+FUNCTIONALS = (
+    ('HFS', 'HFS', 0),
+    ('LDA', 'LDA', 0),
+    ('LSD', 'LDA', 0),
+    ('VWN_5', 'VWN5', 0),
+    ('VWN_3', 'VWN3', 0),
+    ('PW_LDA', 'PWLDA', 0),
+    ('BP86', 'BP86', 31),
+    ('BLYP', 'BLYP', 31),
+    ('OLYP', 'OLYP', 5),
+    ('GLYP', 'GLYP', 4),
+    ('XLYP', 'XLYP', 4),
+    ('PW91', 'PW91', 4),
+    ('MPWPW', 'mPWPW', 4),
+    ('MPWLYP', 'mPWLYP', 7),
+    ('PBE', 'PBE', 31),
+    ('RPBE', 'RPBE', 31),
+    ('REVPBE', 'revPBE', 31),
+    ('RPW86PBE', 'RPW86PBE', 31),
+    ('PWP', 'PWP', 4),
+    ('B97M_V', 'B97M-V', 16),
+    ('B97M_D3BJ', 'B97M-D3BJ', 0),
+    ('B97M_D4', 'B97M-D4', 0),
+    ('SCANFUNC', 'SCANFUNC', 31),
+    ('RSCAN', 'rSCAN', 31),
+    ('R2SCAN', 'r2SCAN', 31),
+    ('M06_L', 'M06L', 6),
+    ('TPSS', 'TPSS', 31),
+    ('REVTPSS', 'revTPSS', 4),
+    ('B1LYP', 'B1LYP', 4),
+    ('B3LYP', 'B3LYP', 31),
+    ('B3LYP_G', 'B3LYP/G', 24),
+    ('O3LYP', 'O3LYP', 4),
+    ('X3LYP', 'X3LYP', 4),
+    ('B1P86', 'B1P86', 0),
+    ('B3P86', 'B3P86', 28),
+    ('B3PW91', 'B3PW91', 31),
+    ('PW1PW', 'PW1PW', 28),
+    ('MPW1PW', 'mPW1PW', 28),
+    ('MPW1LYP', 'mPW1LYP', 4),
+    ('PBE0', 'PBE0', 31),
+    ('REVPBE0', 'revPBE0', 31),
+    ('REVPBE38', 'revPBE38', 31),
+    ('BHANDHLYP', 'BHandHLYP', 7),
+    ('M06', 'M06', 6),
+    ('M06_2X', 'M062X', 2),
+    ('PW6B95', 'PW6B95', 31),
+    ('TPSSH', 'TPSSh', 31),
+    ('TPSS0', 'TPSS0', 31),
+    ('R2SCANH', 'r2SCANh', 29),
+    ('R2SCAN0', 'r2SCAN0', 29),
+    ('R2SCAN50', 'r2SCAN50', 29),
+    ('WB97', 'wB97', 0),
+    ('WB97X', 'wB97X', 0),
+    ('WB97X_V', 'wB97X-V', 16),
+    ('WB97X_D3', 'wB97X-D3', 0),
+    ('WB97X_D3BJ', 'wB97X-D3BJ', 0),
+    ('WB97X_D4', 'wB97X-D4', 0),
+    ('WB97X_D4REV', 'wB97X-D4rev', 0),
+    ('CAM_B3LYP', 'CAM-B3LYP', 7),
+    ('LC_BLYP', 'LC-BLYP', 4),
+    ('LC_PBE', 'LC-PBE', 0),
+    ('WB97M_V', 'wB97M-V', 16),
+    ('WB97M_D3BJ', 'wB97M-D3BJ', 0),
+    ('WB97M_D4', 'wB97M-D4', 0),
+    ('WB97M_D4REV', 'wB97M-D4rev', 0),
+    ('WR2SCAN', 'wr2SCAN', 29),
+    ('DSD_BLYP', 'DSD-BLYP D3BJ', 0),
+    ('DSD_BLYP_NODISP_2013', 'DSD-BLYP/2013', 25),
+    ('DSD_BLYP_2013_D3BJ', 'DSD-BLYP/2013 D3BJ', 0),
+    ('DSD_PBEP86_D3BJ', 'DSD-PBEP86 D3BJ', 0),
+    ('DSD_PBEP86_2013', 'DSD-PBEP86/2013', 24),
+    ('DSD_PBEP86_2013_D3BJ', 'DSD-PBEP86/2013 D3BJ', 0),
+    ('DSD_PBEB95', 'DSD-PBEB95', 0),
+    ('DSD_PBEB95_D3BJ', 'DSD-PBEB95 D3BJ', 0),
+    ('B2PLYP', 'B2PLYP', 31),
+    ('MPW2PLYP', 'mPW2PLYP', 4),
+    ('B2GP_PLYP', 'B2GP-PLYP', 7),
+    ('B2K_PLYP', 'B2K-PLYP', 0),
+    ('B2T_PLYP', 'B2T-PLYP', 0),
+    ('B2NC_PLYP', 'B2NC-PLYP', 0),
+    ('PWPB95', 'PWPB95', 31),
+    ('PBE_QIDH', 'PBE-QIDH', 3),
+    ('PBE0_DH', 'PBE0-DH', 3),
+    ('REVDSD_PBEP86_2021', 'revDSD-PBEP86/2021', 0),
+    ('REVDSD_PBEP86_D4_2021', 'revDSD-PBEP86-D4/2021', 0),
+    ('REVDOD_PBEP86_2021', 'revDOD-PBEP86/2021', 0),
+    ('REVDOD_PBEP86_D4_2021', 'revDOD-PBEP86-D4/2021', 0),
+    ('R2SCAN_CIDH', 'r2SCAN-CIDH', 5),
+    ('R2SCAN_QIDH', 'r2SCAN-QIDH', 5),
+    ('R2SCAN0_2', 'r2SCAN0-2', 5),
+    ('R2SCAN0_DH', 'r2SCAN0-DH', 5),
+    ('PR2SCAN50', 'Pr2SCAN50', 29),
+    ('PR2SCAN69', 'Pr2SCAN69', 29),
+    ('KPR2SCAN50', 'kPr2SCAN', 29),
+    ('SCS_SOS_B2PLYP21', 'SCS/SOS-B2PLYP21', 0),
+    ('SCS_PBE_QIDH', 'SCS-PBE-QIDH', 0),
+    ('SOS_PBE_QIDH', 'SOS-PBE-QIDH', 0),
+    ('SCS_B2GP_PLYP21', 'SCS-B2GP-PLYP21', 0),
+    ('SOS_B2GP_PLYP21', 'SOS-B2GP-PLYP21', 0),
+)
+
+# Member name, value
+LIBXC = {
+    'SimpleLibXC': (
+        ('PWLDA', 'PWLDA'),
+        ('VWN5', 'VWN5'),
+        ('B97_D', 'B97-D'),
+        ('B97_D3', 'B97-D3'),
+        ('B97_D4', 'B97-D4'),
+        ('BLYP', 'BLYP'),
+        ('BPBE', 'BPBE'),
+        ('BPW91', 'BPW91'),
+        ('BVWN', 'BVWN'),
+        ('GLYP', 'GLYP'),
+        ('KT2', 'KT2'),
+        ('KT3', 'KT3'),
+        ('MPWLYP', 'MPWLYP'),
+        ('MPWPW', 'MPWPW'),
+        ('OPBE', 'OPBE'),
+        ('OLYP', 'OLYP'),
+        ('RPW86PBE', 'RPW86PBE'),
+        ('PW86PBE', 'PW86PBE'),
+        ('PW91', 'PW91'),
+        ('PBE', 'PBE'),
+        ('RPBE', 'RPBE'),
+        ('REVPBE', 'REVPBE'),
+        ('XLYP', 'XLYP'),
+        ('B97M_V', 'B97M-V'),
+        ('B97M_D3BJ', 'B97M-D3BJ'),
+        ('B97M_D4', 'B97M-D4'),
+        ('M06L', 'M06L'),
+        ('MN15L', 'MN15L'),
+        ('MTASK_LDA', 'MTASK-LDA'),
+        ('MTASK_SCAN', 'MTASK-SCAN'),
+        ('REVTM', 'REVTM'),
+        ('R2SCAN', 'R2SCAN'),
+        ('RSCAN', 'RSCAN'),
+        ('SCAN', 'SCAN'),
+        ('TASK_CCALDA', 'TASK-CCALDA'),
+        ('TASK_CC', 'TASK-CC'),
+        ('TASK_LDA', 'TASK-LDA'),
+        ('TASK_SCAN', 'TASK-SCAN'),
+        ('TM', 'TM'),
+        ('TPSS', 'TPSS'),
+        ('HFLDA', 'HFLDA'),
+        ('BHANDHLYP', 'BHANDHLYP'),
+        ('B1LYP', 'B1LYP'),
+        ('B1PW91', 'B1PW91'),
+        ('B1PW', 'B1PW'),
+        ('B1PBE', 'B1PBE'),
+        ('B3PW91', 'B3PW91'),
+        ('B3LYP', 'B3LYP'),
+        ('B3LYP_G', 'B3LYP/G'),
+        ('B3LYPS', 'B3LYPS'),
+        ('BLYP35', 'BLYP35'),
+        ('B97', 'B97'),
+        ('CAM_B3LYP', 'CAM-B3LYP'),
+        ('CASE21', 'CASE21'),
+        ('G1LYP', 'G1LYP'),
+        ('HSE03', 'HSE03'),
+        ('HSE12', 'HSE12'),
+        ('HSE12S', 'HSE12S'),
+        ('HSESOL', 'HSESOL'),
+        ('KMLYP', 'KMLYP'),
+        ('LB07', 'LB07'),
+        ('LC_BLYP', 'LC-BLYP'),
+        ('MPW1LYP', 'MPW1LYP'),
+        ('MPW1PW', 'MPW1PW'),
+        ('PBE0', 'PBE0'),
+        ('PBE38', 'PBE38'),
+        ('PBE50', 'PBE50'),
+        ('PW91_0', 'PW91_0'),
+        ('PW1PW', 'PW1PW'),
+        ('REVPBE0', 'REVPBE0'),
+        ('REVPBE38', 'REVPBE38'),
+        ('WHPBE0', 'WHPBE0'),
+        ('WB97', 'WB97'),
+        ('WB97X', 'WB97X'),
+        ('WB97X_D3', 'WB97X-D3'),
+        ('WB97X_V', 'WB97X-V'),
+        ('WB97X_D3BJ', 'WB97X-D3BJ'),
+        ('WB97X_D4', 'WB97X-D4'),
+        ('WB97X_D4REV', 'WB97X-D4REV'),
+        ('GAS22', 'GAS22'),
+        ('M05', 'M05'),
+        ('M052X', 'M052X'),
+        ('M06', 'M06'),
+        ('M062X', 'M062X'),
+        ('M06SX', 'M06SX'),
+        ('MN15', 'MN15'),
+        ('LC_TMLYP', 'LC-TMLYP'),
+        ('PW6B95', 'PW6B95'),
+        ('R2SCANH', 'R2SCANH'),
+        ('R2SCAN0', 'R2SCAN0'),
+        ('R2SCAN38', 'R2SCAN38'),
+        ('R2SCAN50', 'R2SCAN50'),
+        ('SCAN0', 'SCAN0'),
+        ('TPSS0', 'TPSS0'),
+        ('TPSSH', 'TPSSH'),
+        ('WB97M_V', 'WB97M-V'),
+        ('WB97M_D3BJ', 'WB97M-D3BJ'),
+        ('WB97M_D4', 'WB97M-D4'),
+        ('WB97M_D4REV', 'WB97M-D4REV'),
+        ('B2PLYP', 'B2PLYP'),
+        ('B2GP_PLYP', 'B2GP-PLYP'),
+        ('B2T_PLYP', 'B2T-PLYP'),
+        ('B2K_PLYP', 'B2K-PLYP'),
+        ('B2NC_PLYP', 'B2NC-PLYP'),
+        ('DSD_PBEB95_D3', 'DSD-PBEB95-D3'),
+        ('DSD_PBEB95_D4', 'DSD-PBEB95-D4'),
+        ('MPW2_PLYP', 'MPW2-PLYP'),
+        ('PWPB95', 'PWPB95'),
+        ('PBE0_DH', 'PBE0-DH'),
+        ('PBE0_2', 'PBE0-2'),
+        ('PBE_QIDH', 'PBE-QIDH'),
+        ('PR2SCAN50', 'PR2SCAN50'),
+        ('PR2SCAN69', 'PR2SCAN69'),
+        ('SOS1_R2SCAN0_DH', 'SOS1-R2SCAN0-DH'),
+        ('SOS1_R2SCAN_CIDH', 'SOS1-R2SCAN-CIDH'),
+        ('SOS1_R2SCAN_QIDH', 'SOS1-R2SCAN-QIDH'),
+        ('SOS1_R2SCAN0_2', 'SOS1-R2SCAN0-2'),
+    ),
+    'ExchangeLibXC': (
+        ('LDA_X', 'lda_x'),
+        ('LDA_X_1D_EXPONENTIAL', 'lda_x_1d_exponential'),
+        ('LDA_X_1D_SOFT', 'lda_x_1d_soft'),
+        ('LDA_X_2D', 'lda_x_2d'),
+        ('LDA_X_ERF', 'lda_x_erf'),
+        ('LDA_X_RAE', 'lda_x_rae'),
+        ('LDA_X_REL', 'lda_x_rel'),
+        ('LDA_X_SLOC', 'lda_x_sloc'),
+        ('LDA_X_YUKAWA', 'lda_x_yukawa'),
+        ('GGA_X_2D_B86', 'gga_x_2d_b86'),
+        ('GGA_X_2D_B86_MGC', 'gga_x_2d_b86_mgc'),
+        ('GGA_X_2D_B88', 'gga_x_2d_b88'),
+        ('GGA_X_2D_PBE', 'gga_x_2d_pbe'),
+        ('GGA_X_AIRY', 'gga_x_airy'),
+        ('GGA_X_AK13', 'gga_x_ak13'),
+        ('GGA_X_AM05', 'gga_x_am05'),
+        ('GGA_X_APBE', 'gga_x_apbe'),
+        ('GGA_X_B86', 'gga_x_b86'),
+        ('GGA_X_B86_MGC', 'gga_x_b86_mgc'),
+        ('GGA_X_B86_R', 'gga_x_b86_r'),
+        ('GGA_X_B88', 'gga_x_b88'),
+        ('GGA_X_B88_6311G', 'gga_x_b88_6311g'),
+        ('GGA_X_B88M', 'gga_x_b88m'),
+        ('GGA_X_BAYESIAN', 'gga_x_bayesian'),
+        ('GGA_X_BCGP', 'gga_x_bcgp'),
+        ('GGA_X_BEEFVDW', 'gga_x_beefvdw'),
+        ('GGA_X_BKL1', 'gga_x_bkl1'),
+        ('GGA_X_BKL2', 'gga_x_bkl2'),
+        ('GGA_X_BPCCAC', 'gga_x_bpccac'),
+        ('GGA_X_C09X', 'gga_x_c09x'),
+        ('GGA_X_CAP', 'gga_x_cap'),
+        ('GGA_X_CHACHIYO', 'gga_x_chachiyo'),
+        ('GGA_X_DK87_R1', 'gga_x_dk87_r1'),
+        ('GGA_X_DK87_R2', 'gga_x_dk87_r2'),
+        ('GGA_X_EB88', 'gga_x_eb88'),
+        ('GGA_X_ECMV92', 'gga_x_ecmv92'),
+        ('GGA_X_EV93', 'gga_x_ev93'),
+        ('GGA_X_FD_LB94', 'gga_x_fd_lb94'),
+        ('GGA_X_FD_REVLB94', 'gga_x_fd_revlb94'),
+        ('GGA_X_FT97_A', 'gga_x_ft97_a'),
+        ('GGA_X_FT97_B', 'gga_x_ft97_b'),
+        ('GGA_X_G96', 'gga_x_g96'),
+        ('GGA_X_GAM', 'gga_x_gam'),
+        ('GGA_X_GG99', 'gga_x_gg99'),
+        ('GGA_X_HCTH_A', 'gga_x_hcth_a'),
+        ('GGA_X_HJS_B88', 'gga_x_hjs_b88'),
+        ('GGA_X_HJS_B88_V2', 'gga_x_hjs_b88_v2'),
+        ('GGA_X_HJS_B97X', 'gga_x_hjs_b97x'),
+        ('GGA_X_HJS_PBE', 'gga_x_hjs_pbe'),
+        ('GGA_X_HJS_PBE_SOL', 'gga_x_hjs_pbe_sol'),
+        ('GGA_X_HTBS', 'gga_x_htbs'),
+        ('GGA_X_ITYH', 'gga_x_ityh'),
+        ('GGA_X_ITYH_OPTX', 'gga_x_ityh_optx'),
+        ('GGA_X_ITYH_PBE', 'gga_x_ityh_pbe'),
+        ('GGA_X_KGG99', 'gga_x_kgg99'),
+        ('GGA_X_KT1', 'gga_x_kt1'),
+        ('GGA_X_LAG', 'gga_x_lag'),
+        ('GGA_X_LAMBDA_CH_N', 'gga_x_lambda_ch_n'),
+        ('GGA_X_LAMBDA_LO_N', 'gga_x_lambda_lo_n'),
+        ('GGA_X_LAMBDA_OC2_N', 'gga_x_lambda_oc2_n'),
+        ('GGA_X_LB', 'gga_x_lb'),
+        ('GGA_X_LBM', 'gga_x_lbm'),
+        ('GGA_X_LG93', 'gga_x_lg93'),
+        ('GGA_X_LSPBE', 'gga_x_lspbe'),
+        ('GGA_X_LSRPBE', 'gga_x_lsrpbe'),
+        ('GGA_X_LV_RPW86', 'gga_x_lv_rpw86'),
+        ('GGA_X_MB88', 'gga_x_mb88'),
+        ('GGA_X_MPBE', 'gga_x_mpbe'),
+        ('GGA_X_MPW91', 'gga_x_mpw91'),
+        ('GGA_X_N12', 'gga_x_n12'),
+        ('GGA_X_NCAP', 'gga_x_ncap'),
+        ('GGA_X_NCAPR', 'gga_x_ncapr'),
+        ('GGA_X_OL2', 'gga_x_ol2'),
+        ('GGA_X_OPTB86B_VDW', 'gga_x_optb86b_vdw'),
+        ('GGA_X_OPTB88_VDW', 'gga_x_optb88_vdw'),
+        ('GGA_X_OPTPBE_VDW', 'gga_x_optpbe_vdw'),
+        ('GGA_X_OPTX', 'gga_x_optx'),
+        ('GGA_X_PBE', 'gga_x_pbe'),
+        ('GGA_X_PBE_ERF_GWS', 'gga_x_pbe_erf_gws'),
+        ('GGA_X_PBE_GAUSSIAN', 'gga_x_pbe_gaussian'),
+        ('GGA_X_PBE_JSJR', 'gga_x_pbe_jsjr'),
+        ('GGA_X_PBE_MOD', 'gga_x_pbe_mod'),
+        ('GGA_X_PBE_MOL', 'gga_x_pbe_mol'),
+        ('GGA_X_PBE_R', 'gga_x_pbe_r'),
+        ('GGA_X_PBE_SOL', 'gga_x_pbe_sol'),
+        ('GGA_X_PBE_TCA', 'gga_x_pbe_tca'),
+        ('GGA_X_PBEA', 'gga_x_pbea'),
+        ('GGA_X_PBEFE', 'gga_x_pbefe'),
+        ('GGA_X_PBEINT', 'gga_x_pbeint'),
+        ('GGA_X_PBEK1_VDW', 'gga_x_pbek1_vdw'),
+        ('GGA_X_PBEPOW', 'gga_x_pbepow'),
+        ('GGA_X_PBETRANS', 'gga_x_pbetrans'),
+        ('GGA_X_PW86', 'gga_x_pw86'),
+        ('GGA_X_PW91', 'gga_x_pw91'),
+        ('GGA_X_PW91_MOD', 'gga_x_pw91_mod'),
+        ('GGA_X_Q1D', 'gga_x_q1d'),
+        ('GGA_X_Q2D', 'gga_x_q2d'),
+        ('GGA_X_REVSSB_D', 'gga_x_revssb_d'),
+        ('GGA_X_RGE2', 'gga_x_rge2'),
+        ('GGA_X_RPBE', 'gga_x_rpbe'),
+        ('GGA_X_RPW86', 'gga_x_rpw86'),
+        ('GGA_X_S12G', 'gga_x_s12g'),
+        ('GGA_X_SFAT', 'gga_x_sfat'),
+        ('GGA_X_SFAT_PBE', 'gga_x_sfat_pbe'),
+        ('GGA_X_SG4', 'gga_x_sg4'),
+        ('GGA_X_SOGGA', 'gga_x_sogga'),
+        ('GGA_X_SOGGA11', 'gga_x_sogga11'),
+        ('GGA_X_SSB', 'gga_x_ssb'),
+        ('GGA_X_SSB_D', 'gga_x_ssb_d'),
+        ('GGA_X_SSB_SW', 'gga_x_ssb_sw'),
+        ('GGA_X_VMT84_GE', 'gga_x_vmt84_ge'),
+        ('GGA_X_VMT84_PBE', 'gga_x_vmt84_pbe'),
+        ('GGA_X_VMT_GE', 'gga_x_vmt_ge'),
+        ('GGA_X_VMT_PBE', 'gga_x_vmt_pbe'),
+        ('GGA_X_WC', 'gga_x_wc'),
+        ('GGA_X_WPBEH', 'gga_x_wpbeh'),
+        ('GGA_X_XPBE', 'gga_x_xpbe'),
+        ('MGGA_X_2D_JS17', 'mgga_x_2d_js17'),
+        ('MGGA_X_2D_PRHG07', 'mgga_x_2d_prhg07'),
+        ('MGGA_X_2D_PRHG07_PRP10', 'mgga_x_2d_prhg07_prp10'),
+        ('MGGA_X_B00', 'mgga_x_b00'),
+        ('MGGA_X_BJ06', 'mgga_x_bj06'),
+        ('MGGA_X_BLOC', 'mgga_x_bloc'),
+        ('MGGA_X_BR89', 'mgga_x_br89'),
+        ('MGGA_X_BR89_1', 'mgga_x_br89_1'),
+        ('MGGA_X_BR89_EXPLICIT', 'mgga_x_br89_explicit'),
+        ('MGGA_X_BR89_EXPLICIT_1', 'mgga_x_br89_explicit_1'),
+        ('MGGA_X_EDMGGA', 'mgga_x_edmgga'),
+        ('MGGA_X_EEL', 'mgga_x_eel'),
+        ('MGGA_X_FT98', 'mgga_x_ft98'),
+        ('MGGA_X_GDME_0', 'mgga_x_gdme_0'),
+        ('MGGA_X_GDME_KOS', 'mgga_x_gdme_kos'),
+        ('MGGA_X_GDME_NV', 'mgga_x_gdme_nv'),
+        ('MGGA_X_GDME_VT', 'mgga_x_gdme_vt'),
+        ('MGGA_X_GVT4', 'mgga_x_gvt4'),
+        ('MGGA_X_GX', 'mgga_x_gx'),
+        ('MGGA_X_HLTA', 'mgga_x_hlta'),
+        ('MGGA_X_JK', 'mgga_x_jk'),
+        ('MGGA_X_KTBM_0', 'mgga_x_ktbm_0'),
+        ('MGGA_X_KTBM_1', 'mgga_x_ktbm_1'),
+        ('MGGA_X_KTBM_10', 'mgga_x_ktbm_10'),
+        ('MGGA_X_KTBM_11', 'mgga_x_ktbm_11'),
+        ('MGGA_X_KTBM_12', 'mgga_x_ktbm_12'),
+        ('MGGA_X_KTBM_13', 'mgga_x_ktbm_13'),
+        ('MGGA_X_KTBM_14', 'mgga_x_ktbm_14'),
+        ('MGGA_X_KTBM_15', 'mgga_x_ktbm_15'),
+        ('MGGA_X_KTBM_16', 'mgga_x_ktbm_16'),
+        ('MGGA_X_KTBM_17', 'mgga_x_ktbm_17'),
+        ('MGGA_X_KTBM_18', 'mgga_x_ktbm_18'),
+        ('MGGA_X_KTBM_19', 'mgga_x_ktbm_19'),
+        ('MGGA_X_KTBM_2', 'mgga_x_ktbm_2'),
+        ('MGGA_X_KTBM_20', 'mgga_x_ktbm_20'),
+        ('MGGA_X_KTBM_21', 'mgga_x_ktbm_21'),
+        ('MGGA_X_KTBM_22', 'mgga_x_ktbm_22'),
+        ('MGGA_X_KTBM_23', 'mgga_x_ktbm_23'),
+        ('MGGA_X_KTBM_24', 'mgga_x_ktbm_24'),
+        ('MGGA_X_KTBM_3', 'mgga_x_ktbm_3'),
+        ('MGGA_X_KTBM_4', 'mgga_x_ktbm_4'),
+        ('MGGA_X_KTBM_5', 'mgga_x_ktbm_5'),
+        ('MGGA_X_KTBM_6', 'mgga_x_ktbm_6'),
+        ('MGGA_X_KTBM_7', 'mgga_x_ktbm_7'),
+        ('MGGA_X_KTBM_8', 'mgga_x_ktbm_8'),
+        ('MGGA_X_KTBM_9', 'mgga_x_ktbm_9'),
+        ('MGGA_X_KTBM_GAP', 'mgga_x_ktbm_gap'),
+        ('MGGA_X_LAK', 'mgga_x_lak'),
+        ('MGGA_X_LTA', 'mgga_x_lta'),
+        ('MGGA_X_M06_L', 'mgga_x_m06_l'),
+        ('MGGA_X_M11_L', 'mgga_x_m11_l'),
+        ('MGGA_X_MBEEF', 'mgga_x_mbeef'),
+        ('MGGA_X_MBEEFVDW', 'mgga_x_mbeefvdw'),
+        ('MGGA_X_MBR', 'mgga_x_mbr'),
+        ('MGGA_X_MBRXC_BG', 'mgga_x_mbrxc_bg'),
+        ('MGGA_X_MBRXH_BG', 'mgga_x_mbrxh_bg'),
+        ('MGGA_X_MCML', 'mgga_x_mcml'),
+        ('MGGA_X_MGGAC', 'mgga_x_mggac'),
+        ('MGGA_X_MK00', 'mgga_x_mk00'),
+        ('MGGA_X_MK00B', 'mgga_x_mk00b'),
+        ('MGGA_X_MN12_L', 'mgga_x_mn12_l'),
+        ('MGGA_X_MN15_L', 'mgga_x_mn15_l'),
+        ('MGGA_X_MODTPSS', 'mgga_x_modtpss'),
+        ('MGGA_X_MS0', 'mgga_x_ms0'),
+        ('MGGA_X_MS1', 'mgga_x_ms1'),
+        ('MGGA_X_MS2', 'mgga_x_ms2'),
+        ('MGGA_X_MS2_REV', 'mgga_x_ms2_rev'),
+        ('MGGA_X_MS2B', 'mgga_x_ms2b'),
+        ('MGGA_X_MS2BS', 'mgga_x_ms2bs'),
+        ('MGGA_X_MSB86BL', 'mgga_x_msb86bl'),
+        ('MGGA_X_MSPBEL', 'mgga_x_mspbel'),
+        ('MGGA_X_MSRPBEL', 'mgga_x_msrpbel'),
+        ('MGGA_X_MTASK', 'mgga_x_mtask'),
+        ('MGGA_X_MVS', 'mgga_x_mvs'),
+        ('MGGA_X_MVSB', 'mgga_x_mvsb'),
+        ('MGGA_X_MVSBS', 'mgga_x_mvsbs'),
+        ('MGGA_X_PBE_GX', 'mgga_x_pbe_gx'),
+        ('MGGA_X_PKZB', 'mgga_x_pkzb'),
+        ('MGGA_X_R2SCAN', 'mgga_x_r2scan'),
+        ('MGGA_X_R2SCAN01', 'mgga_x_r2scan01'),
+        ('MGGA_X_R2SCANL', 'mgga_x_r2scanl'),
+        ('MGGA_X_R4SCAN', 'mgga_x_r4scan'),
+        ('MGGA_X_REGTM', 'mgga_x_regtm'),
+        ('MGGA_X_REGTPSS', 'mgga_x_regtpss'),
+        ('MGGA_X_REVM06_L', 'mgga_x_revm06_l'),
+        ('MGGA_X_REVSCAN', 'mgga_x_revscan'),
+        ('MGGA_X_REVSCANL', 'mgga_x_revscanl'),
+        ('MGGA_X_REVTM', 'mgga_x_revtm'),
+        ('MGGA_X_REVTPSS', 'mgga_x_revtpss'),
+        ('MGGA_X_RLDA', 'mgga_x_rlda'),
+        ('MGGA_X_RMSB86BL', 'mgga_x_rmsb86bl'),
+        ('MGGA_X_RMSPBEL', 'mgga_x_rmspbel'),
+        ('MGGA_X_RMSRPBEL', 'mgga_x_rmsrpbel'),
+        ('MGGA_X_RPP09', 'mgga_x_rpp09'),
+        ('MGGA_X_RPPSCAN', 'mgga_x_rppscan'),
+        ('MGGA_X_RSCAN', 'mgga_x_rscan'),
+        ('MGGA_X_RTPSS', 'mgga_x_rtpss'),
+        ('MGGA_X_SA_TPSS', 'mgga_x_sa_tpss'),
+        ('MGGA_X_SCAN', 'mgga_x_scan'),
+        ('MGGA_X_SCANL', 'mgga_x_scanl'),
+        ('MGGA_X_TASK', 'mgga_x_task'),
+        ('MGGA_X_TAU_HCTH', 'mgga_x_tau_hcth'),
+        ('MGGA_X_TB09', 'mgga_x_tb09'),
+        ('MGGA_X_TH', 'mgga_x_th'),
+        ('MGGA_X_TLDA', 'mgga_x_tlda'),
+        ('MGGA_X_TM', 'mgga_x_tm'),
+        ('MGGA_X_TPSS', 'mgga_x_tpss'),
+        ('MGGA_X_VCML', 'mgga_x_vcml'),
+        ('MGGA_X_VT84', 'mgga_x_vt84'),
+        ('HYB_GGA_X_CAM_S12G', 'hyb_gga_x_cam_s12g'),
+        ('HYB_GGA_X_CAM_S12H', 'hyb_gga_x_cam_s12h'),
+        ('HYB_GGA_X_N12_SX', 'hyb_gga_x_n12_sx'),
+        ('HYB_GGA_X_PBE_ERF_GWS', 'hyb_gga_x_pbe_erf_gws'),
+        ('HYB_GGA_X_S12H', 'hyb_gga_x_s12h'),
+        ('HYB_GGA_X_SOGGA11_X', 'hyb_gga_x_sogga11_x'),
+        ('HYB_MGGA_X_BMK', 'hyb_mgga_x_bmk'),
+        ('HYB_MGGA_X_CF22D', 'hyb_mgga_x_cf22d'),
+        ('HYB_MGGA_X_DLDF', 'hyb_mgga_x_dldf'),
+        ('HYB_MGGA_X_JS18', 'hyb_mgga_x_js18'),
+        ('HYB_MGGA_X_M05', 'hyb_mgga_x_m05'),
+        ('HYB_MGGA_X_M05_2X', 'hyb_mgga_x_m05_2x'),
+        ('HYB_MGGA_X_M06', 'hyb_mgga_x_m06'),
+        ('HYB_MGGA_X_M06_2X', 'hyb_mgga_x_m06_2x'),
+        ('HYB_MGGA_X_M06_HF', 'hyb_mgga_x_m06_hf'),
+        ('HYB_MGGA_X_M06_SX', 'hyb_mgga_x_m06_sx'),
+        ('HYB_MGGA_X_M08_HX', 'hyb_mgga_x_m08_hx'),
+        ('HYB_MGGA_X_M08_SO', 'hyb_mgga_x_m08_so'),
+        ('HYB_MGGA_X_M11', 'hyb_mgga_x_m11'),
+        ('HYB_MGGA_X_MN12_SX', 'hyb_mgga_x_mn12_sx'),
+        ('HYB_MGGA_X_MN15', 'hyb_mgga_x_mn15'),
+        ('HYB_MGGA_X_MS2H', 'hyb_mgga_x_ms2h'),
+        ('HYB_MGGA_X_MVSH', 'hyb_mgga_x_mvsh'),
+        ('HYB_MGGA_X_PJS18', 'hyb_mgga_x_pjs18'),
+        ('HYB_MGGA_X_REVM06', 'hyb_mgga_x_revm06'),
+        ('HYB_MGGA_X_REVM11', 'hyb_mgga_x_revm11'),
+        ('HYB_MGGA_X_REVSCAN0', 'hyb_mgga_x_revscan0'),
+        ('HYB_MGGA_X_SCAN0', 'hyb_mgga_x_scan0'),
+        ('HYB_MGGA_X_TAU_HCTH', 'hyb_mgga_x_tau_hcth'),
+        ('HYB_LDA_X_ERF', 'hyb_lda_x_erf'),
+    ),
+    'CorrelationLibXC': (
+        ('LDA_C_1D_CSC', 'lda_c_1d_csc'),
+        ('LDA_C_1D_LOOS', 'lda_c_1d_loos'),
+        ('LDA_C_2D_AMGB', 'lda_c_2d_amgb'),
+        ('LDA_C_2D_PRM', 'lda_c_2d_prm'),
+        ('LDA_C_BR78', 'lda_c_br78'),
+        ('LDA_C_CHACHIYO', 'lda_c_chachiyo'),
+        ('LDA_C_CHACHIYO_MOD', 'lda_c_chachiyo_mod'),
+        ('LDA_C_EPC17', 'lda_c_epc17'),
+        ('LDA_C_EPC17_2', 'lda_c_epc17_2'),
+        ('LDA_C_EPC18_1', 'lda_c_epc18_1'),
+        ('LDA_C_EPC18_2', 'lda_c_epc18_2'),
+        ('LDA_C_GK72', 'lda_c_gk72'),
+        ('LDA_C_GL', 'lda_c_gl'),
+        ('LDA_C_GOMBAS', 'lda_c_gombas'),
+        ('LDA_C_HL', 'lda_c_hl'),
+        ('LDA_C_KARASIEV', 'lda_c_karasiev'),
+        ('LDA_C_KARASIEV_MOD', 'lda_c_karasiev_mod'),
+        ('LDA_C_LP96', 'lda_c_lp96'),
+        ('LDA_C_MCWEENY', 'lda_c_mcweeny'),
+        ('LDA_C_ML1', 'lda_c_ml1'),
+        ('LDA_C_ML2', 'lda_c_ml2'),
+        ('LDA_C_OB_PW', 'lda_c_ob_pw'),
+        ('LDA_C_OB_PZ', 'lda_c_ob_pz'),
+        ('LDA_C_OW', 'lda_c_ow'),
+        ('LDA_C_OW_LYP', 'lda_c_ow_lyp'),
+        ('LDA_C_PK09', 'lda_c_pk09'),
+        ('LDA_C_PMGB06', 'lda_c_pmgb06'),
+        ('LDA_C_PW', 'lda_c_pw'),
+        ('LDA_C_PW_ERF', 'lda_c_pw_erf'),
+        ('LDA_C_PW_MOD', 'lda_c_pw_mod'),
+        ('LDA_C_PW_RPA', 'lda_c_pw_rpa'),
+        ('LDA_C_PZ', 'lda_c_pz'),
+        ('LDA_C_PZ_MOD', 'lda_c_pz_mod'),
+        ('LDA_C_RC04', 'lda_c_rc04'),
+        ('LDA_C_RPA', 'lda_c_rpa'),
+        ('LDA_C_RPW92', 'lda_c_rpw92'),
+        ('LDA_C_UPW92', 'lda_c_upw92'),
+        ('LDA_C_VBH', 'lda_c_vbh'),
+        ('LDA_C_VWN', 'lda_c_vwn'),
+        ('LDA_C_VWN_1', 'lda_c_vwn_1'),
+        ('LDA_C_VWN_2', 'lda_c_vwn_2'),
+        ('LDA_C_VWN_3', 'lda_c_vwn_3'),
+        ('LDA_C_VWN_4', 'lda_c_vwn_4'),
+        ('LDA_C_VWN_RPA', 'lda_c_vwn_rpa'),
+        ('LDA_C_W20', 'lda_c_w20'),
+        ('LDA_C_WIGNER', 'lda_c_wigner'),
+        ('LDA_C_XALPHA', 'lda_c_xalpha'),
+        ('GGA_C_ACGGA', 'gga_c_acgga'),
+        ('GGA_C_ACGGAP', 'gga_c_acggap'),
+        ('GGA_C_AM05', 'gga_c_am05'),
+        ('GGA_C_APBE', 'gga_c_apbe'),
+        ('GGA_C_BMK', 'gga_c_bmk'),
+        ('GGA_C_CCDF', 'gga_c_ccdf'),
+        ('GGA_C_CHACHIYO', 'gga_c_chachiyo'),
+        ('GGA_C_CS1', 'gga_c_cs1'),
+        ('GGA_C_FT97', 'gga_c_ft97'),
+        ('GGA_C_GAM', 'gga_c_gam'),
+        ('GGA_C_GAPC', 'gga_c_gapc'),
+        ('GGA_C_GAPLOC', 'gga_c_gaploc'),
+        ('GGA_C_HCTH_A', 'gga_c_hcth_a'),
+        ('GGA_C_HYB_TAU_HCTH', 'gga_c_hyb_tau_hcth'),
+        ('GGA_C_LM', 'gga_c_lm'),
+        ('GGA_C_LYP', 'gga_c_lyp'),
+        ('GGA_C_LYPR', 'gga_c_lypr'),
+        ('GGA_C_MGGAC', 'gga_c_mggac'),
+        ('GGA_C_N12', 'gga_c_n12'),
+        ('GGA_C_N12_SX', 'gga_c_n12_sx'),
+        ('GGA_C_OP_B88', 'gga_c_op_b88'),
+        ('GGA_C_OP_G96', 'gga_c_op_g96'),
+        ('GGA_C_OP_PBE', 'gga_c_op_pbe'),
+        ('GGA_C_OP_PW91', 'gga_c_op_pw91'),
+        ('GGA_C_OP_XALPHA', 'gga_c_op_xalpha'),
+        ('GGA_C_OPTC', 'gga_c_optc'),
+        ('GGA_C_P86', 'gga_c_p86'),
+        ('GGA_C_P86_FT', 'gga_c_p86_ft'),
+        ('GGA_C_P86VWN', 'gga_c_p86vwn'),
+        ('GGA_C_P86VWN_FT', 'gga_c_p86vwn_ft'),
+        ('GGA_C_PBE', 'gga_c_pbe'),
+        ('GGA_C_PBE_ERF_GWS', 'gga_c_pbe_erf_gws'),
+        ('GGA_C_PBE_GAUSSIAN', 'gga_c_pbe_gaussian'),
+        ('GGA_C_PBE_JRGX', 'gga_c_pbe_jrgx'),
+        ('GGA_C_PBE_MOL', 'gga_c_pbe_mol'),
+        ('GGA_C_PBE_SOL', 'gga_c_pbe_sol'),
+        ('GGA_C_PBE_VWN', 'gga_c_pbe_vwn'),
+        ('GGA_C_PBEFE', 'gga_c_pbefe'),
+        ('GGA_C_PBEINT', 'gga_c_pbeint'),
+        ('GGA_C_PBELOC', 'gga_c_pbeloc'),
+        ('GGA_C_PW91', 'gga_c_pw91'),
+        ('GGA_C_Q2D', 'gga_c_q2d'),
+        ('GGA_C_REGTPSS', 'gga_c_regtpss'),
+        ('GGA_C_REVTCA', 'gga_c_revtca'),
+        ('GGA_C_RGE2', 'gga_c_rge2'),
+        ('GGA_C_SCAN_E0', 'gga_c_scan_e0'),
+        ('GGA_C_SG4', 'gga_c_sg4'),
+        ('GGA_C_SOGGA11', 'gga_c_sogga11'),
+        ('GGA_C_SOGGA11_X', 'gga_c_sogga11_x'),
+        ('GGA_C_SPBE', 'gga_c_spbe'),
+        ('GGA_C_TAU_HCTH', 'gga_c_tau_hcth'),
+        ('GGA_C_TCA', 'gga_c_tca'),
+        ('GGA_C_TM_LYP', 'gga_c_tm_lyp'),
+        ('GGA_C_TM_PBE', 'gga_c_tm_pbe'),
+        ('GGA_C_W94', 'gga_c_w94'),
+        ('GGA_C_WI', 'gga_c_wi'),
+        ('GGA_C_WI0', 'gga_c_wi0'),
+        ('GGA_C_WL', 'gga_c_wl'),
+        ('GGA_C_XPBE', 'gga_c_xpbe'),
+        ('GGA_C_ZPBEINT', 'gga_c_zpbeint'),
+        ('GGA_C_ZPBESOL', 'gga_c_zpbesol'),
+        ('GGA_C_ZVPBEINT', 'gga_c_zvpbeint'),
+        ('GGA_C_ZVPBELOC', 'gga_c_zvpbeloc'),
+        ('GGA_C_ZVPBESOL', 'gga_c_zvpbesol'),
+        ('MGGA_C_B88', 'mgga_c_b88'),
+        ('MGGA_C_B94', 'mgga_c_b94'),
+        ('MGGA_C_BC95', 'mgga_c_bc95'),
+        ('MGGA_C_CC', 'mgga_c_cc'),
+        ('MGGA_C_CCALDA', 'mgga_c_ccalda'),
+        ('MGGA_C_CF22D', 'mgga_c_cf22d'),
+        ('MGGA_C_CS', 'mgga_c_cs'),
+        ('MGGA_C_DLDF', 'mgga_c_dldf'),
+        ('MGGA_C_HLTAPW', 'mgga_c_hltapw'),
+        ('MGGA_C_KCIS', 'mgga_c_kcis'),
+        ('MGGA_C_KCISK', 'mgga_c_kcisk'),
+        ('MGGA_C_M05', 'mgga_c_m05'),
+        ('MGGA_C_M05_2X', 'mgga_c_m05_2x'),
+        ('MGGA_C_M06', 'mgga_c_m06'),
+        ('MGGA_C_M06_2X', 'mgga_c_m06_2x'),
+        ('MGGA_C_M06_HF', 'mgga_c_m06_hf'),
+        ('MGGA_C_M06_L', 'mgga_c_m06_l'),
+        ('MGGA_C_M06_SX', 'mgga_c_m06_sx'),
+        ('MGGA_C_M08_HX', 'mgga_c_m08_hx'),
+        ('MGGA_C_M08_SO', 'mgga_c_m08_so'),
+        ('MGGA_C_M11', 'mgga_c_m11'),
+        ('MGGA_C_M11_L', 'mgga_c_m11_l'),
+        ('MGGA_C_MN12_L', 'mgga_c_mn12_l'),
+        ('MGGA_C_MN12_SX', 'mgga_c_mn12_sx'),
+        ('MGGA_C_MN15', 'mgga_c_mn15'),
+        ('MGGA_C_MN15_L', 'mgga_c_mn15_l'),
+        ('MGGA_C_PKZB', 'mgga_c_pkzb'),
+        ('MGGA_C_R2SCAN', 'mgga_c_r2scan'),
+        ('MGGA_C_R2SCAN01', 'mgga_c_r2scan01'),
+        ('MGGA_C_R2SCANL', 'mgga_c_r2scanl'),
+        ('MGGA_C_REVM06', 'mgga_c_revm06'),
+        ('MGGA_C_REVM06_L', 'mgga_c_revm06_l'),
+        ('MGGA_C_REVM11', 'mgga_c_revm11'),
+        ('MGGA_C_REVSCAN', 'mgga_c_revscan'),
+        ('MGGA_C_REVSCAN_VV10', 'mgga_c_revscan_vv10'),
+        ('MGGA_C_REVTM', 'mgga_c_revtm'),
+        ('MGGA_C_REVTPSS', 'mgga_c_revtpss'),
+        ('MGGA_C_RMGGAC', 'mgga_c_rmggac'),
+        ('MGGA_C_RPPSCAN', 'mgga_c_rppscan'),
+        ('MGGA_C_RREGTM', 'mgga_c_rregtm'),
+        ('MGGA_C_RSCAN', 'mgga_c_rscan'),
+        ('MGGA_C_SCAN', 'mgga_c_scan'),
+        ('MGGA_C_SCAN_RVV10', 'mgga_c_scan_rvv10'),
+        ('MGGA_C_SCAN_VV10', 'mgga_c_scan_vv10'),
+        ('MGGA_C_SCANL', 'mgga_c_scanl'),
+        ('MGGA_C_SCANL_RVV10', 'mgga_c_scanl_rvv10'),
+        ('MGGA_C_SCANL_VV10', 'mgga_c_scanl_vv10'),
+        ('MGGA_C_TM', 'mgga_c_tm'),
+        ('MGGA_C_TPSS', 'mgga_c_tpss'),
+        ('MGGA_C_TPSS_GAUSSIAN', 'mgga_c_tpss_gaussian'),
+        ('MGGA_C_TPSSLOC', 'mgga_c_tpssloc'),
+        ('MGGA_C_VSXC', 'mgga_c_vsxc'),
+    ),
+    'ExCorrLibXC': (
+        ('LDA_XC_1D_EHWLRG_1', 'lda_xc_1d_ehwlrg_1'),
+        ('LDA_XC_1D_EHWLRG_2', 'lda_xc_1d_ehwlrg_2'),
+        ('LDA_XC_1D_EHWLRG_3', 'lda_xc_1d_ehwlrg_3'),
+        ('LDA_XC_CORRKSDT', 'lda_xc_corrksdt'),
+        ('LDA_XC_GDSMFB', 'lda_xc_gdsmfb'),
+        ('LDA_XC_KSDT', 'lda_xc_ksdt'),
+        ('LDA_XC_LP_A', 'lda_xc_lp_a'),
+        ('LDA_XC_LP_B', 'lda_xc_lp_b'),
+        ('LDA_XC_TETER93', 'lda_xc_teter93'),
+        ('LDA_XC_TIH', 'lda_xc_tih'),
+        ('LDA_XC_ZLP', 'lda_xc_zlp'),
+        ('GGA_XC_B97_3C', 'gga_xc_b97_3c'),
+        ('GGA_XC_B97_D', 'gga_xc_b97_d'),
+        ('GGA_XC_B97_GGA1', 'gga_xc_b97_gga1'),
+        ('GGA_XC_BEEFVDW', 'gga_xc_beefvdw'),
+        ('GGA_XC_EDF1', 'gga_xc_edf1'),
+        ('GGA_XC_HCTH_120', 'gga_xc_hcth_120'),
+        ('GGA_XC_HCTH_147', 'gga_xc_hcth_147'),
+        ('GGA_XC_HCTH_407', 'gga_xc_hcth_407'),
+        ('GGA_XC_HCTH_407P', 'gga_xc_hcth_407p'),
+        ('GGA_XC_HCTH_93', 'gga_xc_hcth_93'),
+        ('GGA_XC_HCTH_P14', 'gga_xc_hcth_p14'),
+        ('GGA_XC_HCTH_P76', 'gga_xc_hcth_p76'),
+        ('GGA_XC_HLE16', 'gga_xc_hle16'),
+        ('GGA_XC_KT1', 'gga_xc_kt1'),
+        ('GGA_XC_KT2', 'gga_xc_kt2'),
+        ('GGA_XC_KT3', 'gga_xc_kt3'),
+        ('GGA_XC_MOHLYP', 'gga_xc_mohlyp'),
+        ('GGA_XC_MOHLYP2', 'gga_xc_mohlyp2'),
+        ('GGA_XC_MPWLYP1W', 'gga_xc_mpwlyp1w'),
+        ('GGA_XC_NCAP', 'gga_xc_ncap'),
+        ('GGA_XC_OBLYP_D', 'gga_xc_oblyp_d'),
+        ('GGA_XC_OPBE_D', 'gga_xc_opbe_d'),
+        ('GGA_XC_OPWLYP_D', 'gga_xc_opwlyp_d'),
+        ('GGA_XC_PBE1W', 'gga_xc_pbe1w'),
+        ('GGA_XC_PBELYP1W', 'gga_xc_pbelyp1w'),
+        ('GGA_XC_TH1', 'gga_xc_th1'),
+        ('GGA_XC_TH2', 'gga_xc_th2'),
+        ('GGA_XC_TH3', 'gga_xc_th3'),
+        ('GGA_XC_TH4', 'gga_xc_th4'),
+        ('GGA_XC_TH_FC', 'gga_xc_th_fc'),
+        ('GGA_XC_TH_FCFO', 'gga_xc_th_fcfo'),
+        ('GGA_XC_TH_FCO', 'gga_xc_th_fco'),
+        ('GGA_XC_TH_FL', 'gga_xc_th_fl'),
+        ('GGA_XC_VV10', 'gga_xc_vv10'),
+        ('GGA_XC_XLYP', 'gga_xc_xlyp'),
+        ('MGGA_XC_B97M_V', 'mgga_xc_b97m_v'),
+        ('MGGA_XC_CC06', 'mgga_xc_cc06'),
+        ('MGGA_XC_HLE17', 'mgga_xc_hle17'),
+        ('MGGA_XC_LP90', 'mgga_xc_lp90'),
+        ('MGGA_XC_OTPSS_D', 'mgga_xc_otpss_d'),
+        ('MGGA_XC_TPSSLYP1W', 'mgga_xc_tpsslyp1w'),
+        ('MGGA_XC_VCML_RVV10', 'mgga_xc_vcml_rvv10'),
+        ('MGGA_XC_ZLP', 'mgga_xc_zlp'),
+        ('HYB_GGA_XC_APBE0', 'hyb_gga_xc_apbe0'),
+        ('HYB_GGA_XC_APF', 'hyb_gga_xc_apf'),
+        ('HYB_GGA_XC_B1LYP', 'hyb_gga_xc_b1lyp'),
+        ('HYB_GGA_XC_B1PW91', 'hyb_gga_xc_b1pw91'),
+        ('HYB_GGA_XC_B1WC', 'hyb_gga_xc_b1wc'),
+        ('HYB_GGA_XC_B3LYP', 'hyb_gga_xc_b3lyp'),
+        ('HYB_GGA_XC_B3LYP3', 'hyb_gga_xc_b3lyp3'),
+        ('HYB_GGA_XC_B3LYP5', 'hyb_gga_xc_b3lyp5'),
+        ('HYB_GGA_XC_B3LYP_MCM1', 'hyb_gga_xc_b3lyp_mcm1'),
+        ('HYB_GGA_XC_B3LYP_MCM2', 'hyb_gga_xc_b3lyp_mcm2'),
+        ('HYB_GGA_XC_B3LYPS', 'hyb_gga_xc_b3lyps'),
+        ('HYB_GGA_XC_B3P86', 'hyb_gga_xc_b3p86'),
+        ('HYB_GGA_XC_B3P86_NWCHEM', 'hyb_gga_xc_b3p86_nwchem'),
+        ('HYB_GGA_XC_B3PW91', 'hyb_gga_xc_b3pw91'),
+        ('HYB_GGA_XC_B5050LYP', 'hyb_gga_xc_b5050lyp'),
+        ('HYB_GGA_XC_B97', 'hyb_gga_xc_b97'),
+        ('HYB_GGA_XC_B97_1', 'hyb_gga_xc_b97_1'),
+        ('HYB_GGA_XC_B97_1P', 'hyb_gga_xc_b97_1p'),
+        ('HYB_GGA_XC_B97_2', 'hyb_gga_xc_b97_2'),
+        ('HYB_GGA_XC_B97_3', 'hyb_gga_xc_b97_3'),
+        ('HYB_GGA_XC_B97_K', 'hyb_gga_xc_b97_k'),
+        ('HYB_GGA_XC_BHANDH', 'hyb_gga_xc_bhandh'),
+        ('HYB_GGA_XC_BHANDHLYP', 'hyb_gga_xc_bhandhlyp'),
+        ('HYB_GGA_XC_BLYP35', 'hyb_gga_xc_blyp35'),
+        ('HYB_GGA_XC_CAM_B3LYP', 'hyb_gga_xc_cam_b3lyp'),
+        ('HYB_GGA_XC_CAM_O3LYP', 'hyb_gga_xc_cam_o3lyp'),
+        ('HYB_GGA_XC_CAM_PBEH', 'hyb_gga_xc_cam_pbeh'),
+        ('HYB_GGA_XC_CAM_QTP_00', 'hyb_gga_xc_cam_qtp_00'),
+        ('HYB_GGA_XC_CAM_QTP_01', 'hyb_gga_xc_cam_qtp_01'),
+        ('HYB_GGA_XC_CAM_QTP_02', 'hyb_gga_xc_cam_qtp_02'),
+        ('HYB_GGA_XC_CAMH_B3LYP', 'hyb_gga_xc_camh_b3lyp'),
+        ('HYB_GGA_XC_CAMY_B3LYP', 'hyb_gga_xc_camy_b3lyp'),
+        ('HYB_GGA_XC_CAMY_BLYP', 'hyb_gga_xc_camy_blyp'),
+        ('HYB_GGA_XC_CAMY_PBEH', 'hyb_gga_xc_camy_pbeh'),
+        ('HYB_GGA_XC_CAP0', 'hyb_gga_xc_cap0'),
+        ('HYB_GGA_XC_CASE21', 'hyb_gga_xc_case21'),
+        ('HYB_GGA_XC_EDF2', 'hyb_gga_xc_edf2'),
+        ('HYB_GGA_XC_HAPBE', 'hyb_gga_xc_hapbe'),
+        ('HYB_GGA_XC_HFLYP', 'hyb_gga_xc_hflyp'),
+        ('HYB_GGA_XC_HJS_B88', 'hyb_gga_xc_hjs_b88'),
+        ('HYB_GGA_XC_HJS_B97X', 'hyb_gga_xc_hjs_b97x'),
+        ('HYB_GGA_XC_HJS_PBE', 'hyb_gga_xc_hjs_pbe'),
+        ('HYB_GGA_XC_HJS_PBE_SOL', 'hyb_gga_xc_hjs_pbe_sol'),
+        ('HYB_GGA_XC_HPBEINT', 'hyb_gga_xc_hpbeint'),
+        ('HYB_GGA_XC_HSE03', 'hyb_gga_xc_hse03'),
+        ('HYB_GGA_XC_HSE06', 'hyb_gga_xc_hse06'),
+        ('HYB_GGA_XC_HSE12', 'hyb_gga_xc_hse12'),
+        ('HYB_GGA_XC_HSE12S', 'hyb_gga_xc_hse12s'),
+        ('HYB_GGA_XC_HSE_SOL', 'hyb_gga_xc_hse_sol'),
+        ('HYB_GGA_XC_KMLYP', 'hyb_gga_xc_kmlyp'),
+        ('HYB_GGA_XC_LB07', 'hyb_gga_xc_lb07'),
+        ('HYB_GGA_XC_LC_BLYP', 'hyb_gga_xc_lc_blyp'),
+        ('HYB_GGA_XC_LC_BLYP_EA', 'hyb_gga_xc_lc_blyp_ea'),
+        ('HYB_GGA_XC_LC_BLYPR', 'hyb_gga_xc_lc_blypr'),
+        ('HYB_GGA_XC_LC_BOP', 'hyb_gga_xc_lc_bop'),
+        ('HYB_GGA_XC_LC_PBEOP', 'hyb_gga_xc_lc_pbeop'),
+        ('HYB_GGA_XC_LC_QTP', 'hyb_gga_xc_lc_qtp'),
+        ('HYB_GGA_XC_LC_VV10', 'hyb_gga_xc_lc_vv10'),
+        ('HYB_GGA_XC_LC_WPBE', 'hyb_gga_xc_lc_wpbe'),
+        ('HYB_GGA_XC_LC_WPBE08_WHS', 'hyb_gga_xc_lc_wpbe08_whs'),
+        ('HYB_GGA_XC_LC_WPBE_WHS', 'hyb_gga_xc_lc_wpbe_whs'),
+        ('HYB_GGA_XC_LC_WPBEH_WHS', 'hyb_gga_xc_lc_wpbeh_whs'),
+        ('HYB_GGA_XC_LC_WPBESOL_WHS', 'hyb_gga_xc_lc_wpbesol_whs'),
+        ('HYB_GGA_XC_LCY_BLYP', 'hyb_gga_xc_lcy_blyp'),
+        ('HYB_GGA_XC_LCY_PBE', 'hyb_gga_xc_lcy_pbe'),
+        ('HYB_GGA_XC_LRC_WPBE', 'hyb_gga_xc_lrc_wpbe'),
+        ('HYB_GGA_XC_LRC_WPBEH', 'hyb_gga_xc_lrc_wpbeh'),
+        ('HYB_GGA_XC_MB3LYP_RC04', 'hyb_gga_xc_mb3lyp_rc04'),
+        ('HYB_GGA_XC_MCAM_B3LYP', 'hyb_gga_xc_mcam_b3lyp'),
+        ('HYB_GGA_XC_MPW1K', 'hyb_gga_xc_mpw1k'),
+        ('HYB_GGA_XC_MPW1LYP', 'hyb_gga_xc_mpw1lyp'),
+        ('HYB_GGA_XC_MPW1PBE', 'hyb_gga_xc_mpw1pbe'),
+        ('HYB_GGA_XC_MPW1PW', 'hyb_gga_xc_mpw1pw'),
+        ('HYB_GGA_XC_MPW3LYP', 'hyb_gga_xc_mpw3lyp'),
+        ('HYB_GGA_XC_MPW3PW', 'hyb_gga_xc_mpw3pw'),
+        ('HYB_GGA_XC_MPWLYP1M', 'hyb_gga_xc_mpwlyp1m'),
+        ('HYB_GGA_XC_O3LYP', 'hyb_gga_xc_o3lyp'),
+        ('HYB_GGA_XC_OPB3LYP', 'hyb_gga_xc_opb3lyp'),
+        ('HYB_GGA_XC_PBE0_13', 'hyb_gga_xc_pbe0_13'),
+        ('HYB_GGA_XC_PBE38', 'hyb_gga_xc_pbe38'),
+        ('HYB_GGA_XC_PBE50', 'hyb_gga_xc_pbe50'),
+        ('HYB_GGA_XC_PBE_2X', 'hyb_gga_xc_pbe_2x'),
+        ('HYB_GGA_XC_PBE_MOL0', 'hyb_gga_xc_pbe_mol0'),
+        ('HYB_GGA_XC_PBE_MOLB0', 'hyb_gga_xc_pbe_molb0'),
+        ('HYB_GGA_XC_PBE_SOL0', 'hyb_gga_xc_pbe_sol0'),
+        ('HYB_GGA_XC_PBEB0', 'hyb_gga_xc_pbeb0'),
+        ('HYB_GGA_XC_PBEH', 'hyb_gga_xc_pbeh'),
+        ('HYB_GGA_XC_QTP17', 'hyb_gga_xc_qtp17'),
+        ('HYB_GGA_XC_RCAM_B3LYP', 'hyb_gga_xc_rcam_b3lyp'),
+        ('HYB_GGA_XC_RELPBE0', 'hyb_gga_xc_relpbe0'),
+        ('HYB_GGA_XC_REVB3LYP', 'hyb_gga_xc_revb3lyp'),
+        ('HYB_GGA_XC_SB98_1A', 'hyb_gga_xc_sb98_1a'),
+        ('HYB_GGA_XC_SB98_1B', 'hyb_gga_xc_sb98_1b'),
+        ('HYB_GGA_XC_SB98_1C', 'hyb_gga_xc_sb98_1c'),
+        ('HYB_GGA_XC_SB98_2A', 'hyb_gga_xc_sb98_2a'),
+        ('HYB_GGA_XC_SB98_2B', 'hyb_gga_xc_sb98_2b'),
+        ('HYB_GGA_XC_SB98_2C', 'hyb_gga_xc_sb98_2c'),
+        ('HYB_GGA_XC_TUNED_CAM_B3LYP', 'hyb_gga_xc_tuned_cam_b3lyp'),
+        ('HYB_GGA_XC_WB97', 'hyb_gga_xc_wb97'),
+        ('HYB_GGA_XC_WB97X', 'hyb_gga_xc_wb97x'),
+        ('HYB_GGA_XC_WB97X_D', 'hyb_gga_xc_wb97x_d'),
+        ('HYB_GGA_XC_WB97X_D3', 'hyb_gga_xc_wb97x_d3'),
+        ('HYB_GGA_XC_WB97X_V', 'hyb_gga_xc_wb97x_v'),
+        ('HYB_GGA_XC_WC04', 'hyb_gga_xc_wc04'),
+        ('HYB_GGA_XC_WHPBE0', 'hyb_gga_xc_whpbe0'),
+        ('HYB_GGA_XC_WP04', 'hyb_gga_xc_wp04'),
+        ('HYB_GGA_XC_X3LYP', 'hyb_gga_xc_x3lyp'),
+        ('HYB_MGGA_XC_B0KCIS', 'hyb_mgga_xc_b0kcis'),
+        ('HYB_MGGA_XC_B86B95', 'hyb_mgga_xc_b86b95'),
+        ('HYB_MGGA_XC_B88B95', 'hyb_mgga_xc_b88b95'),
+        ('HYB_MGGA_XC_B94_HYB', 'hyb_mgga_xc_b94_hyb'),
+        ('HYB_MGGA_XC_B98', 'hyb_mgga_xc_b98'),
+        ('HYB_MGGA_XC_BB1K', 'hyb_mgga_xc_bb1k'),
+        ('HYB_MGGA_XC_BR3P86', 'hyb_mgga_xc_br3p86'),
+        ('HYB_MGGA_XC_EDMGGAH', 'hyb_mgga_xc_edmggah'),
+        ('HYB_MGGA_XC_GAS22', 'hyb_mgga_xc_gas22'),
+        ('HYB_MGGA_XC_LC_TMLYP', 'hyb_mgga_xc_lc_tmlyp'),
+        ('HYB_MGGA_XC_MPW1B95', 'hyb_mgga_xc_mpw1b95'),
+        ('HYB_MGGA_XC_MPW1KCIS', 'hyb_mgga_xc_mpw1kcis'),
+        ('HYB_MGGA_XC_MPWB1K', 'hyb_mgga_xc_mpwb1k'),
+        ('HYB_MGGA_XC_MPWKCIS1K', 'hyb_mgga_xc_mpwkcis1k'),
+        ('HYB_MGGA_XC_PBE1KCIS', 'hyb_mgga_xc_pbe1kcis'),
+        ('HYB_MGGA_XC_PW6B95', 'hyb_mgga_xc_pw6b95'),
+        ('HYB_MGGA_XC_PW86B95', 'hyb_mgga_xc_pw86b95'),
+        ('HYB_MGGA_XC_PWB6K', 'hyb_mgga_xc_pwb6k'),
+        ('HYB_MGGA_XC_R2SCAN0', 'hyb_mgga_xc_r2scan0'),
+        ('HYB_MGGA_XC_R2SCAN50', 'hyb_mgga_xc_r2scan50'),
+        ('HYB_MGGA_XC_R2SCANH', 'hyb_mgga_xc_r2scanh'),
+        ('HYB_MGGA_XC_REVTPSSH', 'hyb_mgga_xc_revtpssh'),
+        ('HYB_MGGA_XC_TPSS0', 'hyb_mgga_xc_tpss0'),
+        ('HYB_MGGA_XC_TPSS1KCIS', 'hyb_mgga_xc_tpss1kcis'),
+        ('HYB_MGGA_XC_TPSSH', 'hyb_mgga_xc_tpssh'),
+        ('HYB_MGGA_XC_WB97M_V', 'hyb_mgga_xc_wb97m_v'),
+        ('HYB_MGGA_XC_X1B95', 'hyb_mgga_xc_x1b95'),
+        ('HYB_MGGA_XC_XB1K', 'hyb_mgga_xc_xb1k'),
+        ('HYB_LDA_XC_BN05', 'hyb_lda_xc_bn05'),
+        ('HYB_LDA_XC_CAM_LDA0', 'hyb_lda_xc_cam_lda0'),
+        ('HYB_LDA_XC_LDA0', 'hyb_lda_xc_lda0'),
+    ),
+}
+
+# Lowercase value to member name
+LIBXC_LOWERCASE = {
+    'SimpleLibXC': {
+        'pwlda': 'PWLDA',
+        'vwn5': 'VWN5',
+        'b97-d': 'B97_D',
+        'b97-d3': 'B97_D3',
+        'b97-d4': 'B97_D4',
+        'blyp': 'BLYP',
+        'bpbe': 'BPBE',
+        'bpw91': 'BPW91',
+        'bvwn': 'BVWN',
+        'glyp': 'GLYP',
+        'kt2': 'KT2',
+        'kt3': 'KT3',
+        'mpwlyp': 'MPWLYP',
+        'mpwpw': 'MPWPW',
+        'opbe': 'OPBE',
+        'olyp': 'OLYP',
+        'rpw86pbe': 'RPW86PBE',
+        'pw86pbe': 'PW86PBE',
+        'pw91': 'PW91',
+        'pbe': 'PBE',
+        'rpbe': 'RPBE',
+        'revpbe': 'REVPBE',
+        'xlyp': 'XLYP',
+        'b97m-v': 'B97M_V',
+        'b97m-d3bj': 'B97M_D3BJ',
+        'b97m-d4': 'B97M_D4',
+        'm06l': 'M06L',
+        'mn15l': 'MN15L',
+        'mtask-lda': 'MTASK_LDA',
+        'mtask-scan': 'MTASK_SCAN',
+        'revtm': 'REVTM',
+        'r2scan': 'R2SCAN',
+        'rscan': 'RSCAN',
+        'scan': 'SCAN',
+        'task-ccalda': 'TASK_CCALDA',
+        'task-cc': 'TASK_CC',
+        'task-lda': 'TASK_LDA',
+        'task-scan': 'TASK_SCAN',
+        'tm': 'TM',
+        'tpss': 'TPSS',
+        'hflda': 'HFLDA',
+        'bhandhlyp': 'BHANDHLYP',
+        'b1lyp': 'B1LYP',
+        'b1pw91': 'B1PW91',
+        'b1pw': 'B1PW',
+        'b1pbe': 'B1PBE',
+        'b3pw91': 'B3PW91',
+        'b3lyp': 'B3LYP',
+        'b3lyp/g': 'B3LYP_G',
+        'b3lyps': 'B3LYPS',
+        'blyp35': 'BLYP35',
+        'b97': 'B97',
+        'cam-b3lyp': 'CAM_B3LYP',
+        'case21': 'CASE21',
+        'g1lyp': 'G1LYP',
+        'hse03': 'HSE03',
+        'hse12': 'HSE12',
+        'hse12s': 'HSE12S',
+        'hsesol': 'HSESOL',
+        'kmlyp': 'KMLYP',
+        'lb07': 'LB07',
+        'lc-blyp': 'LC_BLYP',
+        'mpw1lyp': 'MPW1LYP',
+        'mpw1pw': 'MPW1PW',
+        'pbe0': 'PBE0',
+        'pbe38': 'PBE38',
+        'pbe50': 'PBE50',
+        'pw91_0': 'PW91_0',
+        'pw1pw': 'PW1PW',
+        'revpbe0': 'REVPBE0',
+        'revpbe38': 'REVPBE38',
+        'whpbe0': 'WHPBE0',
+        'wb97': 'WB97',
+        'wb97x': 'WB97X',
+        'wb97x-d3': 'WB97X_D3',
+        'wb97x-v': 'WB97X_V',
+        'wb97x-d3bj': 'WB97X_D3BJ',
+        'wb97x-d4': 'WB97X_D4',
+        'wb97x-d4rev': 'WB97X_D4REV',
+        'gas22': 'GAS22',
+        'm05': 'M05',
+        'm052x': 'M052X',
+        'm06': 'M06',
+        'm062x': 'M062X',
+        'm06sx': 'M06SX',
+        'mn15': 'MN15',
+        'lc-tmlyp': 'LC_TMLYP',
+        'pw6b95': 'PW6B95',
+        'r2scanh': 'R2SCANH',
+        'r2scan0': 'R2SCAN0',
+        'r2scan38': 'R2SCAN38',
+        'r2scan50': 'R2SCAN50',
+        'scan0': 'SCAN0',
+        'tpss0': 'TPSS0',
+        'tpssh': 'TPSSH',
+        'wb97m-v': 'WB97M_V',
+        'wb97m-d3bj': 'WB97M_D3BJ',
+        'wb97m-d4': 'WB97M_D4',
+        'wb97m-d4rev': 'WB97M_D4REV',
+        'b2plyp': 'B2PLYP',
+        'b2gp-plyp': 'B2GP_PLYP',
+        'b2t-plyp': 'B2T_PLYP',
+        'b2k-plyp': 'B2K_PLYP',
+        'b2nc-plyp': 'B2NC_PLYP',
+        'dsd-pbeb95-d3': 'DSD_PBEB95_D3',
+        'dsd-pbeb95-d4': 'DSD_PBEB95_D4',
+        'mpw2-plyp': 'MPW2_PLYP',
+        'pwpb95': 'PWPB95',
+        'pbe0-dh': 'PBE0_DH',
+        'pbe0-2': 'PBE0_2',
+        'pbe-qidh': 'PBE_QIDH',
+        'pr2scan50': 'PR2SCAN50',
+        'pr2scan69': 'PR2SCAN69',
+        'sos1-r2scan0-dh': 'SOS1_R2SCAN0_DH',
+        'sos1-r2scan-cidh': 'SOS1_R2SCAN_CIDH',
+        'sos1-r2scan-qidh': 'SOS1_R2SCAN_QIDH',
+        'sos1-r2scan0-2': 'SOS1_R2SCAN0_2',
+    },
+    'ExchangeLibXC': {
+        'lda_x': 'LDA_X',
+        'lda_x_1d_exponential': 'LDA_X_1D_EXPONENTIAL',
+        'lda_x_1d_soft': 'LDA_X_1D_SOFT',
+        'lda_x_2d': 'LDA_X_2D',
+        'lda_x_erf': 'LDA_X_ERF',
+        'lda_x_rae': 'LDA_X_RAE',
+        'lda_x_rel': 'LDA_X_REL',
+        'lda_x_sloc': 'LDA_X_SLOC',
+        'lda_x_yukawa': 'LDA_X_YUKAWA',
+        'gga_x_2d_b86': 'GGA_X_2D_B86',
+        'gga_x_2d_b86_mgc': 'GGA_X_2D_B86_MGC',
+        'gga_x_2d_b88': 'GGA_X_2D_B88',
+        'gga_x_2d_pbe': 'GGA_X_2D_PBE',
+        'gga_x_airy': 'GGA_X_AIRY',
+        'gga_x_ak13': 'GGA_X_AK13',
+        'gga_x_am05': 'GGA_X_AM05',
+        'gga_x_apbe': 'GGA_X_APBE',
+        'gga_x_b86': 'GGA_X_B86',
+        'gga_x_b86_mgc': 'GGA_X_B86_MGC',
+        'gga_x_b86_r': 'GGA_X_B86_R',
+        'gga_x_b88': 'GGA_X_B88',
+        'gga_x_b88_6311g': 'GGA_X_B88_6311G',
+        'gga_x_b88m': 'GGA_X_B88M',
+        'gga_x_bayesian': 'GGA_X_BAYESIAN',
+        'gga_x_bcgp': 'GGA_X_BCGP',
+        'gga_x_beefvdw': 'GGA_X_BEEFVDW',
+        'gga_x_bkl1': 'GGA_X_BKL1',
+        'gga_x_bkl2': 'GGA_X_BKL2',
+        'gga_x_bpccac': 'GGA_X_BPCCAC',
+        'gga_x_c09x': 'GGA_X_C09X',
+        'gga_x_cap': 'GGA_X_CAP',
+        'gga_x_chachiyo': 'GGA_X_CHACHIYO',
+        'gga_x_dk87_r1': 'GGA_X_DK87_R1',
+        'gga_x_dk87_r2': 'GGA_X_DK87_R2',
+        'gga_x_eb88': 'GGA_X_EB88',
+        'gga_x_ecmv92': 'GGA_X_ECMV92',
+        'gga_x_ev93': 'GGA_X_EV93',
+        'gga_x_fd_lb94': 'GGA_X_FD_LB94',
+        'gga_x_fd_revlb94': 'GGA_X_FD_REVLB94',
+        'gga_x_ft97_a': 'GGA_X_FT97_A',
+        'gga_x_ft97_b': 'GGA_X_FT97_B',
+        'gga_x_g96': 'GGA_X_G96',
+        'gga_x_gam': 'GGA_X_GAM',
+        'gga_x_gg99': 'GGA_X_GG99',
+        'gga_x_hcth_a': 'GGA_X_HCTH_A',
+        'gga_x_hjs_b88': 'GGA_X_HJS_B88',
+        'gga_x_hjs_b88_v2': 'GGA_X_HJS_B88_V2',
+        'gga_x_hjs_b97x': 'GGA_X_HJS_B97X',
+        'gga_x_hjs_pbe': 'GGA_X_HJS_PBE',
+        'gga_x_hjs_pbe_sol': 'GGA_X_HJS_PBE_SOL',
+        'gga_x_htbs': 'GGA_X_HTBS',
+        'gga_x_ityh': 'GGA_X_ITYH',
+        'gga_x_ityh_optx': 'GGA_X_ITYH_OPTX',
+        'gga_x_ityh_pbe': 'GGA_X_ITYH_PBE',
+        'gga_x_kgg99': 'GGA_X_KGG99',
+        'gga_x_kt1': 'GGA_X_KT1',
+        'gga_x_lag': 'GGA_X_LAG',
+        'gga_x_lambda_ch_n': 'GGA_X_LAMBDA_CH_N',
+        'gga_x_lambda_lo_n': 'GGA_X_LAMBDA_LO_N',
+        'gga_x_lambda_oc2_n': 'GGA_X_LAMBDA_OC2_N',
+        'gga_x_lb': 'GGA_X_LB',
+        'gga_x_lbm': 'GGA_X_LBM',
+        'gga_x_lg93': 'GGA_X_LG93',
+        'gga_x_lspbe': 'GGA_X_LSPBE',
+        'gga_x_lsrpbe': 'GGA_X_LSRPBE',
+        'gga_x_lv_rpw86': 'GGA_X_LV_RPW86',
+        'gga_x_mb88': 'GGA_X_MB88',
+        'gga_x_mpbe': 'GGA_X_MPBE',
+        'gga_x_mpw91': 'GGA_X_MPW91',
+        'gga_x_n12': 'GGA_X_N12',
+        'gga_x_ncap': 'GGA_X_NCAP',
+        'gga_x_ncapr': 'GGA_X_NCAPR',
+        'gga_x_ol2': 'GGA_X_OL2',
+        'gga_x_optb86b_vdw': 'GGA_X_OPTB86B_VDW',
+        'gga_x_optb88_vdw': 'GGA_X_OPTB88_VDW',
+        'gga_x_optpbe_vdw': 'GGA_X_OPTPBE_VDW',
+        'gga_x_optx': 'GGA_X_OPTX',
+        'gga_x_pbe': 'GGA_X_PBE',
+        'gga_x_pbe_erf_gws': 'GGA_X_PBE_ERF_GWS',
+        'gga_x_pbe_gaussian': 'GGA_X_PBE_GAUSSIAN',
+        'gga_x_pbe_jsjr': 'GGA_X_PBE_JSJR',
+        'gga_x_pbe_mod': 'GGA_X_PBE_MOD',
+        'gga_x_pbe_mol': 'GGA_X_PBE_MOL',
+        'gga_x_pbe_r': 'GGA_X_PBE_R',
+        'gga_x_pbe_sol': 'GGA_X_PBE_SOL',
+        'gga_x_pbe_tca': 'GGA_X_PBE_TCA',
+        'gga_x_pbea': 'GGA_X_PBEA',
+        'gga_x_pbefe': 'GGA_X_PBEFE',
+        'gga_x_pbeint': 'GGA_X_PBEINT',
+        'gga_x_pbek1_vdw': 'GGA_X_PBEK1_VDW',
+        'gga_x_pbepow': 'GGA_X_PBEPOW',
+        'gga_x_pbetrans': 'GGA_X_PBETRANS',
+        'gga_x_pw86': 'GGA_X_PW86',
+        'gga_x_pw91': 'GGA_X_PW91',
+        'gga_x_pw91_mod': 'GGA_X_PW91_MOD',
+        'gga_x_q1d': 'GGA_X_Q1D',
+        'gga_x_q2d': 'GGA_X_Q2D',
+        'gga_x_revssb_d': 'GGA_X_REVSSB_D',
+        'gga_x_rge2': 'GGA_X_RGE2',
+        'gga_x_rpbe': 'GGA_X_RPBE',
+        'gga_x_rpw86': 'GGA_X_RPW86',
+        'gga_x_s12g': 'GGA_X_S12G',
+        'gga_x_sfat': 'GGA_X_SFAT',
+        'gga_x_sfat_pbe': 'GGA_X_SFAT_PBE',
+        'gga_x_sg4': 'GGA_X_SG4',
+        'gga_x_sogga': 'GGA_X_SOGGA',
+        'gga_x_sogga11': 'GGA_X_SOGGA11',
+        'gga_x_ssb': 'GGA_X_SSB',
+        'gga_x_ssb_d': 'GGA_X_SSB_D',
+        'gga_x_ssb_sw': 'GGA_X_SSB_SW',
+        'gga_x_vmt84_ge': 'GGA_X_VMT84_GE',
+        'gga_x_vmt84_pbe': 'GGA_X_VMT84_PBE',
+        'gga_x_vmt_ge': 'GGA_X_VMT_GE',
+        'gga_x_vmt_pbe': 'GGA_X_VMT_PBE',
+        'gga_x_wc': 'GGA_X_WC',
+        'gga_x_wpbeh': 'GGA_X_WPBEH',
+        'gga_x_xpbe': 'GGA_X_XPBE',
+        'mgga_x_2d_js17': 'MGGA_X_2D_JS17',
+        'mgga_x_2d_prhg07': 'MGGA_X_2D_PRHG07',
+        'mgga_x_2d_prhg07_prp10': 'MGGA_X_2D_PRHG07_PRP10',
+        'mgga_x_b00': 'MGGA_X_B00',
+        'mgga_x_bj06': 'MGGA_X_BJ06',
+        'mgga_x_bloc': 'MGGA_X_BLOC',
+        'mgga_x_br89': 'MGGA_X_BR89',
+        'mgga_x_br89_1': 'MGGA_X_BR89_1',
+        'mgga_x_br89_explicit': 'MGGA_X_BR89_EXPLICIT',
+        'mgga_x_br89_explicit_1': 'MGGA_X_BR89_EXPLICIT_1',
+        'mgga_x_edmgga': 'MGGA_X_EDMGGA',
+        'mgga_x_eel': 'MGGA_X_EEL',
+        'mgga_x_ft98': 'MGGA_X_FT98',
+        'mgga_x_gdme_0': 'MGGA_X_GDME_0',
+        'mgga_x_gdme_kos': 'MGGA_X_GDME_KOS',
+        'mgga_x_gdme_nv': 'MGGA_X_GDME_NV',
+        'mgga_x_gdme_vt': 'MGGA_X_GDME_VT',
+        'mgga_x_gvt4': 'MGGA_X_GVT4',
+        'mgga_x_gx': 'MGGA_X_GX',
+        'mgga_x_hlta': 'MGGA_X_HLTA',
+        'mgga_x_jk': 'MGGA_X_JK',
+        'mgga_x_ktbm_0': 'MGGA_X_KTBM_0',
+        'mgga_x_ktbm_1': 'MGGA_X_KTBM_1',
+        'mgga_x_ktbm_10': 'MGGA_X_KTBM_10',
+        'mgga_x_ktbm_11': 'MGGA_X_KTBM_11',
+        'mgga_x_ktbm_12': 'MGGA_X_KTBM_12',
+        'mgga_x_ktbm_13': 'MGGA_X_KTBM_13',
+        'mgga_x_ktbm_14': 'MGGA_X_KTBM_14',
+        'mgga_x_ktbm_15': 'MGGA_X_KTBM_15',
+        'mgga_x_ktbm_16': 'MGGA_X_KTBM_16',
+        'mgga_x_ktbm_17': 'MGGA_X_KTBM_17',
+        'mgga_x_ktbm_18': 'MGGA_X_KTBM_18',
+        'mgga_x_ktbm_19': 'MGGA_X_KTBM_19',
+        'mgga_x_ktbm_2': 'MGGA_X_KTBM_2',
+        'mgga_x_ktbm_20': 'MGGA_X_KTBM_20',
+        'mgga_x_ktbm_21': 'MGGA_X_KTBM_21',
+        'mgga_x_ktbm_22': 'MGGA_X_KTBM_22',
+        'mgga_x_ktbm_23': 'MGGA_X_KTBM_23',
+        'mgga_x_ktbm_24': 'MGGA_X_KTBM_24',
+        'mgga_x_ktbm_3': 'MGGA_X_KTBM_3',
+        'mgga_x_ktbm_4': 'MGGA_X_KTBM_4',
+        'mgga_x_ktbm_5': 'MGGA_X_KTBM_5',
+        'mgga_x_ktbm_6': 'MGGA_X_KTBM_6',
+        'mgga_x_ktbm_7': 'MGGA_X_KTBM_7',
+        'mgga_x_ktbm_8': 'MGGA_X_KTBM_8',
+        'mgga_x_ktbm_9': 'MGGA_X_KTBM_9',
+        'mgga_x_ktbm_gap': 'MGGA_X_KTBM_GAP',
+        'mgga_x_lak': 'MGGA_X_LAK',
+        'mgga_x_lta': 'MGGA_X_LTA',
+        'mgga_x_m06_l': 'MGGA_X_M06_L',
+        'mgga_x_m11_l': 'MGGA_X_M11_L',
+        'mgga_x_mbeef': 'MGGA_X_MBEEF',
+        'mgga_x_mbeefvdw': 'MGGA_X_MBEEFVDW',
+        'mgga_x_mbr': 'MGGA_X_MBR',
+        'mgga_x_mbrxc_bg': 'MGGA_X_MBRXC_BG',
+        'mgga_x_mbrxh_bg': 'MGGA_X_MBRXH_BG',
+        'mgga_x_mcml': 'MGGA_X_MCML',
+        'mgga_x_mggac': 'MGGA_X_MGGAC',
+        'mgga_x_mk00': 'MGGA_X_MK00',
+        'mgga_x_mk00b': 'MGGA_X_MK00B',
+        'mgga_x_mn12_l': 'MGGA_X_MN12_L',
+        'mgga_x_mn15_l': 'MGGA_X_MN15_L',
+        'mgga_x_modtpss': 'MGGA_X_MODTPSS',
+        'mgga_x_ms0': 'MGGA_X_MS0',
+        'mgga_x_ms1': 'MGGA_X_MS1',
+        'mgga_x_ms2': 'MGGA_X_MS2',
+        'mgga_x_ms2_rev': 'MGGA_X_MS2_REV',
+        'mgga_x_ms2b': 'MGGA_X_MS2B',
+        'mgga_x_ms2bs': 'MGGA_X_MS2BS',
+        'mgga_x_msb86bl': 'MGGA_X_MSB86BL',
+        'mgga_x_mspbel': 'MGGA_X_MSPBEL',
+        'mgga_x_msrpbel': 'MGGA_X_MSRPBEL',
+        'mgga_x_mtask': 'MGGA_X_MTASK',
+        'mgga_x_mvs': 'MGGA_X_MVS',
+        'mgga_x_mvsb': 'MGGA_X_MVSB',
+        'mgga_x_mvsbs': 'MGGA_X_MVSBS',
+        'mgga_x_pbe_gx': 'MGGA_X_PBE_GX',
+        'mgga_x_pkzb': 'MGGA_X_PKZB',
+        'mgga_x_r2scan': 'MGGA_X_R2SCAN',
+        'mgga_x_r2scan01': 'MGGA_X_R2SCAN01',
+        'mgga_x_r2scanl': 'MGGA_X_R2SCANL',
+        'mgga_x_r4scan': 'MGGA_X_R4SCAN',
+        'mgga_x_regtm': 'MGGA_X_REGTM',
+        'mgga_x_regtpss': 'MGGA_X_REGTPSS',
+        'mgga_x_revm06_l': 'MGGA_X_REVM06_L',
+        'mgga_x_revscan': 'MGGA_X_REVSCAN',
+        'mgga_x_revscanl': 'MGGA_X_REVSCANL',
+        'mgga_x_revtm': 'MGGA_X_REVTM',
+        'mgga_x_revtpss': 'MGGA_X_REVTPSS',
+        'mgga_x_rlda': 'MGGA_X_RLDA',
+        'mgga_x_rmsb86bl': 'MGGA_X_RMSB86BL',
+        'mgga_x_rmspbel': 'MGGA_X_RMSPBEL',
+        'mgga_x_rmsrpbel': 'MGGA_X_RMSRPBEL',
+        'mgga_x_rpp09': 'MGGA_X_RPP09',
+        'mgga_x_rppscan': 'MGGA_X_RPPSCAN',
+        'mgga_x_rscan': 'MGGA_X_RSCAN',
+        'mgga_x_rtpss': 'MGGA_X_RTPSS',
+        'mgga_x_sa_tpss': 'MGGA_X_SA_TPSS',
+        'mgga_x_scan': 'MGGA_X_SCAN',
+        'mgga_x_scanl': 'MGGA_X_SCANL',
+        'mgga_x_task': 'MGGA_X_TASK',
+        'mgga_x_tau_hcth': 'MGGA_X_TAU_HCTH',
+        'mgga_x_tb09': 'MGGA_X_TB09',
+        'mgga_x_th': 'MGGA_X_TH',
+        'mgga_x_tlda': 'MGGA_X_TLDA',
+        'mgga_x_tm': 'MGGA_X_TM',
+        'mgga_x_tpss': 'MGGA_X_TPSS',
+        'mgga_x_vcml': 'MGGA_X_VCML',
+        'mgga_x_vt84': 'MGGA_X_VT84',
+        'hyb_gga_x_cam_s12g': 'HYB_GGA_X_CAM_S12G',
+        'hyb_gga_x_cam_s12h': 'HYB_GGA_X_CAM_S12H',
+        'hyb_gga_x_n12_sx': 'HYB_GGA_X_N12_SX',
+        'hyb_gga_x_pbe_erf_gws': 'HYB_GGA_X_PBE_ERF_GWS',
+        'hyb_gga_x_s12h': 'HYB_GGA_X_S12H',
+        'hyb_gga_x_sogga11_x': 'HYB_GGA_X_SOGGA11_X',
+        'hyb_mgga_x_bmk': 'HYB_MGGA_X_BMK',
+        'hyb_mgga_x_cf22d': 'HYB_MGGA_X_CF22D',
+        'hyb_mgga_x_dldf': 'HYB_MGGA_X_DLDF',
+        'hyb_mgga_x_js18': 'HYB_MGGA_X_JS18',
+        'hyb_mgga_x_m05': 'HYB_MGGA_X_M05',
+        'hyb_mgga_x_m05_2x': 'HYB_MGGA_X_M05_2X',
+        'hyb_mgga_x_m06': 'HYB_MGGA_X_M06',
+        'hyb_mgga_x_m06_2x': 'HYB_MGGA_X_M06_2X',
+        'hyb_mgga_x_m06_hf': 'HYB_MGGA_X_M06_HF',
+        'hyb_mgga_x_m06_sx': 'HYB_MGGA_X_M06_SX',
+        'hyb_mgga_x_m08_hx': 'HYB_MGGA_X_M08_HX',
+        'hyb_mgga_x_m08_so': 'HYB_MGGA_X_M08_SO',
+        'hyb_mgga_x_m11': 'HYB_MGGA_X_M11',
+        'hyb_mgga_x_mn12_sx': 'HYB_MGGA_X_MN12_SX',
+        'hyb_mgga_x_mn15': 'HYB_MGGA_X_MN15',
+        'hyb_mgga_x_ms2h': 'HYB_MGGA_X_MS2H',
+        'hyb_mgga_x_mvsh': 'HYB_MGGA_X_MVSH',
+        'hyb_mgga_x_pjs18': 'HYB_MGGA_X_PJS18',
+        'hyb_mgga_x_revm06': 'HYB_MGGA_X_REVM06',
+        'hyb_mgga_x_revm11': 'HYB_MGGA_X_REVM11',
+        'hyb_mgga_x_revscan0': 'HYB_MGGA_X_REVSCAN0',
+        'hyb_mgga_x_scan0': 'HYB_MGGA_X_SCAN0',
+        'hyb_mgga_x_tau_hcth': 'HYB_MGGA_X_TAU_HCTH',
+        'hyb_lda_x_erf': 'HYB_LDA_X_ERF',
+    },
+    'CorrelationLibXC': {
+        'lda_c_1d_csc': 'LDA_C_1D_CSC',
+        'lda_c_1d_loos': 'LDA_C_1D_LOOS',
+        'lda_c_2d_amgb': 'LDA_C_2D_AMGB',
+        'lda_c_2d_prm': 'LDA_C_2D_PRM',
+        'lda_c_br78': 'LDA_C_BR78',
+        'lda_c_chachiyo': 'LDA_C_CHACHIYO',
+        'lda_c_chachiyo_mod': 'LDA_C_CHACHIYO_MOD',
+        'lda_c_epc17': 'LDA_C_EPC17',
+        'lda_c_epc17_2': 'LDA_C_EPC17_2',
+        'lda_c_epc18_1': 'LDA_C_EPC18_1',
+        'lda_c_epc18_2': 'LDA_C_EPC18_2',
+        'lda_c_gk72': 'LDA_C_GK72',
+        'lda_c_gl': 'LDA_C_GL',
+        'lda_c_gombas': 'LDA_C_GOMBAS',
+        'lda_c_hl': 'LDA_C_HL',
+        'lda_c_karasiev': 'LDA_C_KARASIEV',
+        'lda_c_karasiev_mod': 'LDA_C_KARASIEV_MOD',
+        'lda_c_lp96': 'LDA_C_LP96',
+        'lda_c_mcweeny': 'LDA_C_MCWEENY',
+        'lda_c_ml1': 'LDA_C_ML1',
+        'lda_c_ml2': 'LDA_C_ML2',
+        'lda_c_ob_pw': 'LDA_C_OB_PW',
+        'lda_c_ob_pz': 'LDA_C_OB_PZ',
+        'lda_c_ow': 'LDA_C_OW',
+        'lda_c_ow_lyp': 'LDA_C_OW_LYP',
+        'lda_c_pk09': 'LDA_C_PK09',
+        'lda_c_pmgb06': 'LDA_C_PMGB06',
+        'lda_c_pw': 'LDA_C_PW',
+        'lda_c_pw_erf': 'LDA_C_PW_ERF',
+        'lda_c_pw_mod': 'LDA_C_PW_MOD',
+        'lda_c_pw_rpa': 'LDA_C_PW_RPA',
+        'lda_c_pz': 'LDA_C_PZ',
+        'lda_c_pz_mod': 'LDA_C_PZ_MOD',
+        'lda_c_rc04': 'LDA_C_RC04',
+        'lda_c_rpa': 'LDA_C_RPA',
+        'lda_c_rpw92': 'LDA_C_RPW92',
+        'lda_c_upw92': 'LDA_C_UPW92',
+        'lda_c_vbh': 'LDA_C_VBH',
+        'lda_c_vwn': 'LDA_C_VWN',
+        'lda_c_vwn_1': 'LDA_C_VWN_1',
+        'lda_c_vwn_2': 'LDA_C_VWN_2',
+        'lda_c_vwn_3': 'LDA_C_VWN_3',
+        'lda_c_vwn_4': 'LDA_C_VWN_4',
+        'lda_c_vwn_rpa': 'LDA_C_VWN_RPA',
+        'lda_c_w20': 'LDA_C_W20',
+        'lda_c_wigner': 'LDA_C_WIGNER',
+        'lda_c_xalpha': 'LDA_C_XALPHA',
+        'gga_c_acgga': 'GGA_C_ACGGA',
+        'gga_c_acggap': 'GGA_C_ACGGAP',
+        'gga_c_am05': 'GGA_C_AM05',
+        'gga_c_apbe': 'GGA_C_APBE',
+        'gga_c_bmk': 'GGA_C_BMK',
+        'gga_c_ccdf': 'GGA_C_CCDF',
+        'gga_c_chachiyo': 'GGA_C_CHACHIYO',
+        'gga_c_cs1': 'GGA_C_CS1',
+        'gga_c_ft97': 'GGA_C_FT97',
+        'gga_c_gam': 'GGA_C_GAM',
+        'gga_c_gapc': 'GGA_C_GAPC',
+        'gga_c_gaploc': 'GGA_C_GAPLOC',
+        'gga_c_hcth_a': 'GGA_C_HCTH_A',
+        'gga_c_hyb_tau_hcth': 'GGA_C_HYB_TAU_HCTH',
+        'gga_c_lm': 'GGA_C_LM',
+        'gga_c_lyp': 'GGA_C_LYP',
+        'gga_c_lypr': 'GGA_C_LYPR',
+        'gga_c_mggac': 'GGA_C_MGGAC',
+        'gga_c_n12': 'GGA_C_N12',
+        'gga_c_n12_sx': 'GGA_C_N12_SX',
+        'gga_c_op_b88': 'GGA_C_OP_B88',
+        'gga_c_op_g96': 'GGA_C_OP_G96',
+        'gga_c_op_pbe': 'GGA_C_OP_PBE',
+        'gga_c_op_pw91': 'GGA_C_OP_PW91',
+        'gga_c_op_xalpha': 'GGA_C_OP_XALPHA',
+        'gga_c_optc': 'GGA_C_OPTC',
+        'gga_c_p86': 'GGA_C_P86',
+        'gga_c_p86_ft': 'GGA_C_P86_FT',
+        'gga_c_p86vwn': 'GGA_C_P86VWN',
+        'gga_c_p86vwn_ft': 'GGA_C_P86VWN_FT',
+        'gga_c_pbe': 'GGA_C_PBE',
+        'gga_c_pbe_erf_gws': 'GGA_C_PBE_ERF_GWS',
+        'gga_c_pbe_gaussian': 'GGA_C_PBE_GAUSSIAN',
+        'gga_c_pbe_jrgx': 'GGA_C_PBE_JRGX',
+        'gga_c_pbe_mol': 'GGA_C_PBE_MOL',
+        'gga_c_pbe_sol': 'GGA_C_PBE_SOL',
+        'gga_c_pbe_vwn': 'GGA_C_PBE_VWN',
+        'gga_c_pbefe': 'GGA_C_PBEFE',
+        'gga_c_pbeint': 'GGA_C_PBEINT',
+        'gga_c_pbeloc': 'GGA_C_PBELOC',
+        'gga_c_pw91': 'GGA_C_PW91',
+        'gga_c_q2d': 'GGA_C_Q2D',
+        'gga_c_regtpss': 'GGA_C_REGTPSS',
+        'gga_c_revtca': 'GGA_C_REVTCA',
+        'gga_c_rge2': 'GGA_C_RGE2',
+        'gga_c_scan_e0': 'GGA_C_SCAN_E0',
+        'gga_c_sg4': 'GGA_C_SG4',
+        'gga_c_sogga11': 'GGA_C_SOGGA11',
+        'gga_c_sogga11_x': 'GGA_C_SOGGA11_X',
+        'gga_c_spbe': 'GGA_C_SPBE',
+        'gga_c_tau_hcth': 'GGA_C_TAU_HCTH',
+        'gga_c_tca': 'GGA_C_TCA',
+        'gga_c_tm_lyp': 'GGA_C_TM_LYP',
+        'gga_c_tm_pbe': 'GGA_C_TM_PBE',
+        'gga_c_w94': 'GGA_C_W94',
+        'gga_c_wi': 'GGA_C_WI',
+        'gga_c_wi0': 'GGA_C_WI0',
+        'gga_c_wl': 'GGA_C_WL',
+        'gga_c_xpbe': 'GGA_C_XPBE',
+        'gga_c_zpbeint': 'GGA_C_ZPBEINT',
+        'gga_c_zpbesol': 'GGA_C_ZPBESOL',
+        'gga_c_zvpbeint': 'GGA_C_ZVPBEINT',
+        'gga_c_zvpbeloc': 'GGA_C_ZVPBELOC',
+        'gga_c_zvpbesol': 'GGA_C_ZVPBESOL',
+        'mgga_c_b88': 'MGGA_C_B88',
+        'mgga_c_b94': 'MGGA_C_B94',
+        'mgga_c_bc95': 'MGGA_C_BC95',
+        'mgga_c_cc': 'MGGA_C_CC',
+        'mgga_c_ccalda': 'MGGA_C_CCALDA',
+        'mgga_c_cf22d': 'MGGA_C_CF22D',
+        'mgga_c_cs': 'MGGA_C_CS',
+        'mgga_c_dldf': 'MGGA_C_DLDF',
+        'mgga_c_hltapw': 'MGGA_C_HLTAPW',
+        'mgga_c_kcis': 'MGGA_C_KCIS',
+        'mgga_c_kcisk': 'MGGA_C_KCISK',
+        'mgga_c_m05': 'MGGA_C_M05',
+        'mgga_c_m05_2x': 'MGGA_C_M05_2X',
+        'mgga_c_m06': 'MGGA_C_M06',
+        'mgga_c_m06_2x': 'MGGA_C_M06_2X',
+        'mgga_c_m06_hf': 'MGGA_C_M06_HF',
+        'mgga_c_m06_l': 'MGGA_C_M06_L',
+        'mgga_c_m06_sx': 'MGGA_C_M06_SX',
+        'mgga_c_m08_hx': 'MGGA_C_M08_HX',
+        'mgga_c_m08_so': 'MGGA_C_M08_SO',
+        'mgga_c_m11': 'MGGA_C_M11',
+        'mgga_c_m11_l': 'MGGA_C_M11_L',
+        'mgga_c_mn12_l': 'MGGA_C_MN12_L',
+        'mgga_c_mn12_sx': 'MGGA_C_MN12_SX',
+        'mgga_c_mn15': 'MGGA_C_MN15',
+        'mgga_c_mn15_l': 'MGGA_C_MN15_L',
+        'mgga_c_pkzb': 'MGGA_C_PKZB',
+        'mgga_c_r2scan': 'MGGA_C_R2SCAN',
+        'mgga_c_r2scan01': 'MGGA_C_R2SCAN01',
+        'mgga_c_r2scanl': 'MGGA_C_R2SCANL',
+        'mgga_c_revm06': 'MGGA_C_REVM06',
+        'mgga_c_revm06_l': 'MGGA_C_REVM06_L',
+        'mgga_c_revm11': 'MGGA_C_REVM11',
+        'mgga_c_revscan': 'MGGA_C_REVSCAN',
+        'mgga_c_revscan_vv10': 'MGGA_C_REVSCAN_VV10',
+        'mgga_c_revtm': 'MGGA_C_REVTM',
+        'mgga_c_revtpss': 'MGGA_C_REVTPSS',
+        'mgga_c_rmggac': 'MGGA_C_RMGGAC',
+        'mgga_c_rppscan': 'MGGA_C_RPPSCAN',
+        'mgga_c_rregtm': 'MGGA_C_RREGTM',
+        'mgga_c_rscan': 'MGGA_C_RSCAN',
+        'mgga_c_scan': 'MGGA_C_SCAN',
+        'mgga_c_scan_rvv10': 'MGGA_C_SCAN_RVV10',
+        'mgga_c_scan_vv10': 'MGGA_C_SCAN_VV10',
+        'mgga_c_scanl': 'MGGA_C_SCANL',
+        'mgga_c_scanl_rvv10': 'MGGA_C_SCANL_RVV10',
+        'mgga_c_scanl_vv10': 'MGGA_C_SCANL_VV10',
+        'mgga_c_tm': 'MGGA_C_TM',
+        'mgga_c_tpss': 'MGGA_C_TPSS',
+        'mgga_c_tpss_gaussian': 'MGGA_C_TPSS_GAUSSIAN',
+        'mgga_c_tpssloc': 'MGGA_C_TPSSLOC',
+        'mgga_c_vsxc': 'MGGA_C_VSXC',
+    },
+    'ExCorrLibXC': {
+        'lda_xc_1d_ehwlrg_1': 'LDA_XC_1D_EHWLRG_1',
+        'lda_xc_1d_ehwlrg_2': 'LDA_XC_1D_EHWLRG_2',
+        'lda_xc_1d_ehwlrg_3': 'LDA_XC_1D_EHWLRG_3',
+        'lda_xc_corrksdt': 'LDA_XC_CORRKSDT',
+        'lda_xc_gdsmfb': 'LDA_XC_GDSMFB',
+        'lda_xc_ksdt': 'LDA_XC_KSDT',
+        'lda_xc_lp_a': 'LDA_XC_LP_A',
+        'lda_xc_lp_b': 'LDA_XC_LP_B',
+        'lda_xc_teter93': 'LDA_XC_TETER93',
+        'lda_xc_tih': 'LDA_XC_TIH',
+        'lda_xc_zlp': 'LDA_XC_ZLP',
+        'gga_xc_b97_3c': 'GGA_XC_B97_3C',
+        'gga_xc_b97_d': 'GGA_XC_B97_D',
+        'gga_xc_b97_gga1': 'GGA_XC_B97_GGA1',
+        'gga_xc_beefvdw': 'GGA_XC_BEEFVDW',
+        'gga_xc_edf1': 'GGA_XC_EDF1',
+        'gga_xc_hcth_120': 'GGA_XC_HCTH_120',
+        'gga_xc_hcth_147': 'GGA_XC_HCTH_147',
+        'gga_xc_hcth_407': 'GGA_XC_HCTH_407',
+        'gga_xc_hcth_407p': 'GGA_XC_HCTH_407P',
+        'gga_xc_hcth_93': 'GGA_XC_HCTH_93',
+        'gga_xc_hcth_p14': 'GGA_XC_HCTH_P14',
+        'gga_xc_hcth_p76': 'GGA_XC_HCTH_P76',
+        'gga_xc_hle16': 'GGA_XC_HLE16',
+        'gga_xc_kt1': 'GGA_XC_KT1',
+        'gga_xc_kt2': 'GGA_XC_KT2',
+        'gga_xc_kt3': 'GGA_XC_KT3',
+        'gga_xc_mohlyp': 'GGA_XC_MOHLYP',
+        'gga_xc_mohlyp2': 'GGA_XC_MOHLYP2',
+        'gga_xc_mpwlyp1w': 'GGA_XC_MPWLYP1W',
+        'gga_xc_ncap': 'GGA_XC_NCAP',
+        'gga_xc_oblyp_d': 'GGA_XC_OBLYP_D',
+        'gga_xc_opbe_d': 'GGA_XC_OPBE_D',
+        'gga_xc_opwlyp_d': 'GGA_XC_OPWLYP_D',
+        'gga_xc_pbe1w': 'GGA_XC_PBE1W',
+        'gga_xc_pbelyp1w': 'GGA_XC_PBELYP1W',
+        'gga_xc_th1': 'GGA_XC_TH1',
+        'gga_xc_th2': 'GGA_XC_TH2',
+        'gga_xc_th3': 'GGA_XC_TH3',
+        'gga_xc_th4': 'GGA_XC_TH4',
+        'gga_xc_th_fc': 'GGA_XC_TH_FC',
+        'gga_xc_th_fcfo': 'GGA_XC_TH_FCFO',
+        'gga_xc_th_fco': 'GGA_XC_TH_FCO',
+        'gga_xc_th_fl': 'GGA_XC_TH_FL',
+        'gga_xc_vv10': 'GGA_XC_VV10',
+        'gga_xc_xlyp': 'GGA_XC_XLYP',
+        'mgga_xc_b97m_v': 'MGGA_XC_B97M_V',
+        'mgga_xc_cc06': 'MGGA_XC_CC06',
+        'mgga_xc_hle17': 'MGGA_XC_HLE17',
+        'mgga_xc_lp90': 'MGGA_XC_LP90',
+        'mgga_xc_otpss_d': 'MGGA_XC_OTPSS_D',
+        'mgga_xc_tpsslyp1w': 'MGGA_XC_TPSSLYP1W',
+        'mgga_xc_vcml_rvv10': 'MGGA_XC_VCML_RVV10',
+        'mgga_xc_zlp': 'MGGA_XC_ZLP',
+        'hyb_gga_xc_apbe0': 'HYB_GGA_XC_APBE0',
+        'hyb_gga_xc_apf': 'HYB_GGA_XC_APF',
+        'hyb_gga_xc_b1lyp': 'HYB_GGA_XC_B1LYP',
+        'hyb_gga_xc_b1pw91': 'HYB_GGA_XC_B1PW91',
+        'hyb_gga_xc_b1wc': 'HYB_GGA_XC_B1WC',
+        'hyb_gga_xc_b3lyp': 'HYB_GGA_XC_B3LYP',
+        'hyb_gga_xc_b3lyp3': 'HYB_GGA_XC_B3LYP3',
+        'hyb_gga_xc_b3lyp5': 'HYB_GGA_XC_B3LYP5',
+        'hyb_gga_xc_b3lyp_mcm1': 'HYB_GGA_XC_B3LYP_MCM1',
+        'hyb_gga_xc_b3lyp_mcm2': 'HYB_GGA_XC_B3LYP_MCM2',
+        'hyb_gga_xc_b3lyps': 'HYB_GGA_XC_B3LYPS',
+        'hyb_gga_xc_b3p86': 'HYB_GGA_XC_B3P86',
+        'hyb_gga_xc_b3p86_nwchem': 'HYB_GGA_XC_B3P86_NWCHEM',
+        'hyb_gga_xc_b3pw91': 'HYB_GGA_XC_B3PW91',
+        'hyb_gga_xc_b5050lyp': 'HYB_GGA_XC_B5050LYP',
+        'hyb_gga_xc_b97': 'HYB_GGA_XC_B97',
+        'hyb_gga_xc_b97_1': 'HYB_GGA_XC_B97_1',
+        'hyb_gga_xc_b97_1p': 'HYB_GGA_XC_B97_1P',
+        'hyb_gga_xc_b97_2': 'HYB_GGA_XC_B97_2',
+        'hyb_gga_xc_b97_3': 'HYB_GGA_XC_B97_3',
+        'hyb_gga_xc_b97_k': 'HYB_GGA_XC_B97_K',
+        'hyb_gga_xc_bhandh': 'HYB_GGA_XC_BHANDH',
+        'hyb_gga_xc_bhandhlyp': 'HYB_GGA_XC_BHANDHLYP',
+        'hyb_gga_xc_blyp35': 'HYB_GGA_XC_BLYP35',
+        'hyb_gga_xc_cam_b3lyp': 'HYB_GGA_XC_CAM_B3LYP',
+        'hyb_gga_xc_cam_o3lyp': 'HYB_GGA_XC_CAM_O3LYP',
+        'hyb_gga_xc_cam_pbeh': 'HYB_GGA_XC_CAM_PBEH',
+        'hyb_gga_xc_cam_qtp_00': 'HYB_GGA_XC_CAM_QTP_00',
+        'hyb_gga_xc_cam_qtp_01': 'HYB_GGA_XC_CAM_QTP_01',
+        'hyb_gga_xc_cam_qtp_02': 'HYB_GGA_XC_CAM_QTP_02',
+        'hyb_gga_xc_camh_b3lyp': 'HYB_GGA_XC_CAMH_B3LYP',
+        'hyb_gga_xc_camy_b3lyp': 'HYB_GGA_XC_CAMY_B3LYP',
+        'hyb_gga_xc_camy_blyp': 'HYB_GGA_XC_CAMY_BLYP',
+        'hyb_gga_xc_camy_pbeh': 'HYB_GGA_XC_CAMY_PBEH',
+        'hyb_gga_xc_cap0': 'HYB_GGA_XC_CAP0',
+        'hyb_gga_xc_case21': 'HYB_GGA_XC_CASE21',
+        'hyb_gga_xc_edf2': 'HYB_GGA_XC_EDF2',
+        'hyb_gga_xc_hapbe': 'HYB_GGA_XC_HAPBE',
+        'hyb_gga_xc_hflyp': 'HYB_GGA_XC_HFLYP',
+        'hyb_gga_xc_hjs_b88': 'HYB_GGA_XC_HJS_B88',
+        'hyb_gga_xc_hjs_b97x': 'HYB_GGA_XC_HJS_B97X',
+        'hyb_gga_xc_hjs_pbe': 'HYB_GGA_XC_HJS_PBE',
+        'hyb_gga_xc_hjs_pbe_sol': 'HYB_GGA_XC_HJS_PBE_SOL',
+        'hyb_gga_xc_hpbeint': 'HYB_GGA_XC_HPBEINT',
+        'hyb_gga_xc_hse03': 'HYB_GGA_XC_HSE03',
+        'hyb_gga_xc_hse06': 'HYB_GGA_XC_HSE06',
+        'hyb_gga_xc_hse12': 'HYB_GGA_XC_HSE12',
+        'hyb_gga_xc_hse12s': 'HYB_GGA_XC_HSE12S',
+        'hyb_gga_xc_hse_sol': 'HYB_GGA_XC_HSE_SOL',
+        'hyb_gga_xc_kmlyp': 'HYB_GGA_XC_KMLYP',
+        'hyb_gga_xc_lb07': 'HYB_GGA_XC_LB07',
+        'hyb_gga_xc_lc_blyp': 'HYB_GGA_XC_LC_BLYP',
+        'hyb_gga_xc_lc_blyp_ea': 'HYB_GGA_XC_LC_BLYP_EA',
+        'hyb_gga_xc_lc_blypr': 'HYB_GGA_XC_LC_BLYPR',
+        'hyb_gga_xc_lc_bop': 'HYB_GGA_XC_LC_BOP',
+        'hyb_gga_xc_lc_pbeop': 'HYB_GGA_XC_LC_PBEOP',
+        'hyb_gga_xc_lc_qtp': 'HYB_GGA_XC_LC_QTP',
+        'hyb_gga_xc_lc_vv10': 'HYB_GGA_XC_LC_VV10',
+        'hyb_gga_xc_lc_wpbe': 'HYB_GGA_XC_LC_WPBE',
+        'hyb_gga_xc_lc_wpbe08_whs': 'HYB_GGA_XC_LC_WPBE08_WHS',
+        'hyb_gga_xc_lc_wpbe_whs': 'HYB_GGA_XC_LC_WPBE_WHS',
+        'hyb_gga_xc_lc_wpbeh_whs': 'HYB_GGA_XC_LC_WPBEH_WHS',
+        'hyb_gga_xc_lc_wpbesol_whs': 'HYB_GGA_XC_LC_WPBESOL_WHS',
+        'hyb_gga_xc_lcy_blyp': 'HYB_GGA_XC_LCY_BLYP',
+        'hyb_gga_xc_lcy_pbe': 'HYB_GGA_XC_LCY_PBE',
+        'hyb_gga_xc_lrc_wpbe': 'HYB_GGA_XC_LRC_WPBE',
+        'hyb_gga_xc_lrc_wpbeh': 'HYB_GGA_XC_LRC_WPBEH',
+        'hyb_gga_xc_mb3lyp_rc04': 'HYB_GGA_XC_MB3LYP_RC04',
+        'hyb_gga_xc_mcam_b3lyp': 'HYB_GGA_XC_MCAM_B3LYP',
+        'hyb_gga_xc_mpw1k': 'HYB_GGA_XC_MPW1K',
+        'hyb_gga_xc_mpw1lyp': 'HYB_GGA_XC_MPW1LYP',
+        'hyb_gga_xc_mpw1pbe': 'HYB_GGA_XC_MPW1PBE',
+        'hyb_gga_xc_mpw1pw': 'HYB_GGA_XC_MPW1PW',
+        'hyb_gga_xc_mpw3lyp': 'HYB_GGA_XC_MPW3LYP',
+        'hyb_gga_xc_mpw3pw': 'HYB_GGA_XC_MPW3PW',
+        'hyb_gga_xc_mpwlyp1m': 'HYB_GGA_XC_MPWLYP1M',
+        'hyb_gga_xc_o3lyp': 'HYB_GGA_XC_O3LYP',
+        'hyb_gga_xc_opb3lyp': 'HYB_GGA_XC_OPB3LYP',
+        'hyb_gga_xc_pbe0_13': 'HYB_GGA_XC_PBE0_13',
+        'hyb_gga_xc_pbe38': 'HYB_GGA_XC_PBE38',
+        'hyb_gga_xc_pbe50': 'HYB_GGA_XC_PBE50',
+        'hyb_gga_xc_pbe_2x': 'HYB_GGA_XC_PBE_2X',
+        'hyb_gga_xc_pbe_mol0': 'HYB_GGA_XC_PBE_MOL0',
+        'hyb_gga_xc_pbe_molb0': 'HYB_GGA_XC_PBE_MOLB0',
+        'hyb_gga_xc_pbe_sol0': 'HYB_GGA_XC_PBE_SOL0',
+        'hyb_gga_xc_pbeb0': 'HYB_GGA_XC_PBEB0',
+        'hyb_gga_xc_pbeh': 'HYB_GGA_XC_PBEH',
+        'hyb_gga_xc_qtp17': 'HYB_GGA_XC_QTP17',
+        'hyb_gga_xc_rcam_b3lyp': 'HYB_GGA_XC_RCAM_B3LYP',
+        'hyb_gga_xc_relpbe0': 'HYB_GGA_XC_RELPBE0',
+        'hyb_gga_xc_revb3lyp': 'HYB_GGA_XC_REVB3LYP',
+        'hyb_gga_xc_sb98_1a': 'HYB_GGA_XC_SB98_1A',
+        'hyb_gga_xc_sb98_1b': 'HYB_GGA_XC_SB98_1B',
+        'hyb_gga_xc_sb98_1c': 'HYB_GGA_XC_SB98_1C',
+        'hyb_gga_xc_sb98_2a': 'HYB_GGA_XC_SB98_2A',
+        'hyb_gga_xc_sb98_2b': 'HYB_GGA_XC_SB98_2B',
+        'hyb_gga_xc_sb98_2c': 'HYB_GGA_XC_SB98_2C',
+        'hyb_gga_xc_tuned_cam_b3lyp': 'HYB_GGA_XC_TUNED_CAM_B3LYP',
+        'hyb_gga_xc_wb97': 'HYB_GGA_XC_WB97',
+        'hyb_gga_xc_wb97x': 'HYB_GGA_XC_WB97X',
+        'hyb_gga_xc_wb97x_d': 'HYB_GGA_XC_WB97X_D',
+        'hyb_gga_xc_wb97x_d3': 'HYB_GGA_XC_WB97X_D3',
+        'hyb_gga_xc_wb97x_v': 'HYB_GGA_XC_WB97X_V',
+        'hyb_gga_xc_wc04': 'HYB_GGA_XC_WC04',
+        'hyb_gga_xc_whpbe0': 'HYB_GGA_XC_WHPBE0',
+        'hyb_gga_xc_wp04': 'HYB_GGA_XC_WP04',
+        'hyb_gga_xc_x3lyp': 'HYB_GGA_XC_X3LYP',
+        'hyb_mgga_xc_b0kcis': 'HYB_MGGA_XC_B0KCIS',
+        'hyb_mgga_xc_b86b95': 'HYB_MGGA_XC_B86B95',
+        'hyb_mgga_xc_b88b95': 'HYB_MGGA_XC_B88B95',
+        'hyb_mgga_xc_b94_hyb': 'HYB_MGGA_XC_B94_HYB',
+        'hyb_mgga_xc_b98': 'HYB_MGGA_XC_B98',
+        'hyb_mgga_xc_bb1k': 'HYB_MGGA_XC_BB1K',
+        'hyb_mgga_xc_br3p86': 'HYB_MGGA_XC_BR3P86',
+        'hyb_mgga_xc_edmggah': 'HYB_MGGA_XC_EDMGGAH',
+        'hyb_mgga_xc_gas22': 'HYB_MGGA_XC_GAS22',
+        'hyb_mgga_xc_lc_tmlyp': 'HYB_MGGA_XC_LC_TMLYP',
+        'hyb_mgga_xc_mpw1b95': 'HYB_MGGA_XC_MPW1B95',
+        'hyb_mgga_xc_mpw1kcis': 'HYB_MGGA_XC_MPW1KCIS',
+        'hyb_mgga_xc_mpwb1k': 'HYB_MGGA_XC_MPWB1K',
+        'hyb_mgga_xc_mpwkcis1k': 'HYB_MGGA_XC_MPWKCIS1K',
+        'hyb_mgga_xc_pbe1kcis': 'HYB_MGGA_XC_PBE1KCIS',
+        'hyb_mgga_xc_pw6b95': 'HYB_MGGA_XC_PW6B95',
+        'hyb_mgga_xc_pw86b95': 'HYB_MGGA_XC_PW86B95',
+        'hyb_mgga_xc_pwb6k': 'HYB_MGGA_XC_PWB6K',
+        'hyb_mgga_xc_r2scan0': 'HYB_MGGA_XC_R2SCAN0',
+        'hyb_mgga_xc_r2scan50': 'HYB_MGGA_XC_R2SCAN50',
+        'hyb_mgga_xc_r2scanh': 'HYB_MGGA_XC_R2SCANH',
+        'hyb_mgga_xc_revtpssh': 'HYB_MGGA_XC_REVTPSSH',
+        'hyb_mgga_xc_tpss0': 'HYB_MGGA_XC_TPSS0',
+        'hyb_mgga_xc_tpss1kcis': 'HYB_MGGA_XC_TPSS1KCIS',
+        'hyb_mgga_xc_tpssh': 'HYB_MGGA_XC_TPSSH',
+        'hyb_mgga_xc_wb97m_v': 'HYB_MGGA_XC_WB97M_V',
+        'hyb_mgga_xc_x1b95': 'HYB_MGGA_XC_X1B95',
+        'hyb_mgga_xc_xb1k': 'HYB_MGGA_XC_XB1K',
+        'hyb_lda_xc_bn05': 'HYB_LDA_XC_BN05',
+        'hyb_lda_xc_cam_lda0': 'HYB_LDA_XC_CAM_LDA0',
+        'hyb_lda_xc_lda0': 'HYB_LDA_XC_LDA0',
+    },
+}
+# fmt: on
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Streaming JSON output of generator results.
+
+Besides a string, the ``contents`` of a generated file may be any other
+iterable of string chunks, for example a generator yielding one line at a
+time. Such files are only ever held in memory as the chunk being written,
+so a generator embedding a large molecule in its input does not need the
+whole file, its JSON-escaped copy and the printed copy at once.
+
+The text written by :func:`write_json` is identical to ``json.dumps``.
+"""
+
+import io
+import json
+from array import array
+from collections.abc import Iterable, Iterator
+from json.encoder import encode_basestring_ascii
+
+# Characters escaped at once, and bytes collected before writing them
+CHUNK_SIZE = 1 << 16
+
+
+def is_chunked(contents) -> bool:
+    """Whether file contents are given as an iterable of chunks."""
+    return isinstance(contents, Iterable) and not isinstance(
+        contents, (str, bytes, dict, list, tuple, array, memoryview)
+    )
+
+
+def join_chunks(output: dict) -> dict:
+    """Turn chunked file contents of a generator result into strings.
+
+    Needed wherever the result is kept, pickled or dumped as a whole.
+    """
+    for entry in output.get("files", ()):
+        if is_chunked(entry.get("contents")):
+            entry["contents"] = "".join(entry["contents"])
+    return output
+
+
+def _iter_string(chunks: Iterable[str]) -> Iterator[str]:
+    yield '"'
+    for chunk in chunks:
+        for start in range(0, len(chunk), CHUNK_SIZE):
+            # Strip the quotes, the string goes on in the next chunk
+            yield encode_basestring_ascii(chunk[start : start + CHUNK_SIZE])[1:-1]
+    yield '"'
+
+
+def iter_json(obj) -> Iterator[str]:
+    """Encode ``obj`` as JSON, piece by piece.
+
+    Chunked contents are encoded as a single string, and coordinate
+    arrays from binary requests as lists.
+    """
+    if isinstance(obj, str):
+        yield from _iter_string((obj,))
+    elif isinstance(obj, dict):
+        yield "{"
+        for i, (key, value) in enumerate(obj.items()):
+            if i:
+                yield ", "
+            if not isinstance(key, str):
+                key = json.dumps(key)
+            yield encode_basestring_ascii(key) + ": "
+            yield from iter_json(value)
+        yield "}"
+    elif isinstance(obj, (list, tuple, array, memoryview)):
+        yield "["
+        for i, value in enumerate(obj):
+            if i:
+                yield ", "
+            yield from iter_json(value)
+        yield "]"
+    elif is_chunked(obj):
+        yield from _iter_string(obj)
+    else:
+        yield json.dumps(obj)
+
+
+def write_json(obj, stream: io.BufferedIOBase):
+    """Write ``obj`` as JSON to a binary stream, without building it first."""
+    pieces = []
+    size = 0
+    for piece in iter_json(obj):
+        pieces.append(piece)
+        size += len(piece)
+        if size >= CHUNK_SIZE:
+            stream.write("".join(pieces).encode("ascii"))
+            pieces.clear()
+            size = 0
+    stream.write("".join(pieces).encode("ascii"))
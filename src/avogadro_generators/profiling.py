@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Profiling of generator runs, enabled with ``--profile[=cpu|mem]``.
+
+``--profile`` or ``--profile=cpu`` runs every job under :mod:`cProfile`,
+including reading the request and writing the result, and writes the
+statistics to a ``.prof`` file that can be explored with::
+
+    python -m pstats orca.prof
+
+The functions with the largest cumulative time are also printed to
+stderr. ``--profile=mem`` traces the jobs with :mod:`tracemalloc` instead
+and writes a report of the source lines holding the most memory at the
+end of a job, with the peak traced memory of any single job.
+
+In ``--serve``, ``batch`` and ``stream`` modes the profile is aggregated
+over all jobs, and the worker processes of the parallel modes each save a
+partial profile that is merged when they are done. The report is written
+to ``--profile-output``, by default next to the outputs.
+"""
+
+import contextlib
+import json
+import os
+import sys
+
+# The command line options are added on every run, so the profilers and
+# everything else are only imported once profiling is enabled
+
+MODES = ("cpu", "mem")
+
+# Lines of the memory report, and functions printed for CPU profiles
+TOP = 25
+
+
+def expand_flag(argv: list[str]) -> list[str]:
+    """Give a bare ``--profile`` its default mode.
+
+    Otherwise a following generator name would be taken as the mode.
+    """
+    return ["--profile=cpu" if arg == "--profile" else arg for arg in argv]
+
+
+def add_arguments(parser):
+    """Add ``--profile`` and ``--profile-output`` to an argument parser.
+
+    Call :func:`expand_flag` on the command line before parsing it.
+    """
+    parser.add_argument(
+        "--profile",
+        choices=MODES,
+        default=None,
+        help="Profile CPU time (default) or memory allocations of the jobs",
+    )
+    parser.add_argument(
+        "--profile-output",
+        default=None,
+        help="File for the profile report (default: next to the outputs)",
+    )
+
+
+def default_output(mode: str, directory: str, name: str) -> str:
+    """Report path for ``name`` in ``directory``."""
+    suffix = ".prof" if mode == "cpu" else ".mem.txt"
+    return os.path.join(directory, name + suffix)
+
+
+class Profiler:
+    """Profile aggregated over any number of jobs."""
+
+    def __init__(self, mode: str = "cpu"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        self.mode = mode
+        self.jobs = 0
+        if mode == "cpu":
+            import cProfile
+
+            self._profile = cProfile.Profile()
+        else:
+            self._profile = None
+        # Partial CPU profiles merged from other processes
+        self._partials: list[str] = []
+        # (file name, line number) -> [size, count], for memory profiles
+        self.allocations: dict[tuple[str, int], list[int]] = {}
+        self.peak = 0
+
+    @contextlib.contextmanager
+    def job(self):
+        """Context in which one job is profiled."""
+        if self.mode == "cpu":
+            self._profile.enable()
+            try:
+                yield
+            finally:
+                self._profile.disable()
+        else:
+            import tracemalloc
+
+            tracemalloc.start()
+            try:
+                yield
+                snapshot = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            self._add_snapshot(snapshot, peak)
+        self.jobs += 1
+
+    def _add_snapshot(self, snapshot, peak: int):
+        import tracemalloc
+
+        snapshot = snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            )
+        )
+        for stat in snapshot.statistics("lineno"):
+            frame = stat.traceback[0]
+            entry = self.allocations.setdefault((frame.filename, frame.lineno), [0, 0])
+            entry[0] += stat.size
+            entry[1] += stat.count
+        self.peak = max(self.peak, peak)
+
+    def save(self, path: str):
+        """Save the raw profile, to be merged with :meth:`merge`.
+
+        Nothing is saved if no job was profiled.
+        """
+        if not self.jobs:
+            return
+        if self.mode == "cpu":
+            self._profile.dump_stats(path)
+            return
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "jobs": self.jobs,
+                    "peak": self.peak,
+                    "allocations": [[*k, *v] for k, v in self.allocations.items()],
+                },
+                f,
+            )
+
+    def merge(self, path: str):
+        """Add a profile saved by :meth:`save`."""
+        if self.mode == "cpu":
+            self._partials.append(path)
+            return
+        with open(path) as f:
+            partial = json.load(f)
+        self.jobs += partial["jobs"]
+        self.peak = max(self.peak, partial["peak"])
+        for filename, lineno, size, count in partial["allocations"]:
+            entry = self.allocations.setdefault((filename, lineno), [0, 0])
+            entry[0] += size
+            entry[1] += count
+
+    def write(self, path: str):
+        """Write the report and print a summary to stderr."""
+        if self.mode == "cpu":
+            sources = ([self._profile] if self.jobs else []) + self._partials
+            if not sources:
+                print("No jobs were profiled", file=sys.stderr)
+                return
+            import pstats
+
+            stats = pstats.Stats(*sources, stream=sys.stderr)
+            stats.dump_stats(path)
+            stats.sort_stats("cumulative").print_stats(TOP)
+            print(f"CPU profile written to {path}", file=sys.stderr)
+            return
+
+        with open(path, "w") as f:
+            f.write(self.report())
+        print(
+            f"Memory profile of {self.jobs} jobs written to {path}, "
+            f"peak {self.peak / 1024:.1f} KiB",
+            file=sys.stderr,
+        )
+
+    def report(self, top: int = TOP) -> str:
+        """Text report of the lines holding the most memory."""
+        import linecache
+
+        lines = [
+            f"Jobs: {self.jobs}",
+            f"Peak traced memory of a job: {self.peak / 1024:.1f} KiB",
+            "",
+            f"Top {top} lines by memory held at the end of a job, summed over jobs:",
+            "",
+        ]
+        ranked = sorted(self.allocations.items(), key=lambda item: -item[1][0])
+        for rank, ((filename, lineno), (size, count)) in enumerate(ranked[:top], 1):
+            lines.append(
+                f"#{rank}: {filename}:{lineno}: {size / 1024:.1f} KiB in {count} blocks"
+            )
+            source = linecache.getline(filename, lineno).strip()
+            if source:
+                lines.append(f"    {source}")
+        return "\n".join(lines) + "\n"
+
+
+# Profiler of a worker process of the parallel modes
+_worker_profiler: Profiler | None = None
+
+
+def start_worker(mode: str, prefix: str):
+    """Profile the jobs of a pool worker, from the pool initializer.
+
+    The profile is saved to ``prefix.<pid>`` when the worker exits.
+    """
+    import multiprocessing.util
+
+    global _worker_profiler
+    _worker_profiler = Profiler(mode)
+    multiprocessing.util.Finalize(
+        _worker_profiler,
+        _worker_profiler.save,
+        args=(f"{prefix}.{os.getpid()}",),
+        exitpriority=10,
+    )
+
+
+def worker_job():
+    """Context profiling one job in a pool worker, if enabled."""
+    if _worker_profiler is None:
+        return contextlib.nullcontext()
+    return _worker_profiler.job()
+
+
+def worker_prefix(path: str) -> str:
+    """Prefix of the worker profiles for the report at ``path``."""
+    return f"{path}.{os.getpid()}"
+
+
+def merge_workers(mode: str, prefix: str, path: str):
+    """Merge and remove the worker profiles, and write the report."""
+    import glob
+
+    profiler = Profiler(mode)
+    partials = glob.glob(glob.escape(prefix) + ".*")
+    for partial in partials:
+        profiler.merge(partial)
+    profiler.write(path)
+    for partial in partials:
+        os.remove(partial)
@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Length-prefixed binary framing, selected with ``--protocol binary``.
+
+A request frame is laid out as::
+
+    uint32      length H of the header
+    H bytes     UTF-8 JSON header
+    N * 24      float64 3D coordinates
+    N * 1       uint8 atomic numbers
+
+where all numbers are little-endian. The header is the usual request
+(``options``, optional ``generator``, ``id`` and ``debug``) with the
+coordinates and atomic numbers taken out of ``cjson``, plus the atom
+count N under ``natoms``. The coordinates are handed to the generators as
+``array`` objects, so they are never formatted as decimal text and parsed
+back.
+
+A response frame is a uint32 length followed by the UTF-8 JSON that the
+JSON protocol would have printed.
+"""
+
+import json
+import struct
+import sys
+from array import array
+from typing import BinaryIO
+
+from .output import is_chunked
+
+_LENGTH = struct.Struct("<I")
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise EOFError(f"Expected {size} bytes, got {len(data)}")
+    return data
+
+
+def _little_endian(values: array) -> array:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def _default(value):
+    if isinstance(value, (array, memoryview)):
+        return value.tolist()
+    if is_chunked(value):
+        return "".join(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(obj) -> bytes:
+    """Encode ``obj`` as JSON, turning coordinate arrays into lists and
+    joining chunked file contents.
+    """
+    return json.dumps(obj, default=_default).encode()
+
+
+def encode_request(request: dict) -> bytes:
+    """Pack a request with a regular cjson into a request frame."""
+    header = dict(request)
+    cjson = dict(header.get("cjson", {}))
+    coords = array("d")
+    numbers = array("B")
+    if "atoms" in cjson:
+        atoms = dict(cjson["atoms"])
+        elements = dict(atoms.get("elements", {}))
+        atom_coords = dict(atoms.get("coords", {}))
+        numbers = array("B", elements.pop("number", ()))
+        coords = array("d", atom_coords.pop("3d", ()))
+        atoms["elements"] = elements
+        atoms["coords"] = atom_coords
+        cjson["atoms"] = atoms
+    if len(coords) != 3 * len(numbers):
+        raise ValueError("Expected three coordinates per atom")
+
+    header["cjson"] = cjson
+    header["natoms"] = len(numbers)
+    header = dumps(header)
+    return b"".join(
+        (
+            _LENGTH.pack(len(header)),
+            header,
+            _little_endian(coords).tobytes(),
+            numbers.tobytes(),
+        )
+    )
+
+
+def read_request(stream: BinaryIO) -> dict | None:
+    """Read one request frame, or ``None`` at the end of the stream.
+
+    Raises ``ValueError`` for a header that is not a valid request. The
+    arrays of such a frame cannot be located, so the header is assumed to
+    be followed by none.
+    """
+    prefix = stream.read(_LENGTH.size)
+    if not prefix:
+        return None
+    if len(prefix) != _LENGTH.size:
+        raise EOFError("Truncated frame length")
+    (length,) = _LENGTH.unpack(prefix)
+    request = json.loads(_read_exactly(stream, length))
+    if not isinstance(request, dict):
+        raise ValueError("not a JSON object")
+
+    natoms = request.pop("natoms", 0)
+    if type(natoms) is not int or natoms < 0:
+        raise ValueError("natoms is not a count of atoms")
+    cjson = request.get("cjson", {})
+    if not isinstance(cjson, dict) or not isinstance(cjson.get("atoms", {}), dict):
+        raise ValueError("cjson is not a JSON object")
+    if natoms or "atoms" in cjson:
+        coords = array("d")
+        coords.frombytes(_read_exactly(stream, 24 * natoms))
+        coords = _little_endian(coords)
+        numbers = array("B", _read_exactly(stream, natoms))
+
+        atoms = request.setdefault("cjson", {}).setdefault("atoms", {})
+        atoms.setdefault("coords", {})["3d"] = coords
+        atoms.setdefault("elements", {})["number"] = numbers
+
+    return request
+
+
+def write_response(stream: BinaryIO, output: dict):
+    """Write one response frame."""
+    body = dumps(output)
+    stream.write(_LENGTH.pack(len(body)) + body)
+    stream.flush()
+
+
+def read_response(stream: BinaryIO) -> dict | None:
+    """Read one response frame, or ``None`` at the end of the stream."""
+    prefix = stream.read(_LENGTH.size)
+    if not prefix:
+        return None
+    (length,) = _LENGTH.unpack(prefix)
+    return json.loads(_read_exactly(stream, length))
@@ -7,8 +7,11 @@
 # ******************************************************************************
 """Input generation for Psi4 (https://psicode.org/)."""
 
+from avogadro_generators import timing
+
 
 def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
+    stages = timing.stages()
     # Collect warning strings as we go
     warnings = []
 
@@ -25,6 +28,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     multiplicity = opts['Multiplicity']
     nCores = int(opts['Processor Cores'])
     memory = int(opts['Memory'])
+    stages.mark("options")
 
     # Convert to code-specific strings
     calcStr = ''
@@ -36,6 +40,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
         calcStr = 'frequencies'
     else:
         warnings.append('Unhandled calculation type: %s' % calculate)
+    stages.mark("method")
 
     generated_input = ''
 
@@ -54,6 +59,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
         generated_input += 'auto_fragments(\'\')\n'
 
     generated_input += f'{calcStr}(\"{theory}\")\n'
+    stages.mark("blocks")
 
     return generated_input, warnings
 
@@ -7,12 +7,14 @@
 # ******************************************************************************
 """Input generation for PySCF (https://pyscf.org/)."""
 
+from avogadro_generators import timing
 
 basis_list = ['STO-3G', '3-21g', 'cc-pvdz']
 theory_list = ['RHF', 'ROHF', 'UHF', 'MP2']
 
 
 def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
+    stages = timing.stages()
     # Collect warning strings as we go
     warnings = []
 
@@ -23,6 +25,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     basis = opts['Basis']
     charge = opts['Charge']
     multiplicity = opts['Multiplicity']
+    stages.mark("options")
 
     # Convert to code-specific strings
     basisStr = ''
@@ -73,6 +76,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
         pass
     else:
         warnings.append(f'Unhandled calculation type: {calculate}')
+    stages.mark("method")
 
     # Create input file
     generated_input = ''
@@ -88,6 +92,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     generated_input += 'mol.build()\n'
     for line in theoryLines:
         generated_input += line
+    stages.mark("blocks")
     
     return generated_input, warnings
 
@@ -7,8 +7,11 @@
 # ******************************************************************************
 """Input generation for Q-Chem (https://www.q-chem.com/)."""
 
+from avogadro_generators import timing
+
 
 def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
+    stages = timing.stages()
     # Collect warning strings as we go
     warnings = []
 
@@ -20,6 +23,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     basis = opts['Basis']
     charge = opts['Charge']
     multiplicity = opts['Multiplicity']
+    stages.mark("options")
 
     # Convert to code-specific strings
     calcStr = ''
@@ -46,6 +50,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
         basisStr = 'ECP %s' % basis
     else:
         warnings.append('Unhandled basis type: %s' % basis)
+    stages.mark("method")
 
     generated_input = ''
 
@@ -62,6 +67,7 @@ def generateInputFile(input_json: dict) -> tuple[str, list[str]]:
     generated_input += f'   {charge} {multiplicity}\n'
     generated_input += '$$coords:___Sxyz$$\n'
     generated_input += '$end\n'
+    stages.mark("blocks")
 
     return generated_input, warnings
 
@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Registry of the available input generators.
+
+Generators are declared as entry points of the
+``avogadro_generators.generators`` group, both those shipped in this
+package and those of other distributions, for example::
+
+    [project.entry-points."avogadro_generators.generators"]
+    mycode = "my_package.mycode:generateInput"
+
+Looking entry points up means scanning every installed distribution, so
+the result is kept in a small index file that is only rebuilt when
+``sys.path`` or one of its directories changes. Resolving a name imports
+nothing but the module of that generator.
+
+The generators of this package take precedence over those of other
+distributions with the same name, which are reported with a warning.
+"""
+
+import functools
+import json
+import os
+import re
+import sys
+import warnings
+
+ENTRY_POINT_GROUP = "avogadro_generators.generators"
+
+# Distribution providing the built-in generators
+DISTRIBUTION = "avogadro-generators"
+
+
+def cache_dir() -> str:
+    """Per-user directory for the files this package keeps between runs."""
+    if sys.platform == "win32":
+        import tempfile
+
+        base = os.environ.get("LOCALAPPDATA", tempfile.gettempdir())
+    else:
+        base = os.environ.get(
+            "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+        )
+    return os.path.join(base, "avogadro-generators")
+
+
+def index_path() -> str:
+    """Location of the cached index of entry point generators."""
+    if "AVOGADRO_GENERATORS_INDEX" in os.environ:
+        return os.environ["AVOGADRO_GENERATORS_INDEX"]
+    return os.path.join(cache_dir(), "index.json")
+
+
+def _fingerprint() -> list:
+    """Cheap summary of the import path that changes when packages do."""
+    fingerprint = []
+    for entry in sys.path:
+        try:
+            mtime = os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            mtime = None
+        fingerprint.append([entry, mtime])
+    return fingerprint
+
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _scan_entry_points() -> dict:
+    """Generators by name with their target and distribution, and the
+    distributions of generators shadowed by a built-in one.
+    """
+    from importlib.metadata import entry_points
+
+    builtins = {}
+    plugins = {}
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        dist = entry_point.dist.name if entry_point.dist else entry_point.name
+        generators = builtins if _normalize(dist) == DISTRIBUTION else plugins
+        generators[entry_point.name] = [entry_point.value, dist]
+    shadowed = {name: plugins.pop(name)[1] for name in builtins if name in plugins}
+    return {"generators": {**plugins, **builtins}, "shadowed": shadowed}
+
+
+def _write_index(path: str, index: dict):
+    """Replace the index file atomically, ignoring read-only locations."""
+    import tempfile
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _load_index() -> dict:
+    """The index of entry points, rebuilt if it is missing or outdated."""
+    path = index_path()
+    fingerprint = _fingerprint()
+    try:
+        with open(path) as f:
+            index = json.load(f)
+        if index["fingerprint"] == fingerprint:
+            return index
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    index = {"fingerprint": fingerprint, **_scan_entry_points()}
+    _write_index(path, index)
+    return index
+
+
+@functools.cache
+def available_generators() -> dict[str, tuple[str, str]]:
+    """All generators by name, with their ``module:attribute`` target and
+    the name of the distribution providing them.
+    """
+    index = _load_index()
+    for name, dist in index.get("shadowed", {}).items():
+        warnings.warn(
+            f"The generator {name!r} of {dist} is shadowed by the built-in one",
+            stacklevel=2,
+        )
+    return {k: tuple(v) for k, v in index["generators"].items()}
+
+
+def find_generator(name: str) -> str:
+    """Get the ``module:attribute`` target of a generator."""
+    try:
+        return available_generators()[name][0]
+    except KeyError:
+        raise ValueError(f"Unknown generator: {name}") from None
+
+
+def main(argv: list[str] | None = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="avogadro-generators list",
+        description="List the available input generators.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print as JSON")
+    args = parser.parse_args(argv)
+
+    generators = available_generators()
+    if args.json:
+        print(json.dumps({k: v[1] for k, v in sorted(generators.items())}))
+    else:
+        for name, (_, dist) in sorted(generators.items()):
+            print(f"{name:<12} {dist}")
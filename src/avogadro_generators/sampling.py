@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Stack sampling of the worker processes of the generation service.
+
+Every pool worker runs a thread that waits for the service to switch
+sampling on. It then looks at the stack of the worker's main thread every
+``interval`` seconds for the requested time, and sends the counts of the
+stacks it saw back to the service. The merged profile is returned in the
+collapsed-stack format read by flame graph tools, one stack per line from
+the outermost frame, with the number of samples::
+
+    multiprocessing.pool:worker;avogadro_generators.orca:generateInputFile 12
+
+Idle workers are sampled too, waiting in ``multiprocessing.pool:worker``,
+so the share of samples in the generators is the load of the pool.
+"""
+
+import collections
+import os
+import queue
+import sys
+import threading
+import time
+
+# Longest and shortest sampling runs, and the default interval, in seconds
+MAX_SECONDS = 60.0
+MIN_INTERVAL = 0.001
+INTERVAL = 0.005
+
+# Time allowed to the workers to report after sampling, in seconds
+REPORT_TIMEOUT = 2.0
+
+
+def _label(frame) -> str:
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}:{code.co_qualname}"
+
+
+def collapse(frame, root=None) -> str:
+    """Collapsed stack of ``frame``, outermost frame first.
+
+    Frames outside of ``root`` are left out.
+    """
+    labels = []
+    while frame is not None:
+        labels.append(_label(frame))
+        if frame is root:
+            break
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def _pool_worker_frame():
+    """Frame of the pool's worker loop, below which the stack of a forked
+    worker is that of the service when it started the pool.
+    """
+    import multiprocessing.pool
+
+    frame = sys._getframe()
+    while frame is not None:
+        if frame.f_code is multiprocessing.pool.worker.__code__:
+            return frame
+        frame = frame.f_back
+    return None
+
+
+def format_collapsed(counts: dict[str, int]) -> str:
+    """Profile in the collapsed-stack format, most frequent stacks first."""
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return "".join(f"{stack} {n}\n" for stack, n in ranked)
+
+
+class Sampler:
+    """Switch for sampling shared by the service and its workers.
+
+    Create it from a multiprocessing ``context`` before the workers are
+    started, call :meth:`start_worker` in each worker, and
+    :meth:`sample` in the service.
+    """
+
+    def __init__(self, context):
+        self._event = context.Event()
+        self._run = context.Value("i", 0, lock=False)
+        self._seconds = context.Value("d", 0.0, lock=False)
+        self._interval = context.Value("d", INTERVAL, lock=False)
+        self._results = context.Queue()
+        self._lock = threading.Lock()
+
+    def start_worker(self):
+        """Start the sampling thread of a worker process."""
+        main = threading.main_thread().ident
+        root = _pool_worker_frame()
+        threading.Thread(target=self._worker, args=(main, root), daemon=True).start()
+
+    def _worker(self, main: int, root):
+        answered = 0
+        while True:
+            self._event.wait()
+            run = self._run.value
+            if run == answered:
+                # Wait for the service to switch sampling off
+                time.sleep(INTERVAL)
+                continue
+            answered = run
+            counts = collections.Counter()
+            interval = self._interval.value
+            end = time.monotonic() + self._seconds.value
+            while time.monotonic() < end:
+                frame = sys._current_frames().get(main)
+                if frame is not None:
+                    counts[collapse(frame, root)] += 1
+                del frame
+                time.sleep(interval)
+            self._results.put((run, os.getpid(), dict(counts)))
+
+    def sample(self, seconds: float, interval: float, workers: int) -> dict:
+        """Sample ``workers`` workers for ``seconds``.
+
+        Returns the merged collapsed-stack profile and the number of
+        samples and of workers that reported.
+        """
+        seconds = min(max(seconds, 0.0), MAX_SECONDS)
+        interval = max(interval, MIN_INTERVAL)
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("The workers are already being sampled")
+        try:
+            self._run.value += 1
+            self._seconds.value = seconds
+            self._interval.value = interval
+            self._event.set()
+            counts = collections.Counter()
+            reported = 0
+            deadline = time.monotonic() + seconds + REPORT_TIMEOUT
+            while reported < workers:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    run, pid, partial = self._results.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if run != self._run.value:
+                    # Late report of an earlier run
+                    continue
+                counts.update(partial)
+                reported += 1
+        finally:
+            self._event.clear()
+            self._lock.release()
+
+        return {
+            "profile": format_collapsed(counts),
+            "samples": sum(counts.values()),
+            "workers": reported,
+            "seconds": seconds,
+        }
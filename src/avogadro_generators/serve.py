@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Persistent mode answering newline-delimited JSON requests.
+
+Each request is a JSON object on a single line of the form::
+
+    {"generator": "orca", "options": {...}, "cjson": {...}}
+
+and is answered by exactly one line holding the same JSON that a one-shot
+run of the generator would print. The ``generator`` key may be left out
+if a default generator was given on the command line, and an optional
+``id`` is copied into the response so callers can match them up. Errors
+are reported as ``{"error": "..."}`` instead of ending the process.
+Optional ``debug`` and ``timings`` keys override the command line flags.
+
+With ``--protocol binary``, requests and responses are exchanged as the
+length-prefixed frames described in :mod:`.protocol` instead.
+"""
+
+import contextlib
+import json
+from typing import TYPE_CHECKING, BinaryIO, TextIO
+
+from .api import run_generator
+from .output import join_chunks
+
+if TYPE_CHECKING:
+    from .profiling import Profiler
+
+
+def _profile_job(profiler: "Profiler | None"):
+    return contextlib.nullcontext() if profiler is None else profiler.job()
+
+
+def handle_request(
+    request: dict, generator: str | None, debug: bool, timings: bool = False
+) -> dict:
+    """Run one decoded request and build its response."""
+    try:
+        name = request.get("generator", generator)
+        if name is None:
+            raise ValueError("No generator given in request")
+        output = join_chunks(
+            run_generator(
+                name,
+                request,
+                request.get("debug", debug),
+                request.get("timings", timings),
+            )
+        )
+    except Exception as err:
+        output = {"error": f"{type(err).__name__}: {err}"}
+
+    if "id" in request:
+        output["id"] = request["id"]
+
+    return output
+
+
+def handle_line(
+    line: str, generator: str | None, debug: bool, timings: bool = False
+) -> str:
+    """Answer a single request line with a single response line."""
+    try:
+        request = json.loads(line)
+    except ValueError as err:
+        return json.dumps({"error": f"Invalid request: {err}"}) + "\n"
+    if not isinstance(request, dict):
+        return json.dumps({"error": "Invalid request: not a JSON object"}) + "\n"
+
+    return json.dumps(handle_request(request, generator, debug, timings)) + "\n"
+
+
+def serve(
+    instream: TextIO,
+    outstream: TextIO,
+    generator: str | None = None,
+    debug: bool = False,
+    profiler: "Profiler | None" = None,
+    timings: bool = False,
+):
+    """Answer requests from ``instream`` until it is closed.
+
+    Generator modules stay imported between requests, so only the first
+    request for each generator pays for its import. With a ``profiler``,
+    every request is added to its profile.
+    """
+    for line in instream:
+        if not line.strip():
+            continue
+        with _profile_job(profiler):
+            outstream.write(handle_line(line, generator, debug, timings))
+            outstream.flush()
+
+
+def serve_binary(
+    instream: BinaryIO,
+    outstream: BinaryIO,
+    generator: str | None = None,
+    debug: bool = False,
+    profiler: "Profiler | None" = None,
+    timings: bool = False,
+):
+    """Like :func:`serve`, but with binary frames from :mod:`.protocol`."""
+    from .protocol import read_request, write_response
+
+    while True:
+        try:
+            request = read_request(instream)
+        except ValueError as err:
+            write_response(outstream, {"error": f"Invalid request: {err}"})
+            continue
+        if request is None:
+            break
+        with _profile_job(profiler):
+            write_response(
+                outstream, handle_request(request, generator, debug, timings)
+            )
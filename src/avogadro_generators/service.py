@@ -0,0 +1,495 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Local generation service listening on a Unix domain socket.
+
+Start the service with::
+
+    avogadro-generators service -j 4
+
+and point one-shot runs at it with ``--socket PATH`` or by setting the
+``AVOGADRO_GENERATORS_SOCKET`` environment variable. When nothing is
+listening on the socket, the one-shot run generates the input itself.
+
+Clients talk to the service with the same JSON-lines requests as
+``--serve``, and a connection may send any number of them. All generator
+modules are imported before the worker processes are forked, so their
+tables are shared between the workers. Identical requests that arrive
+while one of them is being generated are answered by a single job.
+Throughput can be monitored with ``--metrics``, see :mod:`.metrics`.
+
+Besides generator requests, the service answers control requests on the
+same socket, also available from the command line::
+
+    {"control": "stats"}
+    {"control": "sample", "seconds": 5, "interval": 0.005}
+
+``stats`` returns the depth of the job queue, the busy time and memory of
+each worker, the hit rates of the caches and the memory of the service.
+``sample`` samples the stacks of the workers for a few seconds and returns
+a collapsed-stack profile, see :mod:`.sampling`.
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+
+from . import memo
+from .api import get_generator, run_generator
+from .hashing import request_key
+from .metrics import Metrics, MetricsWriter
+from .metrics import add_arguments as add_metrics_arguments
+from .protocol import dumps
+from .registry import available_generators
+from .sampling import INTERVAL, Sampler
+from .serve import handle_request
+from .transport import (
+    attach_arrays,
+    detach_arrays,
+    share_arrays,
+)
+
+SOCKET_ENV = "AVOGADRO_GENERATORS_SOCKET"
+
+
+def default_socket_path() -> str:
+    """Per-user socket path used when none is given."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "avogadro-generators.sock")
+    return os.path.join(
+        tempfile.gettempdir(), f"avogadro-generators-{os.getuid()}.sock"
+    )
+
+
+def _init_worker(sampler: Sampler):
+    # Interrupts are handled by the service, which then closes the pool.
+    # A worker killed while waiting for a task would leave the pool locked.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    sampler.start_worker()
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def preload():
+    """Import every generator, so forked workers inherit them."""
+    for name in available_generators():
+        get_generator(name)
+
+
+def _handle_shared_request(
+    request: dict, debug: bool
+) -> tuple[int, float, dict, dict]:
+    """Worker side of a request whose arrays may be in shared memory.
+
+    Returns the process ID of the worker, the time it spent on the job and
+    the statistics of its memo along with the output.
+    """
+    start = time.perf_counter()
+    request, blocks = attach_arrays(request)
+    try:
+        output = handle_request(request, None, debug)
+    finally:
+        detach_arrays(request, blocks)
+    return os.getpid(), time.perf_counter() - start, memo.stats(), output
+
+
+def _atom_count(request: dict) -> int:
+    try:
+        return len(request["cjson"]["atoms"]["elements"]["number"])
+    except (KeyError, TypeError):
+        return 0
+
+
+def _rss(pid: int | str = "self") -> int | None:
+    """Resident memory of a process in bytes, where ``/proc`` is available."""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _peak_rss() -> int:
+    """Peak resident memory of this process in bytes."""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _hit_rate(hits: int, misses: int) -> dict:
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hitRate": round(hits / total, 4) if total else None,
+    }
+
+
+class GenerationService:
+    """Pool of pre-forked workers with coalescing of identical requests.
+
+    The arrays of molecules with at least ``shm_min_atoms`` atoms are
+    handed to the workers through shared memory instead of being pickled.
+    Answered requests are counted in ``metrics``.
+    """
+
+    def __init__(self, jobs: int | None = None, shm_min_atoms: int = 10000):
+        preload()
+        self.shm_min_atoms = shm_min_atoms
+        self.metrics = Metrics()
+        self._started = time.monotonic()
+        context = multiprocessing.get_context("fork")
+        self._sampler = Sampler(context)
+        self._pool = context.Pool(
+            jobs, initializer=_init_worker, initargs=(self._sampler,)
+        )
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        # Requests waiting for an answer, and [hits, misses] of requests
+        # answered by the job of an identical one
+        self._waiting = 0
+        self._coalesced = [0, 0]
+        # Worker process ID -> [jobs, busy seconds], and the latest memo
+        # statistics of each worker
+        self._busy: dict[int, list] = {}
+        self._memo: dict[int, dict] = {}
+
+    def generate(self, request: dict) -> dict:
+        """Answer one decoded request, sharing work with identical ones."""
+        if not isinstance(request, dict):
+            return {"error": "Invalid request: not a JSON object"}
+        start = time.perf_counter()
+        request = dict(request)
+        request_id = request.pop("id", None)
+        name = request.get("generator")
+        debug = bool(request.get("debug", False))
+        timings = bool(request.get("timings", False))
+
+        key = request_key(str(name), request, debug, timings)
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            self._coalesced[owner] += 1
+            self._waiting += 1
+
+        if owner:
+            blocks = []
+            if _atom_count(request) >= self.shm_min_atoms:
+                request, blocks = share_arrays(request)
+
+            def finish(output: dict):
+                for block in blocks:
+                    block.close()
+                    block.unlink()
+                with self._lock:
+                    del self._inflight[key]
+                future.set_result(output)
+
+            def done(result: tuple[int, float, dict, dict]):
+                pid, busy, memo_stats, output = result
+                with self._lock:
+                    worker = self._busy.setdefault(pid, [0, 0.0])
+                    worker[0] += 1
+                    worker[1] += busy
+                    self._memo[pid] = memo_stats
+                finish(output)
+
+            def fail(err: BaseException):
+                finish({"error": f"{type(err).__name__}: {err}"})
+
+            self._pool.apply_async(
+                _handle_shared_request,
+                (request, debug),
+                callback=done,
+                error_callback=fail,
+            )
+
+        try:
+            output = future.result()
+        finally:
+            with self._lock:
+                self._waiting -= 1
+        self.metrics.record_job(
+            str(name),
+            time.perf_counter() - start,
+            output.get("warnings", []),
+            "error" in output,
+        )
+        if request_id is not None:
+            output = dict(output, id=request_id)
+        return output
+
+    def stats(self) -> dict:
+        """State of the service, for the ``stats`` control request."""
+        workers = []
+        with self._lock:
+            for process in multiprocessing.active_children():
+                jobs, busy = self._busy.get(process.pid, (0, 0.0))
+                workers.append(
+                    {
+                        "pid": process.pid,
+                        "jobs": jobs,
+                        "busySeconds": round(busy, 6),
+                        "rssBytes": _rss(process.pid),
+                    }
+                )
+            stats = {
+                "uptimeSeconds": round(time.monotonic() - self._started, 3),
+                "queueDepth": len(self._inflight),
+                "waitingRequests": self._waiting,
+                "workers": workers,
+                "caches": {
+                    "coalescing": _hit_rate(*self._coalesced),
+                    "memo": _hit_rate(
+                        sum(stats["hits"] for stats in self._memo.values()),
+                        sum(stats["misses"] for stats in self._memo.values()),
+                    ),
+                },
+            }
+        stats["rssBytes"] = _rss()
+        stats["peakRssBytes"] = _peak_rss()
+        return stats
+
+    def sample(self, seconds: float, interval: float = INTERVAL) -> dict:
+        """Collapsed-stack profile of the workers over ``seconds``."""
+        workers = len(multiprocessing.active_children())
+        return self._sampler.sample(seconds, interval, workers)
+
+    def control(self, request: dict) -> dict:
+        """Answer a control request."""
+        command = request.get("control")
+        try:
+            if command == "stats":
+                output = self.stats()
+            elif command == "sample":
+                output = self.sample(
+                    float(request.get("seconds", 1.0)),
+                    float(request.get("interval", INTERVAL)),
+                )
+            else:
+                output = {"error": f"Unknown control request: {command}"}
+        except (RuntimeError, TypeError, ValueError) as err:
+            output = {"error": str(err)}
+        if "id" in request:
+            output["id"] = request["id"]
+        return output
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        service = self.server.service
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("not a JSON object")
+                if "control" in request:
+                    output = service.control(request)
+                else:
+                    output = service.generate(request)
+            except ValueError as err:
+                request = {}
+                output = {"error": f"Invalid request: {err}"}
+            response = json.dumps(output).encode() + b"\n"
+            self.wfile.write(response)
+            self.wfile.flush()
+            if "generator" in request:
+                service.metrics.record_bytes(str(request["generator"]), len(response))
+
+
+def _make_server(path: str, service: GenerationService) -> socketserver.BaseServer:
+    """Server answering the requests of ``service`` on the socket ``path``."""
+
+    # Defined here, as Windows has no Unix stream servers
+    class Server(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+    server = Server(path, _RequestHandler)
+    server.service = service
+    os.chmod(path, 0o600)
+    return server
+
+
+def _is_socket(path: str) -> bool:
+    """Whether ``path`` exists and is a socket, a symbolic link is not."""
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def _remove_stale_socket(path: str):
+    """Remove a socket left behind by a service that is no longer running."""
+    if not os.path.lexists(path):
+        return
+    if not _is_socket(path):
+        raise RuntimeError(f"{path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+    raise RuntimeError(f"A generation service is already listening on {path}")
+
+
+def run_service(
+    path: str,
+    jobs: int | None = None,
+    shm_min_atoms: int = 10000,
+    metrics_path: str | None = None,
+    metrics_interval: float = 15.0,
+):
+    """Serve requests on ``path`` until interrupted.
+
+    With ``metrics_path``, the metrics are written to that file every
+    ``metrics_interval`` seconds.
+    """
+    _remove_stale_socket(path)
+    service = GenerationService(jobs, shm_min_atoms)
+    signal.signal(signal.SIGTERM, _interrupt)
+    metrics_writer = contextlib.nullcontext()
+    if metrics_path:
+        metrics_writer = MetricsWriter(service.metrics, metrics_path, metrics_interval)
+    try:
+        with metrics_writer, _make_server(path, service) as server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if _is_socket(path):
+            os.unlink(path)
+        service.close()
+
+
+def request_from_service(path: str, request: dict) -> dict | None:
+    """Send one request to a running service.
+
+    Returns ``None`` if no service answers on ``path``.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(path)
+            with sock.makefile("rwb") as f:
+                f.write(dumps(request) + b"\n")
+                f.flush()
+                line = f.readline()
+    except OSError:
+        return None
+    return json.loads(line) if line else None
+
+
+def generate(
+    path: str,
+    name: str,
+    input_json: dict,
+    debug: bool = False,
+    timings: bool = False,
+) -> dict:
+    """Generate through the service if it runs, in this process otherwise.
+
+    Failed requests are repeated in this process, so that errors surface
+    exactly as they would without the service.
+    """
+    request = dict(input_json, generator=name, debug=debug, timings=timings)
+    output = request_from_service(path, request)
+    if output is None or "error" in output:
+        output = run_generator(name, input_json, debug, timings)
+    return output
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog="avogadro-generators service",
+        description="Run a local generation service on a Unix domain socket.",
+    )
+    parser.add_argument(
+        "--socket",
+        default=os.environ.get(SOCKET_ENV) or default_socket_path(),
+        help="Socket path (default: $%s or a per-user path)" % SOCKET_ENV,
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--shm-min-atoms",
+        type=int,
+        default=10000,
+        help="Pass molecules with at least this many atoms via shared memory",
+    )
+    add_metrics_arguments(parser)
+    control = parser.add_mutually_exclusive_group()
+    control.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print the statistics of the running service and exit",
+    )
+    control.add_argument(
+        "--sample",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Print a collapsed-stack profile of the workers of the running "
+        "service over this many seconds and exit",
+    )
+    args = parser.parse_args(argv)
+
+    if args.stats or args.sample is not None:
+        if args.stats:
+            request = {"control": "stats"}
+        else:
+            request = {"control": "sample", "seconds": args.sample}
+        output = request_from_service(args.socket, request)
+        if output is None:
+            print(f"No generation service is listening on {args.socket}", file=sys.stderr)
+            return 1
+        if "error" in output:
+            print(output["error"], file=sys.stderr)
+            return 1
+        if args.stats:
+            print(json.dumps(output, indent=2))
+        else:
+            sys.stdout.write(output["profile"])
+        return 0
+
+    try:
+        run_service(
+            args.socket,
+            args.jobs,
+            args.shm_min_atoms,
+            args.metrics,
+            args.metrics_interval,
+        )
+    except RuntimeError as err:
+        print(err, file=sys.stderr)
+        return 1
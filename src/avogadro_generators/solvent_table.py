@@ -0,0 +1,296 @@
+# This file was automatically generated by scripts/write_orca_tables.py,
+# do NOT modify manually!
+"""Solvents of ``orca/definitions``, shared by the generators."""
+
+# fmt: off
+# Member name, aliases, bitmask of the available SolvationModels
+SOLVENTS = {
+    'Solvent': (
+        ('s_NONE', ('',), 0),
+        ('s_111_TRICHLOROETHANE', ('1,1,1-trichloroethane',), 7),
+        ('s_112_TRICHLOROETHANE', ('1,1,2-trichloroethane',), 3),
+        ('s_124_TRIMETHYLBENZENE', ('1,2,4-trimethylbenzene',), 7),
+        ('s_12_DIBROMOETHANE', ('1,2-dibromoethane',), 3),
+        ('s_12_DICHLOROETHANE', ('1,2-dichloroethane',), 3),
+        ('s_12_ETHANEDIOL', ('1,2-ethanediol',), 3),
+        ('s_14_DIOXANE', ('1,4-dioxane', 'dioxane'), 3),
+        ('s_1_BROMO_2_METHYLPROPANE', ('1-bromo-2-methylpropane',), 3),
+        ('s_1_BROMOOCTANE', ('1-bromooctane', 'bromooctane'), 3),
+        ('s_1_BROMOPENTANE', ('1-bromopentane',), 3),
+        ('s_1_BROMOPROPANE', ('1-bromopropane',), 3),
+        ('s_1_BUTANOL', ('1-butanol', 'butanol'), 7),
+        ('s_1_CHLOROHEXANE', ('1-chlorohexane', 'chlorohexane'), 7),
+        ('s_1_CHLOROPENTANE', ('1-chloropentane',), 3),
+        ('s_1_CHLOROPROPANE', ('1-chloropropane',), 3),
+        ('s_1_DECANOL', ('1-decanol', 'decanol'), 7),
+        ('s_1_FLUOROOCTANE', ('1-fluorooctane',), 7),
+        ('s_1_HEPTANOL', ('1-heptanol', 'heptanol'), 7),
+        ('s_1_HEXANOL', ('1-hexanol', 'hexanol'), 7),
+        ('s_1_HEXENE', ('1-hexene',), 3),
+        ('s_1_HEXYNE', ('1-hexyne',), 3),
+        ('s_1_IODOBUTANE', ('1-iodobutane',), 3),
+        ('s_1_IODOHEXADECANE', ('1-iodohexadecane', 'hexadecyliodide'), 7),
+        ('s_1_IODOPENTANE', ('1-iodopentane',), 3),
+        ('s_1_IODOPROPANE', ('1-iodopropane',), 3),
+        ('s_1_NITROPROPANE', ('1-nitropropane',), 3),
+        ('s_1_NONANOL', ('1-nonanol', 'nonanol'), 7),
+        ('s_1_OCTANOL', ('1-octanol', 'octanol'), 7),
+        ('s_1_PENTANOL', ('1-pentanol', 'pentanol'), 7),
+        ('s_1_PENTENE', ('1-pentene',), 3),
+        ('s_1_PROPANOL', ('1-propanol', 'propanol'), 7),
+        ('s_222_TRIFLUOROETHANOL', ('2,2,2-trifluoroethanol',), 3),
+        ('s_224_TRIMETHYLPENTANE', ('2,2,4-trimethylpentane', 'isooctane'), 7),
+        ('s_24_DIMETHYLPENTANE', ('2,4-dimethylpentane',), 3),
+        ('s_24_DIMETHYLPYRIDINE', ('2,4-dimethylpyridine',), 3),
+        ('s_26_DIMETHYLPYRIDINE', ('2,6-dimethylpyridine',), 7),
+        ('s_2_BROMOPROPANE', ('2-bromopropane',), 3),
+        ('s_2_BUTANOL', ('2-butanol', 'secbutanol'), 7),
+        ('s_2_CHLOROBUTANE', ('2-chlorobutane',), 3),
+        ('s_2_HEPTANONE', ('2-heptanone',), 3),
+        ('s_2_HEXANONE', ('2-hexanone',), 3),
+        ('s_2_METHOXYETHANOL', ('2-methoxyethanol', 'methoxyethanol'), 7),
+        ('s_2_METHYL_1_PROPANOL', ('2-methyl-1-propanol', 'isobutanol'), 7),
+        ('s_2_METHYL_2_PROPANOL', ('2-methyl-2-propanol',), 3),
+        ('s_2_METHYLPENTANE', ('2-methylpentane',), 3),
+        ('s_2_METHYLPYRIDINE', ('2-methylpyridine', '2methylpyridine'), 7),
+        ('s_2_NITROPROPANE', ('2-nitropropane',), 3),
+        ('s_2_OCTANONE', ('2-octanone',), 3),
+        ('s_2_PENTANONE', ('2-pentanone',), 3),
+        ('s_2_PROPANOL', ('2-propanol', 'isopropanol'), 7),
+        ('s_2_PROPEN_1_OL', ('2-propen-1-ol',), 3),
+        ('s_E_2_PENTENE', ('e-2-pentene',), 3),
+        ('s_3_METHYLPYRIDINE', ('3-methylpyridine',), 3),
+        ('s_3_PENTANONE', ('3-pentanone',), 3),
+        ('s_4_HEPTANONE', ('4-heptanone',), 3),
+        ('s_4_METHYL_2_PENTANONE', ('4-methyl-2-pentanone', '4methyl2pentanone'), 7),
+        ('s_4_METHYLPYRIDINE', ('4-methylpyridine',), 3),
+        ('s_5_NONANONE', ('5-nonanone',), 3),
+        ('s_ACETIC_ACID', ('acetic acid', 'aceticacid'), 7),
+        ('s_ACETONE', ('acetone',), 7),
+        ('s_ACETONITRILE', ('acetonitrile', 'mecn', 'ch3cn'), 7),
+        ('s_ACETOPHENONE', ('acetophenone',), 7),
+        ('s_AMMONIA', ('ammonia',), 5),
+        ('s_ANILINE', ('aniline',), 7),
+        ('s_ANISOLE', ('anisole',), 7),
+        ('s_BENZALDEHYDE', ('benzaldehyde',), 7),
+        ('s_BENZENE', ('benzene',), 7),
+        ('s_BENZONITRILE', ('benzonitrile',), 7),
+        ('s_BENZYL_ALCOHOL', ('benzyl alcohol', 'benzylalcohol'), 7),
+        ('s_BROMOBENZENE', ('bromobenzene',), 7),
+        ('s_BROMOETHANE', ('bromoethane',), 7),
+        ('s_BROMOFORM', ('bromoform',), 7),
+        ('s_BUTANAL', ('butanal',), 3),
+        ('s_BUTANOIC_ACID', ('butanoic acid',), 3),
+        ('s_BUTANONE', ('butanone',), 7),
+        ('s_BUTANONITRILE', ('butanonitrile',), 3),
+        ('s_BUTYL_ETHANOATE', ('butyl ethanoate', 'butyl acetate', 'butylacetate'), 7),
+        ('s_BUTYLAMINE', ('butylamine',), 3),
+        ('s_N_BUTYLBENZENE', ('n-butylbenzene', 'butylbenzene'), 7),
+        ('s_SEC_BUTYLBENZENE', ('sec-butylbenzene', 'secbutylbenzene'), 7),
+        ('s_TERT_BUTYLBENZENE', ('tert-butylbenzene', 'tbutylbenzene'), 7),
+        ('s_CARBON_DISULFIDE', ('carbon disulfide', 'carbondisulfide', 'cs2'), 7),
+        ('s_CARBON_TETRACHLORIDE', ('carbon tetrachloride', 'ccl4'), 7),
+        ('s_CHLOROBENZENE', ('chlorobenzene',), 7),
+        ('s_CHLOROFORM', ('chloroform', 'chcl3'), 7),
+        ('s_A_CHLOROTOLUENE', ('a-chlorotoluene',), 3),
+        ('s_O_CHLOROTOLUENE', ('o-chlorotoluene',), 3),
+        ('s_CONDUCTOR', ('conductor',), 1),
+        ('s_M_CRESOL', ('m-cresol', 'mcresol'), 7),
+        ('s_O_CRESOL', ('o-cresol',), 3),
+        ('s_CYCLOHEXANE', ('cyclohexane',), 7),
+        ('s_CYCLOHEXANONE', ('cyclohexanone',), 7),
+        ('s_CYCLOPENTANE', ('cyclopentane',), 3),
+        ('s_CYCLOPENTANOL', ('cyclopentanol',), 3),
+        ('s_CYCLOPENTANONE', ('cyclopentanone',), 3),
+        ('s_DECALIN', ('decalin',), 7),
+        ('s_CIS_DECALIN', ('cis-decalin',), 3),
+        ('s_N_DECANE', ('n-decane', 'decane'), 7),
+        ('s_DIBROMOMETHANE', ('dibromomethane',), 3),
+        ('s_DIBUTYLETHER', ('dibutylether',), 7),
+        ('s_O_DICHLOROBENZENE', ('o-dichlorobenzene', 'odichlorobenzene'), 7),
+        ('s_E_12_DICHLOROETHENE', ('e-1,2-dichloroethene',), 3),
+        ('s_Z_12_DICHLOROETHENE', ('z-1,2-dichloroethene',), 3),
+        ('s_DICHLOROMETHANE', ('dichloromethane', 'ch2cl2', 'dcm'), 7),
+        ('s_DIETHYL_ETHER', ('diethyl ether', 'diethylether'), 7),
+        ('s_DIETHYL_SULFIDE', ('diethyl sulfide',), 3),
+        ('s_DIETHYLAMINE', ('diethylamine',), 3),
+        ('s_DIIODOMETHANE', ('diiodomethane',), 3),
+        ('s_DIISOPROPYL_ETHER', ('diisopropyl ether', 'diisopropylether'), 7),
+        ('s_CIS_12_DIMETHYLCYCLOHEXANE', ('cis-1,2-dimethylcyclohexane',), 3),
+        ('s_DIMETHYL_DISULFIDE', ('dimethyl disulfide',), 3),
+        ('s_NN_DIMETHYLACETAMIDE', ('n,n-dimethylacetamide', 'dimethylacetamide'), 7),
+        ('s_NN_DIMETHYLFORMAMIDE', ('n,n-dimethylformamide', 'dimethylformamide', 'dmf'), 7),
+        ('s_DIMETHYLSULFOXIDE', ('dimethylsulfoxide', 'dmso'), 7),
+        ('s_DIPHENYLETHER', ('diphenylether',), 7),
+        ('s_DIPROPYLAMINE', ('dipropylamine',), 3),
+        ('s_N_DODECANE', ('n-dodecane', 'dodecane'), 7),
+        ('s_ETHANETHIOL', ('ethanethiol',), 3),
+        ('s_ETHANOL', ('ethanol',), 7),
+        ('s_ETHYL_ACETATE', ('ethyl acetate', 'ethylacetate', 'ethanoate'), 7),
+        ('s_ETHYL_METHANOATE', ('ethyl methanoate',), 3),
+        ('s_ETHYL_PHENYL_ETHER', ('ethyl phenyl ether', 'ethoxybenzene'), 7),
+        ('s_ETHYLBENZENE', ('ethylbenzene',), 7),
+        ('s_FLUOROBENZENE', ('fluorobenzene',), 7),
+        ('s_FORMAMIDE', ('formamide',), 3),
+        ('s_FORMIC_ACID', ('formic acid',), 3),
+        ('s_FURAN', ('furan', 'furane'), 4),
+        ('s_N_HEPTANE', ('n-heptane', 'heptane'), 7),
+        ('s_N_HEXADECANE', ('n-hexadecane', 'hexadecane'), 7),
+        ('s_N_HEXANE', ('n-hexane', 'hexane'), 7),
+        ('s_HEXANOIC_ACID', ('hexanoic acid',), 3),
+        ('s_IODOBENZENE', ('iodobenzene',), 7),
+        ('s_IODOETHANE', ('iodoethane',), 3),
+        ('s_IODOMETHANE', ('iodomethane',), 3),
+        ('s_ISOPROPYLBENZENE', ('isopropylbenzene',), 7),
+        ('s_P_ISOPROPYLTOLUENE', ('p-isopropyltoluene', 'isopropyltoluene'), 3),
+        ('s_MESITYLENE', ('mesitylene',), 7),
+        ('s_METHANOL', ('methanol',), 7),
+        ('s_METHYL_BENZOATE', ('methyl benzoate',), 3),
+        ('s_METHYL_BUTANOATE', ('methyl butanoate',), 3),
+        ('s_METHYL_ETHANOATE', ('methyl ethanoate',), 3),
+        ('s_METHYL_METHANOATE', ('methyl methanoate',), 3),
+        ('s_METHYL_PROPANOATE', ('methyl propanoate',), 3),
+        ('s_N_METHYLANILINE', ('n-methylaniline',), 3),
+        ('s_METHYLCYCLOHEXANE', ('methylcyclohexane',), 3),
+        ('s_N_METHYLFORMAMIDE', ('n-methylformamide', 'methylformamide'), 7),
+        ('s_NITROBENZENE', ('nitrobenzene', 'phno2'), 7),
+        ('s_NITROETHANE', ('nitroethane',), 7),
+        ('s_NITROMETHANE', ('nitromethane', 'meno2'), 7),
+        ('s_O_NITROTOLUENE', ('o-nitrotoluene', 'onitrotoluene'), 3),
+        ('s_N_NONANE', ('n-nonane', 'nonane'), 7),
+        ('s_N_OCTANE', ('n-octane', 'octane'), 7),
+        ('s_N_PENTADECANE', ('n-pentadecane', 'pentadecane'), 7),
+        ('s_PENTANAL', ('pentanal',), 3),
+        ('s_N_PENTANE', ('n-pentane', 'pentane'), 7),
+        ('s_PENTANOIC_ACID', ('pentanoic acid',), 3),
+        ('s_PENTYL_ETHANOATE', ('pentyl ethanoate',), 3),
+        ('s_PENTYLAMINE', ('pentylamine',), 3),
+        ('s_PERFLUOROBENZENE', ('perfluorobenzene', 'hexafluorobenzene'), 7),
+        ('s_PHENOL', ('phenol',), 5),
+        ('s_PROPANAL', ('propanal',), 3),
+        ('s_PROPANOIC_ACID', ('propanoic acid',), 3),
+        ('s_PROPANONITRILE', ('propanonitrile',), 3),
+        ('s_PROPYL_ETHANOATE', ('propyl ethanoate',), 3),
+        ('s_PROPYLAMINE', ('propylamine',), 3),
+        ('s_PYRIDINE', ('pyridine',), 7),
+        ('s_TETRACHLOROETHENE', ('tetrachloroethene', 'c2cl4'), 7),
+        ('s_TETRAHYDROFURAN', ('tetrahydrofuran', 'thf'), 7),
+        ('s_TETRAHYDROTHIOPHENE_SS_DIOXIDE', ('tetrahydrothiophene-s,s-dioxide', 'tetrahydrothiophenedioxide', 'sulfolane'), 1),
+        ('s_TETRALIN', ('tetralin',), 7),
+        ('s_THIOPHENE', ('thiophene',), 3),
+        ('s_THIOPHENOL', ('thiophenol',), 3),
+        ('s_TOLUENE', ('toluene',), 7),
+        ('s_TRANS_DECALIN', ('trans-decalin',), 3),
+        ('s_TRIBUTYLPHOSPHATE', ('tributylphosphate',), 7),
+        ('s_TRICHLOROETHENE', ('trichloroethene',), 3),
+        ('s_TRIETHYLAMINE', ('triethylamine',), 7),
+        ('s_N_UNDECANE', ('n-undecane', 'undecane'), 7),
+        ('s_WATER', ('water', 'h2o'), 7),
+        ('s_XYLENE', ('xylene',), 3),
+        ('s_M_XYLENE', ('m-xylene',), 3),
+        ('s_O_XYLENE', ('o-xylene',), 3),
+        ('s_P_XYLENE', ('p-xylene',), 3),
+    ),
+    'XTBSolvent': (
+        ('s_NONE', ('',), 0),
+        ('s_124_TRIMETHYLBENZENE', ('1,2,4-trimethylbenzene',), 32),
+        ('s_12_DIBROMOETHANE', ('1,2-dibromoethane',), 32),
+        ('s_14_DIOXANE', ('1,4-dioxane', 'dioxane'), 24),
+        ('s_1_BUTANOL', ('1-butanol', 'butanol'), 32),
+        ('s_1_CHLOROHEXANE', ('1-chlorohexane', 'chlorohexane'), 32),
+        ('s_1_DECANOL', ('1-decanol', 'decanol'), 32),
+        ('s_1_FLUOROOCTANE', ('1-fluorooctane',), 32),
+        ('s_1_HEPTANOL', ('1-heptanol', 'heptanol'), 32),
+        ('s_1_HEXANOL', ('1-hexanol', 'hexanol'), 32),
+        ('s_1_IODOHEXADECANE', ('1-iodohexadecane', 'hexadecyliodide'), 32),
+        ('s_1_NONANOL', ('1-nonanol', 'nonanol'), 32),
+        ('s_1_OCTANOL', ('1-octanol', 'octanol'), 56),
+        ('s_1_PENTANOL', ('1-pentanol', 'pentanol'), 32),
+        ('s_1_PROPANOL', ('1-propanol', 'propanol'), 32),
+        ('s_224_TRIMETHYLPENTANE', ('2,2,4-trimethylpentane', 'isooctane'), 32),
+        ('s_26_DIMETHYLPYRIDINE', ('2,6-dimethylpyridine',), 32),
+        ('s_2_BUTANOL', ('2-butanol', 'secbutanol'), 32),
+        ('s_2_METHOXYETHANOL', ('2-methoxyethanol', 'methoxyethanol'), 32),
+        ('s_2_METHYL_1_PROPANOL', ('2-methyl-1-propanol', 'isobutanol'), 32),
+        ('s_2_METHYLPYRIDINE', ('2-methylpyridine', '2methylpyridine'), 32),
+        ('s_2_PROPANOL', ('2-propanol', 'isopropanol'), 32),
+        ('s_4_METHYL_2_PENTANONE', ('4-methyl-2-pentanone', '4methyl2pentanone'), 32),
+        ('s_ACETIC_ACID', ('acetic acid', 'aceticacid'), 32),
+        ('s_ACETONE', ('acetone',), 24),
+        ('s_ACETONITRILE', ('acetonitrile', 'mecn', 'ch3cn'), 56),
+        ('s_ACETOPHENONE', ('acetophenone',), 32),
+        ('s_ANILINE', ('aniline',), 56),
+        ('s_ANISOLE', ('anisole',), 32),
+        ('s_BENZALDEHYDE', ('benzaldehyde',), 24),
+        ('s_BENZENE', ('benzene',), 56),
+        ('s_BENZONITRILE', ('benzonitrile',), 32),
+        ('s_BENZYL_ALCOHOL', ('benzyl alcohol', 'benzylalcohol'), 32),
+        ('s_BROMOBENZENE', ('bromobenzene',), 32),
+        ('s_BROMOETHANE', ('bromoethane',), 32),
+        ('s_BROMOFORM', ('bromoform',), 32),
+        ('s_BUTANONE', ('butanone',), 32),
+        ('s_BUTYL_ETHANOATE', ('butyl ethanoate', 'butyl acetate', 'butylacetate'), 32),
+        ('s_N_BUTYLBENZENE', ('n-butylbenzene', 'butylbenzene'), 32),
+        ('s_SEC_BUTYLBENZENE', ('sec-butylbenzene', 'secbutylbenzene'), 32),
+        ('s_TERT_BUTYLBENZENE', ('tert-butylbenzene', 'tbutylbenzene'), 32),
+        ('s_CARBON_DISULFIDE', ('carbon disulfide', 'carbondisulfide', 'cs2'), 56),
+        ('s_CARBON_TETRACHLORIDE', ('carbon tetrachloride', 'ccl4'), 32),
+        ('s_CHLOROBENZENE', ('chlorobenzene',), 32),
+        ('s_CHLOROFORM', ('chloroform', 'chcl3'), 56),
+        ('s_CONDUCTOR', ('conductor',), 16),
+        ('s_M_CRESOL', ('m-cresol', 'mcresol'), 32),
+        ('s_CYCLOHEXANE', ('cyclohexane',), 32),
+        ('s_CYCLOHEXANONE', ('cyclohexanone',), 32),
+        ('s_DECALIN', ('decalin',), 32),
+        ('s_N_DECANE', ('n-decane', 'decane'), 32),
+        ('s_DIBROMOMETHANE', ('dibromomethane',), 32),
+        ('s_DIBUTYLETHER', ('dibutylether',), 32),
+        ('s_O_DICHLOROBENZENE', ('o-dichlorobenzene', 'odichlorobenzene'), 32),
+        ('s_DICHLOROMETHANE', ('dichloromethane', 'ch2cl2', 'dcm'), 56),
+        ('s_DIETHYL_ETHER', ('diethyl ether', 'diethylether'), 56),
+        ('s_DIISOPROPYL_ETHER', ('diisopropyl ether', 'diisopropylether'), 32),
+        ('s_NN_DIMETHYLACETAMIDE', ('n,n-dimethylacetamide', 'dimethylacetamide'), 32),
+        ('s_NN_DIMETHYLFORMAMIDE', ('n,n-dimethylformamide', 'dimethylformamide', 'dmf'), 56),
+        ('s_DIMETHYLSULFOXIDE', ('dimethylsulfoxide', 'dmso'), 56),
+        ('s_DIPHENYLETHER', ('diphenylether',), 32),
+        ('s_N_DODECANE', ('n-dodecane', 'dodecane'), 32),
+        ('s_ETHANOL', ('ethanol',), 56),
+        ('s_ETHYL_ACETATE', ('ethyl acetate', 'ethylacetate', 'ethanoate'), 56),
+        ('s_ETHYL_PHENYL_ETHER', ('ethyl phenyl ether', 'ethoxybenzene'), 32),
+        ('s_ETHYLBENZENE', ('ethylbenzene',), 32),
+        ('s_FLUOROBENZENE', ('fluorobenzene',), 32),
+        ('s_FURAN', ('furan', 'furane'), 24),
+        ('s_N_HEPTANE', ('n-heptane', 'heptane'), 32),
+        ('s_N_HEXADECANE', ('n-hexadecane', 'hexadecane'), 56),
+        ('s_N_HEXANE', ('n-hexane', 'hexane'), 56),
+        ('s_IODOBENZENE', ('iodobenzene',), 32),
+        ('s_ISOPROPYLBENZENE', ('isopropylbenzene',), 32),
+        ('s_P_ISOPROPYLTOLUENE', ('p-isopropyltoluene', 'isopropyltoluene'), 32),
+        ('s_MESITYLENE', ('mesitylene',), 32),
+        ('s_METHANOL', ('methanol',), 56),
+        ('s_N_METHYLFORMAMIDE', ('n-methylformamide', 'methylformamide'), 32),
+        ('s_NITROBENZENE', ('nitrobenzene', 'phno2'), 32),
+        ('s_NITROETHANE', ('nitroethane',), 32),
+        ('s_NITROMETHANE', ('nitromethane', 'meno2'), 56),
+        ('s_O_NITROTOLUENE', ('o-nitrotoluene', 'onitrotoluene'), 32),
+        ('s_N_NONANE', ('n-nonane', 'nonane'), 32),
+        ('s_N_OCTANE', ('n-octane', 'octane'), 32),
+        ('s_N_PENTADECANE', ('n-pentadecane', 'pentadecane'), 32),
+        ('s_OCTANOL_WET_', ('octanol(wet)', 'wetoctanol', 'woctanol'), 24),
+        ('s_N_PENTANE', ('n-pentane', 'pentane'), 32),
+        ('s_PERFLUOROBENZENE', ('perfluorobenzene', 'hexafluorobenzene'), 32),
+        ('s_PHENOL', ('phenol',), 24),
+        ('s_PYRIDINE', ('pyridine',), 32),
+        ('s_TETRACHLOROETHENE', ('tetrachloroethene', 'c2cl4'), 32),
+        ('s_TETRAHYDROFURAN', ('tetrahydrofuran', 'thf'), 56),
+        ('s_TETRAHYDROTHIOPHENE_SS_DIOXIDE', ('tetrahydrothiophene-s,s-dioxide', 'tetrahydrothiophenedioxide', 'sulfolane'), 32),
+        ('s_TETRALIN', ('tetralin',), 32),
+        ('s_TOLUENE', ('toluene',), 56),
+        ('s_TRIBUTYLPHOSPHATE', ('tributylphosphate',), 32),
+        ('s_TRIETHYLAMINE', ('triethylamine',), 32),
+        ('s_N_UNDECANE', ('n-undecane', 'undecane'), 32),
+        ('s_WATER', ('water', 'h2o'), 56),
+        ('s_XYLENE', ('xylene',), 32),
+    ),
+}
+# fmt: on
@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Solvents for implicit solvation, shared by the generators.
+
+ORCA's solvents, with the solvation models each of them is available
+with, are defined in ``orca.definitions.implicit_solvation`` and compiled
+into ``solvent_table``, which other generators load without importing
+the ORCA package. MOPAC's COSMO needs the dielectric constant of the
+solvent instead, which is listed here for the solvents in MOPAC's
+options. Both are merged into one table the first time a solvent is
+looked up, indexed by every alias in lowercase::
+
+    >>> get_solvent("Water")
+    SolventEntry(name='water', aliases=('water', 'h2o'), models=63, dielectric=80.1)
+
+The ``models`` of an entry are the bits of the
+``orca.implicit_solvation.SolvationModel`` it is available with, both
+those of ORCA's own solvation models and those of xTB.
+"""
+
+import functools
+from dataclasses import dataclass
+
+# Dielectric constants of the solvents in MOPAC's options, by their name
+# there. Names that are not an alias of an ORCA solvent add a solvent that
+# is only available for COSMO in MOPAC.
+DIELECTRICS = {
+    "Acetic acid": 6.15,
+    "Acetone": 20.7,
+    "Acetonitrile": 37.5,
+    "Anisole": 4.33,
+    "Benzene": 2.27,
+    "Bromobenzene": 5.17,
+    "Carbon disulfide": 2.6,
+    "Carbon tetrachloride": 2.24,
+    "Chlorobenzene": 5.62,
+    "Chloroform": 4.81,
+    "Cyclohexane": 2.02,
+    "Dibutyl ether": 3.1,
+    "o-Dichlorobenzene": 9.93,
+    "1,2-Dichloroethane": 10.36,
+    "Dichloromethane": 8.93,
+    "Diethylamine": 3.6,
+    "Diethylether": 4.33,
+    "1,2-Dimethoxyethane": 7.2,
+    "N,N-Dimethylacetamide": 37.8,
+    "N,N-Dimethylformamide": 36.7,
+    "Dimethylsulfoxide": 46.7,
+    "1,4-Dioxane": 2.25,
+    "Ethanol": 24.5,
+    "Ethyl acetate": 6.02,
+    "Ethyl benzoate": 6.02,
+    "Formamide": 111,
+    "Hexamethylphosphoramide": 30,
+    "Isopropyl lcohol": 17.9,
+    "Methanol": 32.7,
+    "2-Methyl-2-propanol": 10.9,
+    "Nitrobenzene": 34.82,
+    "Nitromethane": 35.87,
+    "Pyridine": 12.4,
+    "Tetrahydrofuran": 7.58,
+    "Toluene": 2.38,
+    "Trichloroethylene": 3.4,
+    "Triethylamine": 2.42,
+    "Trifluoroacetic acid": 8.55,
+    "2,2,2-Trifluoroethanol": 8.55,
+    "Water": 80.1,
+    "o-Xylene": 2.57,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SolventEntry:
+    """A solvent, with the keyword used for it in the input first among
+    its aliases.
+    """
+
+    name: str
+    aliases: tuple[str, ...]
+    models: int
+    dielectric: float | None
+
+
+@functools.cache
+def _solvent_index() -> dict[str, SolventEntry]:
+    """All solvents, by each of their aliases in lowercase."""
+    from .solvent_table import SOLVENTS
+
+    # Merged rows as [aliases, models, dielectric], in the order ORCA's
+    # solvents are defined, so their first alias stays the name
+    rows = []
+    index = {}
+    for solvents in SOLVENTS.values():
+        for _, aliases, models in solvents:
+            row = None
+            for alias in aliases:
+                row = index.get(alias.lower(), row)
+            if row is None:
+                row = [[], 0, None]
+                rows.append(row)
+            row[1] |= models
+            for alias in aliases:
+                if alias.lower() not in index:
+                    row[0].append(alias)
+                    index[alias.lower()] = row
+    for name, dielectric in DIELECTRICS.items():
+        row = index.get(name.lower())
+        if row is None:
+            row = [[name], 0, None]
+            rows.append(row)
+            index[name.lower()] = row
+        row[2] = dielectric
+
+    # The empty alias of "no solvent" is not a solvent
+    index.pop("", None)
+    entries = {
+        id(row): SolventEntry(row[0][0], tuple(row[0]), row[1], row[2])
+        for row in rows
+        if row[0] != [""]
+    }
+    return {alias: entries[id(row)] for alias, row in index.items()}
+
+
+def get_solvent(value: str) -> SolventEntry | None:
+    """Get a solvent from any of its aliases in any case, or ``None`` if
+    there is no such solvent.
+    """
+    return _solvent_index().get(value.lower())
+
+
+def solvents() -> list[SolventEntry]:
+    """All solvents, each once, in the order they are defined."""
+    return list(dict.fromkeys(_solvent_index().values()))
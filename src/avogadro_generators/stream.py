@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Parallel filter from JSON-lines requests to JSON-lines results.
+
+Usage::
+
+    conformers | avogadro-generators stream orca -j 8 > results.jsonl
+
+Requests and responses use the same format as ``--serve``, and responses
+are written in the same order as the requests. At most ``--window``
+requests are in flight at any time; reading stops until the oldest one is
+written, so memory use does not grow with the length of the stream.
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import TextIO
+
+from . import profiling
+from .serve import handle_line
+
+
+def _handle_line(line: str, generator: str | None, debug: bool, timings: bool) -> str:
+    with profiling.worker_job():
+        return handle_line(line, generator, debug, timings)
+
+
+def _result(future) -> str:
+    """Response line of a request, or an error object if its job failed."""
+    try:
+        return future.result()
+    except Exception as err:
+        return json.dumps({"error": f"{type(err).__name__}: {err}"}) + "\n"
+
+
+def stream(
+    instream: TextIO,
+    outstream: TextIO,
+    generator: str | None = None,
+    debug: bool = False,
+    jobs: int | None = None,
+    window: int | None = None,
+    profile: str | None = None,
+    profile_output: str | None = None,
+    timings: bool = False,
+):
+    """Answer every request of ``instream`` in order using a process pool.
+
+    With ``profile``, the jobs are profiled in that mode and the merged
+    profile is written to ``profile_output``.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    window = window or 4 * jobs
+
+    initializer = None
+    initargs = ()
+    if profile:
+        profile_prefix = profiling.worker_prefix(profile_output)
+        initializer = profiling.start_worker
+        initargs = (profile, profile_prefix)
+
+    pending = deque()
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=initializer, initargs=initargs
+    ) as pool:
+        for line in instream:
+            if not line.strip():
+                continue
+            if len(pending) >= window:
+                outstream.write(_result(pending.popleft()))
+            pending.append(pool.submit(_handle_line, line, generator, debug, timings))
+
+        while pending:
+            outstream.write(_result(pending.popleft()))
+    outstream.flush()
+
+    if profile:
+        profiling.merge_workers(profile, profile_prefix, profile_output)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog="avogadro-generators stream",
+        description="Answer JSON-lines requests from stdin in parallel.",
+    )
+    parser.add_argument("generator", nargs="?")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=None,
+        help="Maximum number of requests in flight (default: 4 per job)",
+    )
+    parser.add_argument("--debug", action="store_true")
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report the time spent in each stage of the generator",
+    )
+    profiling.add_arguments(parser)
+    args = parser.parse_args(profiling.expand_flag(argv))
+
+    profile_output = None
+    if args.profile:
+        profile_output = args.profile_output or profiling.default_output(
+            args.profile, os.getcwd(), args.generator or "stream"
+        )
+
+    stream(
+        sys.stdin,
+        sys.stdout,
+        args.generator,
+        args.debug,
+        args.jobs,
+        args.window,
+        args.profile,
+        profile_output,
+        args.timings,
+    )
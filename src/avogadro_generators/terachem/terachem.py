@@ -7,8 +7,11 @@
 # ******************************************************************************
 """Input generation for TeraChem."""
 
+from avogadro_generators import timing
+
 
 def generateInputFile(input_json: dict) -> tuple[str, str, list[str]]:
+    stages = timing.stages()
     # Collect warning strings as we go
     warnings = []
 
@@ -23,6 +26,7 @@ def generateInputFile(input_json: dict) -> tuple[str, str, list[str]]:
     charge = opts['Charge']
     multiplicity = opts['Multiplicity']
     baseName = opts['Filename Base']
+    stages.mark("options")
 
     # Convert to code-specific strings
     basisStr = ''
@@ -55,6 +59,7 @@ def generateInputFile(input_json: dict) -> tuple[str, str, list[str]]:
         dispStr = 'yes'
     else:
         dispStr = dispersion.lower()
+    stages.mark("method")
 
     # Create input file
     generated_input = ''
@@ -76,6 +81,7 @@ def generateInputFile(input_json: dict) -> tuple[str, str, list[str]]:
 
     # Create XYZ file
     coordFile = '$$atomCount$$\n%s\n$$coords:Sxyz$$\n' % title
+    stages.mark("blocks")
 
     return generated_input, coordFile, warnings
 
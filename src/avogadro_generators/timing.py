@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Timing of the stages of input generation.
+
+Generators mark the end of each stage of ``generateInputFile``::
+
+    stages = timing.stages()
+    opts = input_json["options"]
+    ...
+    stages.mark("options")
+
+When timings are requested, with ``--timings`` or ``"timings": true`` in
+a request, the time since the previous mark is added to the stage and the
+result gets a ``timings`` key with the milliseconds spent in each stage,
+plus the ``total`` of the job. Otherwise :func:`stages` returns a recorder
+whose ``mark`` does nothing, so the marks can stay in production code.
+
+The stage names shared by the generators are
+
+* ``options``: reading the options,
+* ``method``: resolving the method and basis set,
+* ``elements``: checking that the basis set covers the molecule,
+* ``blocks``: assembling keywords and input blocks,
+* ``coordinates``: coordinates and constraints,
+* ``memo``: looking up a memoized result, see :mod:`.memo`, in place of
+  all of the above.
+"""
+
+import contextvars
+import time
+
+
+class Stages:
+    """Accumulated time of each stage, measured with a monotonic clock."""
+
+    __slots__ = ("spans", "_start", "_last")
+
+    def __init__(self):
+        self.spans: dict[str, float] = {}
+        self._start = self._last = time.perf_counter()
+
+    def mark(self, stage: str):
+        """End ``stage``, which started at the previous mark."""
+        now = time.perf_counter()
+        self.spans[stage] = self.spans.get(stage, 0.0) + now - self._last
+        self._last = now
+
+    def timings(self) -> dict[str, float]:
+        """Milliseconds spent in each stage, and in total."""
+        timings = {stage: round(1000 * span, 3) for stage, span in self.spans.items()}
+        timings["total"] = round(1000 * (time.perf_counter() - self._start), 3)
+        return timings
+
+
+class _NoStages:
+    """Recorder used while timings are disabled."""
+
+    __slots__ = ()
+
+    def mark(self, stage: str):
+        pass
+
+
+_NO_STAGES = _NoStages()
+_current = contextvars.ContextVar("stages", default=_NO_STAGES)
+
+
+def stages() -> Stages | _NoStages:
+    """Recorder of the job being generated."""
+    return _current.get()
+
+
+def record() -> tuple[Stages, contextvars.Token]:
+    """Start recording the stages of a job.
+
+    Pass the token to :func:`stop` once the job is done.
+    """
+    recorder = Stages()
+    return recorder, _current.set(recorder)
+
+
+def stop(token: contextvars.Token):
+    """Stop the recording started by :func:`record`."""
+    _current.reset(token)
+
+
+def aggregate(totals: dict[str, list[float]], timings: dict[str, float]):
+    """Add the timings of a job to ``totals``, which maps stages to
+    ``[sum, count]``.
+    """
+    for stage, ms in timings.items():
+        total = totals.setdefault(stage, [0.0, 0])
+        total[0] += ms
+        total[1] += 1
+
+
+def format_totals(totals: dict[str, list[float]]) -> str:
+    """Summary of aggregated timings, with the mean time of each stage."""
+    return ", ".join(
+        f"{stage} {total / count:.3f} ms" for stage, (total, count) in totals.items()
+    )
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 Avogadro Project
+# SPDX-License-Identifier: BSD 3-Clause
+# ******************************************************************************
+# This source file is part of the Avogadro project.
+#
+# This source code is released under the New BSD License, (the "License").
+# ******************************************************************************
+"""Hand large molecules to worker processes through shared memory.
+
+Pickling the coordinates of a big molecule as a list of Python floats
+costs more than generating its input. Instead, the coordinates (float64)
+and atomic numbers (uint8) are copied into ``multiprocessing.shared_memory``
+blocks, and the request only carries the name, format and length of each
+block. The worker reads them through ``memoryview`` objects, which support
+everything the generators do with the original lists: ``len``, indexing,
+slicing and iteration.
+"""
+
+from array import array
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+# Paths of the arrays that are moved into shared memory, with their format
+SHARED_ARRAYS = (
+    (("atoms", "coords", "3d"), "d"),
+    (("atoms", "elements", "number"), "B"),
+)
+
+
+def _get(cjson: dict, path: tuple[str, ...]):
+    for key in path:
+        cjson = cjson[key]
+    return cjson
+
+
+def _replace(cjson: dict, path: tuple[str, ...], value) -> dict:
+    """Copy of ``cjson`` with the item at ``path`` replaced.
+
+    Only the dicts along ``path`` are copied, the rest is shared.
+    """
+    cjson = dict(cjson)
+    if len(path) == 1:
+        cjson[path[0]] = value
+    else:
+        cjson[path[0]] = _replace(cjson[path[0]], path[1:], value)
+    return cjson
+
+
+def share_arrays(request: dict) -> tuple[dict, list[SharedMemory]]:
+    """Move the coordinate arrays of ``request`` into shared memory.
+
+    Returns the request to send to the worker and the blocks that were
+    created. The caller owns the blocks and has to ``close`` and ``unlink``
+    them once the worker is done. Arrays that are missing or can not be
+    packed are left in the request as they are.
+    """
+    blocks = []
+    cjson = request.get("cjson", {})
+    for path, fmt in SHARED_ARRAYS:
+        try:
+            packed = array(fmt, _get(cjson, path))
+        except (KeyError, TypeError, OverflowError):
+            continue
+        if len(packed) == 0:
+            continue
+
+        nbytes = len(packed) * packed.itemsize
+        block = SharedMemory(create=True, size=nbytes)
+        block.buf[:nbytes].cast(fmt)[:] = packed
+        blocks.append(block)
+
+        handle = {"shm": block.name, "format": fmt, "length": len(packed)}
+        cjson = _replace(cjson, path, handle)
+
+    if blocks:
+        request = dict(request, cjson=cjson)
+    return request, blocks
+
+
+def attach_arrays(request: dict) -> tuple[dict, list[SharedMemory]]:
+    """Replace shared memory handles in ``request`` with ``memoryview``s.
+
+    Returns the request and the attached blocks, which have to be passed
+    to :func:`detach_arrays` once the views are no longer needed.
+    """
+    blocks = []
+    cjson = request.get("cjson", {})
+    for path, fmt in SHARED_ARRAYS:
+        try:
+            handle = _get(cjson, path)
+        except (KeyError, TypeError):
+            continue
+        if not isinstance(handle, dict) or "shm" not in handle:
+            continue
+
+        block = SharedMemory(name=handle["shm"])
+        # The creator unlinks the block, the worker must not do it on exit
+        resource_tracker.unregister(block._name, "shared_memory")
+        blocks.append(block)
+        nbytes = handle["length"] * array(fmt).itemsize
+        view = block.buf[:nbytes].cast(fmt)
+        cjson = _replace(cjson, path, view)
+
+    if blocks:
+        request = dict(request, cjson=cjson)
+    return request, blocks
+
+
+def materialize_arrays(request: dict):
+    """Turn attached views in ``request`` back into lists, in place."""
+    cjson = request.get("cjson", {})
+    for path, _ in SHARED_ARRAYS:
+        try:
+            parent = _get(cjson, path[:-1])
+        except (KeyError, TypeError):
+            continue
+        if isinstance(parent.get(path[-1]), memoryview):
+            parent[path[-1]] = parent[path[-1]].tolist()
+
+
+def detach_arrays(request: dict, blocks: list[SharedMemory]):
+    """Release the views of an attached request and close its blocks."""
+    cjson = request.get("cjson", {})
+    for path, _ in SHARED_ARRAYS:
+        try:
+            view = _get(cjson, path)
+        except (KeyError, TypeError):
+            continue
+        if isinstance(view, memoryview):
+            view.release()
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            # A view is still referenced somewhere, the mapping goes away
+            # with it instead.
+            pass
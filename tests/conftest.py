@@ -0,0 +1,91 @@
+"""Fixtures shared by the tests of the generators and their runners."""
+
+import functools
+import json
+import tomllib
+from importlib import resources
+
+import pytest
+
+from avogadro_generators import memo
+
+
+@functools.cache
+def _default_options(generator: str) -> dict:
+    files = resources.files("avogadro_generators") / generator
+    if (files / "options.toml").is_file():
+        spec = tomllib.loads((files / "options.toml").read_text())
+    else:
+        spec = json.loads((files / "options.json").read_text())
+        spec = spec.get("userOptions", spec)
+
+    options = {}
+    for name, option in spec.items():
+        if not isinstance(option, dict) or "type" not in option:
+            continue
+        default = option.get("default")
+        if option["type"] == "stringList" and isinstance(default, int):
+            default = option["values"][default]
+        elif default is None:
+            default = "" if option["type"] in ("string", "filePath", "text") else 0
+        options[name] = default
+    return options
+
+
+@pytest.fixture
+def options():
+    """Default values of the options of a generator, by its name."""
+    return lambda generator: dict(_default_options(generator))
+
+
+@pytest.fixture
+def water() -> dict:
+    return {
+        "atoms": {
+            "elements": {"number": [8, 1, 1]},
+            "coords": {"3d": [0.0, 0.0, 0.0, 0.96, 0.0, 0.0, -0.24, 0.93, 0.0]},
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def fresh_memo(monkeypatch):
+    """Give each test an empty memo, so results never leak between them."""
+    monkeypatch.setattr(memo, "_memo", memo.LRU(memo.MEMO_SIZE))
+
+
+def stretched_water(i: int) -> dict:
+    """Water with its first bond stretched by ``i`` hundredths of an Angstrom."""
+    return {
+        "atoms": {
+            "elements": {"number": [8, 1, 1]},
+            "coords": {
+                "3d": [0.0, 0.0, 0.0, 0.96 + i / 100, 0.0, 0.0, -0.24, 0.93, 0.0]
+            },
+        },
+    }
+
+
+@pytest.fixture
+def batch(tmp_path, options):
+    """Run batch mode on a directory of twelve molecules and two broken files.
+
+    Returns its exit code, the files are written to ``tmp_path / "out"``.
+    """
+    from avogadro_generators.batch import main
+
+    in_dir = tmp_path / "in"
+    in_dir.mkdir()
+    for i in range(12):
+        (in_dir / f"mol{i:02}.cjson").write_text(json.dumps(stretched_water(i)))
+    (in_dir / "broken1.cjson").write_text("{")
+    (in_dir / "broken2.cjson").write_text("[")
+
+    def run(generator, *args, opts=None):
+        options_path = tmp_path / "options.json"
+        options_path.write_text(json.dumps(opts or options(generator)))
+        argv = [generator, "--options", str(options_path)]
+        argv += ["--in", str(in_dir), "--out", str(tmp_path / "out"), *args]
+        return main(argv)
+
+    return run
@@ -0,0 +1,36 @@
+"""Lookup of ORCA basis sets by name, see ``orca/basis_sets.py``."""
+
+import pytest
+
+from avogadro_generators.orca import basis_sets
+from avogadro_generators.orca.basis_sets import get_aux_basis, get_basis_enum
+
+AUX_JK = [member.value for member in get_basis_enum("AuxJKBasisSet")]
+
+
+@pytest.mark.parametrize("name", AUX_JK)
+def test_jk_names_resolve_to_the_jk_sets(name):
+    # Every /JK name also contains "/J"
+    assert "/J" in name
+    basis = get_aux_basis(name)
+
+    assert type(basis).__name__ == "AuxJKBasisSet"
+    assert basis.value == name
+
+
+@pytest.mark.parametrize("name", ["def2/JK", "cc-pVTZ/JK", "def2/JKsmall"])
+def test_pattern_fallback_checks_jk_first(monkeypatch, name):
+    # Without the index, only the patterns of the names are left
+    monkeypatch.setattr(basis_sets, "_basis_index", lambda: ({}, {}))
+    basis = get_aux_basis(name)
+
+    assert type(basis).__name__ == "AuxJKBasisSet"
+    assert basis.value == name
+
+
+def test_pattern_fallback_keeps_j_and_c(monkeypatch):
+    monkeypatch.setattr(basis_sets, "_basis_index", lambda: ({}, {}))
+
+    assert type(get_aux_basis("def2/J")).__name__ == "AuxJBasisSet"
+    assert type(get_aux_basis("def2-TZVP/C")).__name__ == "AuxCBasisSet"
+    assert get_aux_basis("def2-TZVP") is None
@@ -0,0 +1,36 @@
+"""Batch mode, see ``batch.py``."""
+
+from conftest import stretched_water
+
+from avogadro_generators.api import run_generator
+from avogadro_generators.output import join_chunks
+
+
+def test_every_file_gets_its_inputs(batch, tmp_path, options):
+    assert batch("dalton", "-j", "3") == 1
+
+    for i in range(12):
+        request = {"options": options("dalton"), "cjson": stretched_water(i)}
+        expected = join_chunks(run_generator("dalton", request))
+        for file in expected["files"]:
+            written = (tmp_path / "out" / f"mol{i:02}" / file["filename"]).read_text()
+            assert written == file["contents"]
+
+
+def test_failures_are_reported_in_order(batch, capsys):
+    assert batch("gaussian", "-j", "4") == 1
+    lines = capsys.readouterr().out.splitlines()
+
+    assert [line.split(":")[0] for line in lines[:2]] == [
+        "broken1.cjson",
+        "broken2.cjson",
+    ]
+    assert lines[2].startswith("14 jobs in ")
+    assert "2 failed" in lines[2]
+
+
+def test_jobs_default_without_a_cpu_count(batch, monkeypatch, tmp_path):
+    monkeypatch.setattr("os.cpu_count", lambda: None)
+    assert batch("gaussian") == 1
+
+    assert len(list((tmp_path / "out").iterdir())) == 12
@@ -0,0 +1,71 @@
+"""On-disk cache of batch mode, see ``cache.py``."""
+
+import json
+
+import pytest
+from conftest import stretched_water
+
+from avogadro_generators.cache import ResultCache
+
+
+def test_unchanged_jobs_are_copied(batch, tmp_path, capsys):
+    cache = str(tmp_path / "cache")
+    batch("orca", "-j", "2", "--cache", cache)
+    first = (tmp_path / "out" / "mol03" / "job.inp").read_text()
+    capsys.readouterr()
+
+    (tmp_path / "out" / "mol03" / "job.inp").unlink()
+    batch("orca", "-j", "2", "--cache", cache)
+
+    assert "12 jobs copied from the cache" in capsys.readouterr().out
+    assert (tmp_path / "out" / "mol03" / "job.inp").read_text() == first
+
+
+def test_changed_options_miss(batch, tmp_path, options, capsys):
+    cache = str(tmp_path / "cache")
+    batch("orca", "--cache", cache)
+    opts = options("orca")
+    opts["Title"] = "changed"
+    batch("orca", "--cache", cache, opts=opts)
+
+    assert "0 jobs copied from the cache" in capsys.readouterr().out.splitlines()[-1]
+    assert "# changed" in (tmp_path / "out" / "mol00" / "job.inp").read_text()
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda request: request["options"].update(Title="changed"),
+        lambda request: request["cjson"]["atoms"]["coords"]["3d"].__setitem__(0, 0.1),
+        lambda request: request["cjson"]["atoms"].update(frozen=[1, 0, 0]),
+    ],
+)
+def test_key_covers_the_request(tmp_path, options, change):
+    cache = ResultCache(str(tmp_path))
+    request = {"options": options("orca"), "cjson": stretched_water(0)}
+    key = cache.key("orca", request)
+    same = json.loads(json.dumps(request))
+
+    assert cache.key("orca", same) == key
+    assert cache.key("gaussian", same) != key
+    change(same)
+    assert cache.key("orca", same) != key
+
+
+def test_key_ignores_key_order(tmp_path, options):
+    cache = ResultCache(str(tmp_path))
+    opts = options("orca")
+    reordered = dict(reversed(list(opts.items())))
+
+    assert cache.key("orca", {"options": opts}) == cache.key(
+        "orca", {"options": reordered}
+    )
+
+
+def test_key_changes_with_the_version(tmp_path, options):
+    request = {"options": options("orca"), "cjson": stretched_water(0)}
+    cache = ResultCache(str(tmp_path))
+    key = cache.key("orca", request)
+    cache.version = "0.0.0"
+
+    assert cache.key("orca", request) != key
@@ -0,0 +1,66 @@
+"""Compatibility index of the ORCA options, see ``orca/compatibility.py``."""
+
+import random
+
+import pytest
+
+from avogadro_generators.orca import generateInput
+from avogadro_generators.orca.compatibility import compatibility_index
+
+# Options that would override or add to those of the index
+CLEARED = (
+    "Basis_pople",
+    "Basis_def2",
+    "Basis_cc",
+    "Basis_jensen",
+    "Basis_relativistic",
+    "Basis_AUXJ",
+    "Basis_AUXJK",
+    "basic_simple_keywords",
+)
+
+
+@pytest.fixture
+def orca(options):
+    opts = options("orca")
+    for key in CLEARED:
+        opts[key] = ""
+    return opts
+
+
+def combinations(count: int, seed: int = 0):
+    """Random values of the options of the index, unset half of the time
+    for the optional ones.
+    """
+    index = compatibility_index()
+    rng = random.Random(seed)
+    for _ in range(count):
+        combination = {
+            option: rng.choice(values) for option, values in index.domains.items()
+        }
+        for option in ("Solvent", "basic_disp_corr", "Basis_AUXC"):
+            if rng.random() < 0.5:
+                combination[option] = ""
+        yield combination
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_is_valid_agrees_with_the_warnings(orca, seed):
+    index = compatibility_index()
+    for combination in combinations(250, seed):
+        output = generateInput({"options": {**orca, **combination}, "cjson": {}}, False)
+        assert index.is_valid(combination) == (not output.get("warnings")), (
+            combination,
+            output.get("warnings"),
+        )
+
+
+@pytest.mark.parametrize("seed", range(2))
+def test_completions_agree_with_is_valid(seed):
+    index = compatibility_index()
+    for combination in combinations(250, seed):
+        fits = all(
+            index.canonical(option, value) in index.completions(option, combination)
+            for option, value in combination.items()
+        )
+        assert fits == index.is_valid(combination), combination
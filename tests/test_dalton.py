@@ -0,0 +1,20 @@
+"""Streamed .mol file of the Dalton generator, see ``dalton/dalton.py``."""
+
+import pytest
+
+from avogadro_generators.dalton.dalton import generateInput
+
+
+def test_mol_file_lists_the_atoms(options, water):
+    output = generateInput({"options": options("dalton"), "cjson": water}, False)
+    mol = "".join(output["files"][1]["contents"])
+
+    assert "Atomtypes=2 Angstrom\n" in mol
+    assert "Charge=8.0 Atoms=1\n" in mol
+    assert "Charge=1.0 Atoms=2\n" in mol
+
+
+def test_malformed_coordinates_fail_before_writing(options, water):
+    del water["atoms"]["coords"]["3d"][-1]
+    with pytest.raises(ValueError, match="three coordinates per atom"):
+        generateInput({"options": options("dalton"), "cjson": water}, False)
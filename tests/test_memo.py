@@ -0,0 +1,104 @@
+"""Keys of the memo of generated input text, see ``memo.py``."""
+
+import copy
+
+import pytest
+
+from avogadro_generators import memo
+from avogadro_generators.orca import clear_section_caches, generateInputFile
+
+
+@pytest.fixture
+def orca(options):
+    opts = options("orca")
+    opts["basic_constrain"] = True
+    return opts
+
+
+def unmemoized(input_json: dict) -> tuple:
+    """Result of ``generateInputFile`` with the memo disabled."""
+    saved = memo._memo
+    memo._memo = memo.LRU(0)
+    clear_section_caches()
+    try:
+        return generateInputFile(copy.deepcopy(input_json))
+    finally:
+        memo._memo = saved
+
+
+def test_new_geometry_hits_the_memo(orca, water):
+    first = generateInputFile({"options": orca, "cjson": water})
+    water["atoms"]["coords"]["3d"][3] = 1.5
+    second = generateInputFile({"options": orca, "cjson": water})
+
+    assert second == first
+    assert memo.stats()["hits"] == 1
+
+
+def test_option_change_misses_the_memo(orca, water):
+    generateInputFile({"options": orca, "cjson": water})
+    orca["Title"] = "another title"
+    text = generateInputFile({"options": orca, "cjson": water})[0]
+
+    assert "# another title" in text
+    assert memo.stats()["hits"] == 0
+
+
+def test_new_element_misses_the_memo(orca, water):
+    generateInputFile({"options": orca, "cjson": water})
+    water["atoms"]["elements"]["number"][0] = 16
+    generateInputFile({"options": orca, "cjson": water})
+
+    assert memo.stats()["hits"] == 0
+
+
+# Molecules whose ORCA input differs, though they contain the same elements
+MOLECULES = [
+    # The frozen list is read per atom or per coordinate, depending on the
+    # number of atoms
+    {
+        "atoms": {"elements": {"number": [8, 1]}, "frozen": [1, 0, 0, 1, 0, 0]},
+        "constraints": [],
+    },
+    {
+        "atoms": {"elements": {"number": [8] + [1] * 5}, "frozen": [1, 0, 0, 1, 0, 0]},
+        "constraints": [],
+    },
+    # A top-level "frozen" key alone writes a %geom block
+    {"atoms": {"elements": {"number": [8, 1]}}, "frozen": []},
+    {"atoms": {"elements": {"number": [8, 1]}}},
+    {"atoms": {"elements": {"number": [8, 1]}}, "constraints": [[1.0, 0, 1]]},
+]
+
+
+@pytest.mark.parametrize("cjson", MOLECULES)
+def test_memoized_input_matches_a_fresh_run(orca, cjson):
+    # Fill the memo with every molecule first, so a key that is missing a
+    # part of the molecule returns the input of another one
+    for molecule in MOLECULES:
+        generateInputFile({"options": orca, "cjson": copy.deepcopy(molecule)})
+
+    input_json = {"options": orca, "cjson": cjson}
+    assert generateInputFile(copy.deepcopy(input_json)) == unmemoized(input_json)
+
+
+def test_full_molecule_generators_are_not_memoized(options, water):
+    from avogadro_generators.dalton.dalton import generateInputFile as dalton
+
+    input_json = {"options": options("dalton"), "cjson": water}
+    first = "".join(dalton(input_json)[0])
+    water["atoms"]["coords"]["3d"][3] = 1.5
+    second = "".join(dalton(input_json)[0])
+
+    assert first != second
+    assert memo.stats()["hits"] == 0
+
+
+def test_results_are_copied(orca, water):
+    warnings = generateInputFile({"options": orca, "cjson": water})[1]
+    warnings.append("changed by the caller")
+
+    assert (
+        "changed by the caller"
+        not in generateInputFile({"options": orca, "cjson": water})[1]
+    )
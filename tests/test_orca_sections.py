@@ -0,0 +1,82 @@
+"""Caches of the sections of the ORCA input, see ``orca/__init__.py``."""
+
+import copy
+
+import pytest
+
+from avogadro_generators import memo
+from avogadro_generators.orca import (
+    _basis_set,
+    _block_section,
+    _simple_keywords,
+    clear_section_caches,
+    generateInputFile,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_sections():
+    clear_section_caches()
+    yield
+    clear_section_caches()
+
+
+def fresh(input_json: dict) -> tuple:
+    """Result of ``generateInputFile`` built without any cache."""
+    saved = memo._memo
+    memo._memo = memo.LRU(0)
+    clear_section_caches()
+    try:
+        return generateInputFile(copy.deepcopy(input_json))
+    finally:
+        memo._memo = saved
+
+
+def hits() -> dict[str, int]:
+    return {
+        section.__name__: section.cache_info().hits
+        for section in (_basis_set, _simple_keywords, _block_section)
+    }
+
+
+@pytest.mark.parametrize(
+    "option, value, rebuilt",
+    [
+        # Sections that read neither are all reused
+        ("Title", "another title", ()),
+        ("Processor Cores", 4, ()),
+        # The keyword line reads the theory, the basis set does not
+        ("Theory", "PBE0", ("_simple_keywords",)),
+        # One block is built again, the other two are reused
+        ("SCF_CONVERGENCE", "Tight", ("_block_section",)),
+        ("ElProp_DIPOLE", False, ("_block_section",)),
+    ],
+)
+def test_unrelated_sections_are_reused(options, water, option, value, rebuilt):
+    opts = options("orca")
+    generateInputFile({"options": opts, "cjson": water})
+    before = hits()
+
+    opts[option] = value
+    result = generateInputFile({"options": opts, "cjson": water})
+    after = hits()
+
+    assert after["_basis_set"] == before["_basis_set"] + 1
+    assert after["_simple_keywords"] == before["_simple_keywords"] + (
+        "_simple_keywords" not in rebuilt
+    )
+    assert after["_block_section"] == before["_block_section"] + 3 - (
+        "_block_section" in rebuilt
+    )
+    assert result == fresh({"options": opts, "cjson": water})
+
+
+def test_cached_warnings_are_repeated(options, water):
+    opts = options("orca")
+    opts["Basis"] = "6-31G"
+    water["atoms"]["elements"]["number"][0] = 79
+    first = generateInputFile({"options": opts, "cjson": water})
+    opts["Title"] = "another title"
+    second = generateInputFile({"options": opts, "cjson": water})
+
+    assert first[1] and second[1] == first[1]
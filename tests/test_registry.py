@@ -0,0 +1,85 @@
+"""Entry point index of the generators, see ``registry.py``."""
+
+import importlib.metadata
+
+import pytest
+
+from avogadro_generators import registry
+
+BUILTINS = [
+    "dalton",
+    "gamessuk",
+    "gaussian",
+    "molpro",
+    "mopac",
+    "nwchem",
+    "orca",
+    "psi4",
+    "pyscf",
+    "qchem",
+    "terachem",
+]
+
+
+class FakeDistribution:
+    def __init__(self, name: str):
+        self.name = name
+
+
+def fake_entry_points(*points: tuple[str, str, str]):
+    def entry_points(group: str):
+        assert group == registry.ENTRY_POINT_GROUP
+        return [
+            importlib.metadata.EntryPoint(name, value, group)._for(
+                FakeDistribution(dist)
+            )
+            for name, value, dist in points
+        ]
+
+    return entry_points
+
+
+@pytest.fixture
+def index(monkeypatch, tmp_path):
+    """Use a fresh index file, and rebuild the registry from it."""
+    monkeypatch.setenv("AVOGADRO_GENERATORS_INDEX", str(tmp_path / "index.json"))
+    registry.available_generators.cache_clear()
+    yield tmp_path / "index.json"
+    registry.available_generators.cache_clear()
+
+
+def test_builtins_are_entry_points(index):
+    generators = registry.available_generators()
+
+    assert sorted(generators) == BUILTINS
+    assert registry.find_generator("orca") == "avogadro_generators.orca:generateInput"
+    assert index.exists()
+
+
+def test_unknown_generator(index):
+    with pytest.raises(ValueError, match="Unknown generator"):
+        registry.find_generator("no such generator")
+
+
+def test_builtin_shadows_plugin_with_a_warning(index, monkeypatch):
+    monkeypatch.setattr(
+        importlib.metadata,
+        "entry_points",
+        fake_entry_points(
+            ("orca", "other.orca:generateInput", "other-generators"),
+            ("orca", "avogadro_generators.orca:generateInput", "avogadro_generators"),
+            ("mycode", "other.mycode:generateInput", "other-generators"),
+        ),
+    )
+    with pytest.warns(UserWarning, match="'orca' of other-generators is shadowed"):
+        generators = registry.available_generators()
+
+    assert generators == {
+        "mycode": ("other.mycode:generateInput", "other-generators"),
+        "orca": ("avogadro_generators.orca:generateInput", "avogadro_generators"),
+    }
+
+    # The warning is repeated when the registry is read from the index
+    registry.available_generators.cache_clear()
+    with pytest.warns(UserWarning, match="shadowed"):
+        assert registry.available_generators() == generators
@@ -0,0 +1,95 @@
+"""Round trips through the --serve mode, see ``serve.py``."""
+
+import io
+import json
+
+from avogadro_generators.serve import serve, serve_binary
+
+
+def run_serve(*requests: str, generator: str | None = None) -> list[dict]:
+    output = io.StringIO()
+    serve(io.StringIO("".join(f"{r}\n" for r in requests)), output, generator)
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def test_responses_follow_the_requests(options, water):
+    requests = [
+        {"id": i, "generator": name, "options": options(name), "cjson": water}
+        for i, name in enumerate(["orca", "gaussian", "orca"])
+    ]
+    responses = run_serve(*map(json.dumps, requests))
+
+    assert [r["id"] for r in responses] == [0, 1, 2]
+    assert responses[0]["mainFile"] == "job.inp"
+    assert responses[1]["mainFile"] == "job.gjf"
+    assert responses[2]["files"] == responses[0]["files"]
+
+
+def test_default_generator(options, water):
+    request = {"options": options("gaussian"), "cjson": water}
+    (response,) = run_serve(json.dumps(request), generator="gaussian")
+
+    assert "error" not in response
+
+
+def test_bad_requests_get_an_error_and_serving_goes_on(options, water):
+    good = json.dumps({"generator": "orca", "options": options("orca"), "cjson": water})
+    responses = run_serve(
+        "not json",
+        "5",
+        '["orca"]',
+        '{"id": "x"}',
+        '{"id": "y", "generator": "no such generator"}',
+        good,
+    )
+
+    assert [set(r) for r in responses[:3]] == [{"error"}] * 3
+    assert responses[3]["id"] == "x"
+    assert "No generator given" in responses[3]["error"]
+    assert responses[4]["id"] == "y" and "error" in responses[4]
+    assert "error" not in responses[5]
+
+
+def test_binary_round_trip(options, water):
+    from avogadro_generators.protocol import encode_request, read_response
+
+    request = {"id": 7, "generator": "orca", "options": options("orca"), "cjson": water}
+    instream = io.BytesIO(
+        encode_request(request) + encode_request({**request, "id": 8})
+    )
+    outstream = io.BytesIO()
+    serve_binary(instream, outstream)
+    outstream.seek(0)
+
+    responses = [read_response(outstream), read_response(outstream)]
+    assert read_response(outstream) is None
+    assert [r["id"] for r in responses] == [7, 8]
+    (text,) = run_serve(json.dumps(request))
+    assert responses[0]["files"] == text["files"]
+
+
+def test_bad_binary_frames_get_an_error_and_serving_goes_on(options, water):
+    import struct
+
+    from avogadro_generators.protocol import encode_request, read_response
+
+    def frame(header: bytes) -> bytes:
+        return struct.pack("<I", len(header)) + header
+
+    request = {"id": 9, "generator": "orca", "options": options("orca"), "cjson": water}
+    instream = io.BytesIO(
+        frame(b"not json")
+        + frame(b"[1, 2]")
+        + frame(b'{"natoms": -1}')
+        + frame(b'{"cjson": [], "natoms": 0}')
+        + encode_request(request)
+    )
+    outstream = io.BytesIO()
+    serve_binary(instream, outstream)
+    outstream.seek(0)
+
+    responses = [read_response(outstream) for _ in range(5)]
+    assert read_response(outstream) is None
+    assert [set(r) for r in responses[:4]] == [{"error"}] * 4
+    assert all(r["error"].startswith("Invalid request") for r in responses[:4])
+    assert responses[4]["id"] == 9 and "error" not in responses[4]
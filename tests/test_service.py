@@ -0,0 +1,127 @@
+"""Round trips through the local generation service, see ``service.py``."""
+
+import json
+import socket
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from avogadro_generators.api import run_generator
+from avogadro_generators.output import join_chunks
+from avogadro_generators.service import (
+    GenerationService,
+    _make_server,
+    _remove_stale_socket,
+    request_from_service,
+)
+
+
+@pytest.fixture(scope="module")
+def service(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("service") / "service.sock")
+    service = GenerationService(jobs=2)
+    server = _make_server(path, service)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path, service
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def send_lines(path: str, *lines: bytes) -> list[dict]:
+    """Send raw request lines on one connection and read the responses."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        with sock.makefile("rwb") as f:
+            f.write(b"".join(line + b"\n" for line in lines))
+            f.flush()
+            return [json.loads(f.readline()) for _ in lines]
+
+
+def test_response_matches_a_local_run(service, options, water):
+    path, _ = service
+    request = {"id": 3, "generator": "orca", "options": options("orca"), "cjson": water}
+    response = request_from_service(path, request)
+    local = join_chunks(
+        run_generator("orca", {"options": options("orca"), "cjson": water})
+    )
+
+    assert response.pop("id") == 3
+    assert response == local
+
+
+def test_responses_follow_the_requests(service, options, water):
+    path, _ = service
+    names = ["orca", "gaussian", "mopac", "orca"]
+    lines = [
+        json.dumps(
+            {"id": i, "generator": name, "options": options(name), "cjson": water}
+        ).encode()
+        for i, name in enumerate(names)
+    ]
+    responses = send_lines(path, *lines)
+
+    assert [r["id"] for r in responses] == [0, 1, 2, 3]
+    assert all("error" not in r for r in responses)
+
+
+def test_bad_requests_get_an_error_on_the_same_connection(service, options, water):
+    path, _ = service
+    good = json.dumps({"generator": "orca", "options": options("orca"), "cjson": water})
+    responses = send_lines(path, b"5", b"[1, 2]", b"not json", good.encode())
+
+    assert [set(r) for r in responses[:3]] == [{"error"}] * 3
+    assert "error" not in responses[3]
+
+
+@pytest.mark.parametrize("request_", [5, [1, 2], "orca", None])
+def test_generate_rejects_non_objects(service, request_):
+    _, generation_service = service
+    assert "error" in generation_service.generate(request_)
+
+
+def test_control_requests(service):
+    path, _ = service
+    (stats,) = send_lines(path, b'{"control": "stats", "id": 1}')
+
+    assert stats["id"] == 1
+    assert "coalescing" in stats["caches"]
+
+
+def test_stale_socket_is_removed(tmp_path):
+    path = str(tmp_path / "stale.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(path)
+    _remove_stale_socket(path)
+
+    assert not (tmp_path / "stale.sock").exists()
+
+
+def test_other_files_are_left_alone(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("keep me")
+
+    with pytest.raises(RuntimeError, match="not a socket"):
+        _remove_stale_socket(str(path))
+    assert path.read_text() == "keep me"
+
+
+def test_client_imports_without_unix_sockets(tmp_path):
+    # As on Windows, which has neither Unix sockets nor the resource module
+    code = """
+import socket, socketserver, sys
+del socket.AF_UNIX, socketserver.ThreadingUnixStreamServer
+sys.modules["resource"] = None
+from avogadro_generators.service import request_from_service
+print(request_from_service(sys.argv[1], {}))
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code, str(tmp_path / "service.sock")],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.stdout == "None\n", result.stderr
@@ -0,0 +1,110 @@
+"""Index of the ORCA simple keywords, see ``orca/simple_keywords.py``."""
+
+import pytest
+
+from avogadro_generators.orca import generateInput
+from avogadro_generators.orca.simple_keywords import (
+    match_simple_keyword,
+    suggest_keywords,
+)
+
+
+@pytest.mark.parametrize(
+    "text, keyword",
+    [
+        ("TightSCF", "TightSCF"),
+        ("def2-TZVP", "def2-TZVP"),
+        ("D3BJ", "D3BJ"),
+        ("d4", "D4"),
+        ("cpcm(h2o)", "CPCM(water)"),
+        # Solvents named with a space are written with another alias
+        ("CPCM(ccl4)", "CPCM(ccl4)"),
+    ],
+)
+def test_match(text, keyword):
+    assert str(match_simple_keyword(text, case_sensitive=False)) == keyword
+
+
+def test_names_with_whitespace_are_not_keywords():
+    assert match_simple_keyword("DSD-BLYP D3BJ") is None
+    assert all(" " not in name for name in suggest_keywords("D3B", limit=10))
+
+
+def test_extra_keywords(options):
+    opts = options("orca")
+    opts["basic_simple_keywords"] = "D3BJ TightSCF cpcm(h2o) D3B"
+    output = generateInput({"options": opts, "cjson": {}}, False)
+    line = output["files"][0]["contents"].splitlines()[3]
+
+    assert line.split()[-3:] == ["D3BJ", "TightSCF", "CPCM(water)"]
+    assert output["warnings"] == [
+        "Keyword D3B is not recognized! Did you mean D3BJ or D3?"
+    ]
+
+
+def libxc_input(options, theory: str, disp: str = "") -> tuple[str, list[str]]:
+    """Keyword line and %method block of a LibXC theory, with the warnings."""
+    opts = options("orca")
+    opts["Theory"] = theory
+    opts["basic_disp_corr"] = disp
+    output = generateInput({"options": opts, "cjson": {}}, False)
+    lines = output["files"][0]["contents"].splitlines(keepends=True)
+    end = lines.index("end\n") + 1 if "%method\n" in lines else 4
+    return "".join(lines[3:end]), output.get("warnings", [])
+
+
+def test_libxc_simple_keyword(options):
+    text, warnings = libxc_input(options, "libxc(pwlda)")
+
+    assert text == "!Opt LibXC(PWLDA) def2-TZVP PrintMOs PrintBasis \n"
+    assert warnings == []
+
+
+def test_libxc_exchange_correlation_functional(options):
+    text, warnings = libxc_input(options, "HYB_GGA_XC_B3LYP")
+
+    assert text == (
+        "!Opt def2-TZVP PrintMOs PrintBasis \n"
+        "%method\n"
+        "    Method     DFT\n"
+        "    Functional hyb_gga_xc_b3lyp\n"
+        "end\n"
+    )
+    assert warnings == []
+
+
+@pytest.mark.parametrize(
+    "theory", ["gga_x_pbe gga_c_pbe", "gga_c_pbe, gga_x_pbe", "gga_x_pbe+gga_c_pbe"]
+)
+def test_libxc_exchange_and_correlation(options, theory):
+    text, warnings = libxc_input(options, theory)
+
+    assert text == (
+        "!Opt def2-TZVP PrintMOs PrintBasis \n"
+        "%method\n"
+        "    Method      DFT\n"
+        "    Exchange    gga_x_pbe\n"
+        "    Correlation gga_c_pbe\n"
+        "end\n"
+    )
+    assert warnings == []
+
+
+@pytest.mark.parametrize("theory", ["gga_x_pbe", "gga_x_pbe gga_x_b88"])
+def test_libxc_without_correlation(options, theory):
+    text, warnings = libxc_input(options, theory)
+
+    assert text == "!Opt def2-TZVP PrintMOs PrintBasis \n"
+    assert warnings == [
+        f"The LibXC functional {theory} needs an exchange and a correlation part!"
+    ]
+
+
+def test_libxc_with_dispersion(options):
+    text, warnings = libxc_input(options, "hyb_gga_xc_b3lyp", "D3BJ")
+
+    assert "D3BJ" not in text
+    assert "Functional hyb_gga_xc_b3lyp" in text
+    assert warnings == [
+        "The dispersion correction D3BJ is not available for hyb_gga_xc_b3lyp!"
+    ]
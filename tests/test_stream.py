@@ -0,0 +1,55 @@
+"""Order and errors of the stream subcommand, see ``stream.py``."""
+
+import io
+import json
+
+import pytest
+
+from avogadro_generators import stream as stream_module
+from avogadro_generators.serve import handle_line
+from avogadro_generators.stream import stream
+
+
+def run_stream(lines: list[str], **kwargs) -> list[dict]:
+    output = io.StringIO()
+    stream(io.StringIO("".join(f"{line}\n" for line in lines)), output, **kwargs)
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def _failing_handle_line(line, generator, debug, timings):
+    if "fail" in line:
+        raise RuntimeError("worker failed")
+    return handle_line(line, generator, debug, timings)
+
+
+@pytest.mark.parametrize("jobs, window", [(1, 1), (2, 1), (3, 2), (4, None)])
+def test_responses_follow_the_requests(options, water, jobs, window):
+    names = ["orca", "gaussian", "mopac", "psi4", "nwchem"] * 3
+    lines = [
+        json.dumps(
+            {"id": i, "generator": name, "options": options(name), "cjson": water}
+        )
+        for i, name in enumerate(names)
+    ]
+    responses = run_stream(lines, jobs=jobs, window=window)
+
+    assert [r["id"] for r in responses] == list(range(len(names)))
+    assert all("error" not in r for r in responses)
+
+
+def test_bad_records_get_an_error_in_place(options, water):
+    good = json.dumps({"generator": "orca", "options": options("orca"), "cjson": water})
+    responses = run_stream(["5", good, "not json", "[]", good], jobs=2)
+
+    assert len(responses) == 5
+    assert [("error" in r) for r in responses] == [True, False, True, True, False]
+
+
+def test_failed_jobs_get_an_error_in_place(monkeypatch, options, water):
+    # Workers are forked after the patch, so they run it too
+    monkeypatch.setattr(stream_module, "_handle_line", _failing_handle_line)
+    good = json.dumps({"generator": "orca", "options": options("orca"), "cjson": water})
+    responses = run_stream([good, '{"id": "fail"}', good], jobs=2)
+
+    assert responses[1] == {"error": "RuntimeError: worker failed"}
+    assert "error" not in responses[0] and "error" not in responses[2]